@@ -0,0 +1,120 @@
+"""
+Benchmark Runner
+
+Run all benchmarks and write the results as JSON:
+    python -m benchmarks run --output bench.json
+
+Compare two result files. Exits with 1 if any case got slower than the
+threshold (0.2 = 20%):
+    python -m benchmarks compare baseline.json bench.json --threshold 0.2
+"""
+import argparse
+import json
+import platform
+import sys
+import timeit
+
+from .suite import CASES
+
+
+def run(cases, repeat=5, min_time=0.2):
+    """
+    Time all cases. Returns the best time per call in nanoseconds of each
+    case, keyed by name.
+    """
+    results = {}
+    for (name, func) in cases:
+        timer = timeit.Timer(func)
+        (number, _) = timer.autorange()
+        number = max(1, int(number * min_time / 0.2))
+        best = min(timer.repeat(repeat=repeat, number=number)) / number
+        results[name] = {'ns_per_call': best * 1e9, 'number': number,
+                         'repeat': repeat}
+        print('%-45s %14.1f ns' % (name, best * 1e9))
+    return results
+
+
+def compare(baseline, current, threshold):
+    """
+    Compare two result dicts. Returns the names of all cases that got slower
+    than the threshold.
+    """
+    regressions = []
+    print('%-45s %12s %12s %8s' % ('case', 'baseline', 'current', 'change'))
+
+    for (name, result) in current.items():
+        if name not in baseline:
+            print('%-45s %12s %12.1f %8s' % (name, '-',
+                                             result['ns_per_call'], 'new'))
+            continue
+
+        before = baseline[name]['ns_per_call']
+        after = result['ns_per_call']
+        change = after / before - 1
+        flag = ''
+        if change > threshold:
+            regressions.append(name)
+            flag = '  REGRESSION'
+        print('%-45s %12.1f %12.1f %+7.1f%%%s' % (name, before, after,
+                                                  change * 100, flag))
+
+    for name in baseline:
+        if name not in current:
+            print('%-45s %12.1f %12s %8s' % (
+                name, baseline[name]['ns_per_call'], '-', 'removed'))
+
+    return regressions
+
+
+def _load(path):
+    """Load the results of a JSON file"""
+    with open(path) as results_file:
+        return json.load(results_file)['results']
+
+
+def main(argv=None):
+    """Command line entry point"""
+    parser = argparse.ArgumentParser(prog='python -m benchmarks')
+    commands = parser.add_subparsers(dest='command')
+    commands.required = True
+
+    run_parser = commands.add_parser('run', help='run all benchmarks')
+    run_parser.add_argument('--output', help='write results to a JSON file')
+    run_parser.add_argument('--repeat', type=int, default=5)
+    run_parser.add_argument('--min-time', type=float, default=0.2,
+                            help='approximate seconds per measurement')
+    run_parser.add_argument('--filter', default='',
+                            help='only run cases containing this string')
+
+    compare_parser = commands.add_parser(
+        'compare', help='compare two result files')
+    compare_parser.add_argument('baseline')
+    compare_parser.add_argument('current')
+    compare_parser.add_argument('--threshold', type=float, default=0.2,
+                                help='allowed slowdown (0.2 = 20%%)')
+
+    args = parser.parse_args(argv)
+
+    if args.command == 'run':
+        cases = [(name, func) for (name, func) in CASES
+                 if args.filter in name]
+        results = run(cases, repeat=args.repeat, min_time=args.min_time)
+        if args.output:
+            with open(args.output, 'w') as output:
+                json.dump({'python': platform.python_version(),
+                           'machine': platform.machine(),
+                           'results': results}, output, indent=2,
+                          sort_keys=True)
+        return 0
+
+    regressions = compare(_load(args.baseline), _load(args.current),
+                          args.threshold)
+    if regressions:
+        print('\n%d case(s) regressed by more than %d%%: %s' % (
+            len(regressions), args.threshold * 100, ', '.join(regressions)))
+        return 1
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
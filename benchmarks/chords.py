@@ -0,0 +1,60 @@
+"""
+Chord Identification Benchmark
+
+Identifies random note sets through the pitch class index.
+Run with `python -m benchmarks.chords [--count N]`.
+"""
+import argparse
+import random
+import time
+
+from src.music import CHORDS
+from src.chord import Chord, identify
+
+
+def random_note_sets(count, seed=0):
+    """
+    Returns random note sets. Half of them are chords (in random inversions),
+    the other half random notes which mostly aren't.
+    """
+    rng = random.Random(seed)
+    roots = ['C', 'C#', 'Db', 'D', 'Eb', 'E', 'F', 'F#', 'Gb', 'G', 'Ab',
+             'A', 'Bb', 'B']
+    qualities = list(CHORDS.keys())
+
+    chords = [Chord.of(root, quality, inversion).pitches
+              for root in roots
+              for quality in qualities
+              for inversion in range(len(CHORDS[quality]))]
+    notes = [note for chord in chords for note in chord]
+
+    note_sets = []
+    for index in range(count):
+        if index % 2:
+            note_sets.append(rng.choice(chords))
+        else:
+            note_sets.append(rng.sample(notes, rng.randint(3, 5)))
+    return note_sets
+
+
+def main():
+    """Time identifying random note sets"""
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument('--count', type=int, default=1000000)
+    args = parser.parse_args()
+
+    note_sets = random_note_sets(args.count)
+
+    start = time.perf_counter()
+    found = 0
+    for notes in note_sets:
+        if identify(notes):
+            found += 1
+    elapsed = time.perf_counter() - start
+
+    print('identified %d of %d note sets in %.2fs (%.2f us per set)' % (
+        found, args.count, elapsed, elapsed / args.count * 1e6))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,91 @@
+"""
+Lookup Benchmark
+
+Compares the precomputed reverse indexes in `src.music` with the linear scans
+they replaced. Run with `python -m benchmarks.lookups`.
+"""
+import timeit
+
+from src.music import NOTES, NOTE_KEYS, INTERVALS, NOTES_BY_SEMITONES, \
+    NOTE_POSITIONS, INTERVALS_BY_QUANTITY_AND_SEMITONES
+from src.note import Note
+from src.interval import Interval
+
+NUMBER = 100000
+
+
+def scan_interval(quantity, semitones):
+    """Linear scan over all intervals (previous implementation)"""
+    for item, _ in INTERVALS.items():
+        if item[-1] == str(quantity) and INTERVALS[item][1] == semitones:
+            return item
+    return None
+
+
+def scan_semitones(semitones):
+    """Linear scan over all natural notes (previous implementation)"""
+    for item, _ in NOTES.items():
+        if NOTES[item][1] == semitones:
+            return item
+    return None
+
+
+def scan_interval_name(name):
+    """Membership test on a fresh key list (previous implementation)"""
+    return name in list(INTERVALS.keys())
+
+
+CASES = [
+    (
+        '(quantity, semitones) -> interval',
+        lambda: scan_interval(8, 12),
+        lambda: INTERVALS_BY_QUANTITY_AND_SEMITONES.get((8, 12))
+    ),
+    (
+        'name -> interval',
+        lambda: scan_interval_name('P8'),
+        lambda: 'P8' in INTERVALS
+    ),
+    (
+        'semitone -> natural note',
+        lambda: scan_semitones(11),
+        lambda: NOTES_BY_SEMITONES.get(11)
+    ),
+    (
+        'letter -> index',
+        lambda: NOTE_KEYS.index('B'),
+        lambda: NOTE_POSITIONS['B']
+    ),
+]
+
+
+def time_it(func, number=NUMBER):
+    """Returns the time per call in nanoseconds"""
+    return timeit.timeit(func, number=number) / number * 1e9
+
+
+def main():
+    """Print a comparison of scans and indexes"""
+    print('%-36s %12s %12s %8s' % ('lookup', 'scan (ns)', 'index (ns)', 'x'))
+    for name, scan, index in CASES:
+        before = time_it(scan)
+        after = time_it(index)
+        print('%-36s %12.1f %12.1f %8.1f' % (name, before, after,
+                                              before / after))
+
+    root = Note.of('Bb')
+    target = Note.of('Gb', 5)
+    interval = Interval.from_string('A6')
+
+    print()
+    print('%-36s %12.1f' % ('Interval.from_quantity_and_semitones',
+                            time_it(lambda: Interval.
+                                    from_quantity_and_semitones(8, 12))))
+    print('%-36s %12.1f' % ('Note.minus_note',
+                            time_it(lambda: root.minus_note(target))))
+    print('%-36s %12.1f' % ('Note + Interval',
+                            time_it(lambda: root + interval)))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,109 @@
+"""
+Benchmark Suite
+
+Every case is a name and a function without arguments that runs the hot path
+once. Keep names stable, they're used to compare results between runs.
+"""
+import numpy as np
+
+from src.accidentals import Accidentals
+from src.batch import encode_notes, encode_intervals, add_intervals, \
+    minus_notes
+from src.chord import Chord, identify
+from src.exercises import ExerciseGenerator
+from src.keyfinding import score, SPELLINGS
+from src.interval import Interval
+from src.keysignature import KeySignature, KEYS
+from src.note import Note
+from src.pcset import PitchClassSet, forte_indexes
+from src.render import Renderer
+from src.scale import Scale
+from src.sequence import NoteSequence
+from src.spelling import spell_numbers
+from src.tuning import frequencies, JUST
+
+
+def _cases():
+    """Build all benchmark cases"""
+    cases = []
+
+    for accidentals in ('', '#', '##', '#x', 'b', 'bb', 'bbb'):
+        name = 'F' + accidentals
+        cases.append(('Note(%s)' % name, lambda name=name: Note(name)))
+        cases.append(('Note.of(%s)' % name, lambda name=name: Note.of(name)))
+        cases.append(('Accidentals(%s)' % accidentals,
+                      lambda acc=accidentals: Accidentals(acc)))
+
+    cases.append(('Note.easy_notation',
+                  lambda: Note('Cbb').easy_notation))
+
+    note = Note.of('Eb')
+    target = Note.of('C#', 5)
+    major_third = Interval.from_string('M3')
+    augmented_sixth = Interval.from_string('A6')
+
+    cases.append(('Note + Interval', lambda: note + major_third))
+    cases.append(('Note - Interval', lambda: note - augmented_sixth))
+    cases.append(('Note.minus_note', lambda: note.minus_note(target)))
+    cases.append(('Interval.from_quantity_and_semitones',
+                  lambda: Interval.from_quantity_and_semitones(6, 10)))
+    cases.append(('Interval.invert', augmented_sixth.invert))
+    cases.append(('Interval + Interval',
+                  lambda: major_third + augmented_sixth))
+
+    cases.append(('KeySignature (all 30 keys)',
+                  lambda: [KeySignature(key) for key in KEYS]))
+    cases.append(('KeySignature.of (all 30 keys)',
+                  lambda: [KeySignature.of(key) for key in KEYS]))
+
+    cases.append(('Scale.of', lambda: Scale.of('D', 'dorian')))
+    cases.append(('identify', lambda: identify(['A3', 'C', 'E', 'G'])))
+
+    generator = ExerciseGenerator(seed=0)
+    cases.append(('ExerciseGenerator.intervals (10000 questions)',
+                  lambda: generator.intervals(10000)))
+
+    notes = [Note.of(name, octave)
+             for name in ('C', 'Eb', 'F#', 'Abb', 'B')
+             for octave in range(1, 7)] * 34
+    encoded = encode_notes(notes[:1000])
+    encoded_interval = encode_intervals([major_third])[0]
+    sequence = NoteSequence(notes[:1000])
+
+    cases.append(('batch.add_intervals (1000 notes)',
+                  lambda: add_intervals(encoded, encoded_interval)))
+    cases.append(('batch.minus_notes (1000 notes)',
+                  lambda: minus_notes(encoded, encoded[::-1], strict=False)))
+    cases.append(('NoteSequence.transpose (1000 notes)',
+                  lambda: sequence.transpose(major_third)))
+
+    random = np.random.RandomState(0)
+    pitch_classes = random.randint(0, 8, (100000, 12)).astype(float)
+    spellings = random.randint(0, 3, (100000, SPELLINGS)).astype(float)
+    cases.append(('keyfinding.score (100000 melodies)',
+                  lambda: score(pitch_classes, spellings)))
+
+    masks = random.randint(0, 4096, 100000)
+    cases.append(('pcset.forte_indexes (100000 sets)',
+                  lambda: forte_indexes(masks)))
+    cases.append(('PitchClassSet.forte_number',
+                  lambda: PitchClassSet.of([0, 1, 4, 6]).forte_number))
+
+    numbers = random.randint(48, 84, 10000).tolist()
+    cases.append(('spell_numbers (10000 notes)',
+                  lambda: list(spell_numbers(numbers, 'D'))))
+
+    cases.append(('tuning.frequencies (1000 notes)',
+                  lambda: frequencies(sequence, JUST, 'Eb')))
+
+    chord = Chord.of('C', 'major 7th')
+    cases.append(('Renderer.render_chord (uncached, 1 second)',
+                  lambda: Renderer(max_bytes=0).render_chord(chord)))
+    renderer = Renderer()
+    cases.append(('Renderer.render_interval (cached)',
+                  lambda: renderer.render_interval(note, major_third)))
+
+    return cases
+
+
+CASES = _cases()
@@ -13,5 +13,9 @@ setup(
     author='David Floegel, Jason Cook, Clemens Westrup',
     author_email='mail@davidfloegel.com',
     url='https://github.com/davidfloegel/python-music-theory',
-    packages=find_packages(exclude=('tests', 'docs'))
+    packages=find_packages(exclude=('tests', 'docs', 'benchmarks')),
+    install_requires=['numpy'],
+    entry_points={
+        'console_scripts': ['music-theory = src.cli:main']
+    }
 )
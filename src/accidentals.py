@@ -1,26 +1,26 @@
 """Accidentals Module"""
 
-import re
 from itertools import chain
-from .music import SHARP, DOUBLE_SHARP
+from .music import SHARP, DOUBLE_SHARP, FLAT
+from .parser import parse_accidentals
 
 
 class Accidentals:
     """Accidentals Class"""
 
-    def __init__(self, accidentals=''):
-        match = re.search('^([x,#]*|b*)$', accidentals)
-
-        if match:
-            split = list(accidentals)
-            self.sanitised = self._sanitise(split)
+    def __init__(self, accidentals='', value=None):
+        """
+        The value can be passed in if the accidentals have already been
+        parsed, otherwise they're parsed here.
+        """
+        self.accidentals = accidentals
+        self.value = parse_accidentals(accidentals) if value is None \
+            else value
 
-            self.accidentals = accidentals
-            self.value = self._calc_value()
-        else:
-            msg = ("Accidentals invalid. Allowed characters are [#, x, b]. "
-                   "Got %s") % accidentals
-            raise ValueError(msg)
+    @property
+    def sanitised(self):
+        """List of accidentals with double sharps turned into two sharps"""
+        return self._sanitise(list(self.accidentals))
 
     @classmethod
     def _sanitise(cls, accidentals_list):
@@ -36,11 +36,7 @@ class Accidentals:
 
         return accidentals_list
 
-    def _calc_value(self):
-        """Calculate a + or - value for a given list of accidentals"""
-        length = len(self.sanitised)
-        if length == 0:
-            return 0
 
-        ind = 1 if self.sanitised[0] == SHARP else -1
-        return ind * length
+def accidentals_from_value(value):
+    """Returns the accidentals for a + or - value. For example: 2:##, -1:b"""
+    return SHARP * value if value > 0 else FLAT * -value
@@ -15,6 +15,8 @@ class AccidentalsTest(unittest.TestCase):
         assert_raises(ValueError, Accidentals, 'i')
         assert_raises(ValueError, Accidentals, '##b')
         assert_raises(ValueError, Accidentals, 'xxb')
+        assert_raises(ValueError, Accidentals, ',')
+        assert_raises(ValueError, Accidentals, '#,x')
 
     @classmethod
     def test_initialise_new_accidentals(cls):
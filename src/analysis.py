@@ -0,0 +1,98 @@
+"""
+Analysis Module
+
+Streaming analysis of melodies. All functions work on iterables and only
+keep the previous note in memory, so they can run over files of any length.
+"""
+from collections import Counter
+
+from .music import NOTE_POSITIONS
+from .interval import Interval, SIMPLE_INTERVALS, calc_quality
+from .note import Note, parse_notes
+
+ASCENDING = +1
+DESCENDING = -1
+UNISON = 0
+
+"""
+Integer codes of all simple intervals.
+IntervalName: Code and Code: IntervalName
+"""
+INTERVAL_NAMES = list(SIMPLE_INTERVALS)
+INTERVAL_CODES = {name: code for (code, name) in enumerate(INTERVAL_NAMES)}
+
+
+def read_notes(lines):
+    """
+    Yields notes from an iterable of lines, for example an open file. Every
+    line can hold any number of whitespace or comma separated note names.
+    """
+    for line in lines:
+        for note in parse_notes(line):
+            yield note
+
+
+def intervals_between(notes, codes=False):
+    """
+    Yields (interval, octaves, direction) for each pair of consecutive notes
+    (or note names). The interval is a shared, simple Interval; octaves is
+    the number of octaves on top of it for compound intervals (C4 to E5 is
+    a M3 plus one octave) and direction is ASCENDING, DESCENDING or UNISON.
+    If codes is true, interval codes from INTERVAL_CODES are yielded instead
+    of Interval objects. Raises a LookupError for pairs that don't form a
+    valid interval.
+    """
+    previous = None
+    for note in notes:
+        if not isinstance(note, Note):
+            note = Note.of(note)
+
+        position = note.octave * 7 + NOTE_POSITIONS[note.letter]
+
+        if previous is not None:
+            (previous_note, previous_position) = previous
+            name, octaves, direction = melodic_interval(
+                position - previous_position,
+                note.midi_value - previous_note.midi_value)
+
+            if name is None:
+                raise LookupError(
+                    "No interval between %r and %r" % (previous_note, note))
+
+            yield (INTERVAL_CODES[name] if codes
+                   else Interval.from_string(name)), octaves, direction
+
+        previous = (note, position)
+
+
+def count_intervals(notes):
+    """
+    Returns a Counter of (interval name, octaves, direction) over all pairs
+    of consecutive notes
+    """
+    return Counter(
+        (INTERVAL_NAMES[code], octaves, direction)
+        for (code, octaves, direction) in intervals_between(notes, codes=True)
+    )
+
+
+def melodic_interval(steps, semitones):
+    """
+    Returns the interval name (or None), octaves and direction for a distance
+    in diatonic steps and semitones
+    """
+    if steps > 0 or (steps == 0 and semitones > 0):
+        direction = ASCENDING
+    elif steps < 0 or semitones < 0:
+        direction = DESCENDING
+        steps = -steps
+        semitones = -semitones
+    else:
+        direction = UNISON
+
+    octaves = (steps - 1) // 7 if steps > 0 else 0
+    quantity = steps - octaves * 7 + 1
+    quality = calc_quality(quantity, semitones - octaves * 12)
+    name = '%s%s' % (quality, quantity) if quality is not None else None
+
+    return name, octaves, direction
@@ -0,0 +1,97 @@
+"""Analysis Test"""
+import io
+import unittest
+from nose.tools import assert_raises
+
+from .interval import Interval
+from .analysis import intervals_between, count_intervals, read_notes, \
+    INTERVAL_CODES, ASCENDING, DESCENDING, UNISON
+
+
+class AnalysisTest(unittest.TestCase):
+    """Analysis Test"""
+
+    @classmethod
+    def _names(cls, notes):
+        """Returns (interval name, octaves, direction) for all pairs"""
+        return [(interval.name, octaves, direction)
+                for (interval, octaves, direction)
+                in intervals_between(notes)]
+
+    @classmethod
+    def test_simple_intervals(cls):
+        """Test intervals within an octave in both directions"""
+        assert cls._names(['C', 'E', 'C', 'C', 'C5', 'B', 'F']) == [
+            ('M3', 0, ASCENDING),
+            ('M3', 0, DESCENDING),
+            ('P1', 0, UNISON),
+            ('P8', 0, ASCENDING),
+            ('m2', 0, DESCENDING),
+            ('A4', 0, DESCENDING)
+        ]
+
+    @classmethod
+    def test_compound_intervals(cls):
+        """Test intervals of more than an octave"""
+        assert cls._names(['C', 'E5', 'C3', 'C5', 'Bb2']) == [
+            ('M3', 1, ASCENDING),
+            ('M3', 2, DESCENDING),
+            ('P8', 1, ASCENDING),
+            ('M2', 2, DESCENDING)
+        ]
+
+    @classmethod
+    def test_accidentals(cls):
+        """Test spelled intervals with accidentals"""
+        assert cls._names(['C', 'C#', 'C', 'Cb', 'C', 'Dbb']) == [
+            ('A1', 0, ASCENDING),
+            ('A1', 0, DESCENDING),
+            ('A1', 0, DESCENDING),
+            ('A1', 0, ASCENDING),
+            ('d2', 0, ASCENDING)
+        ]
+        assert cls._names(['C5', 'B#4']) == [('d2', 0, DESCENDING)]
+
+    @classmethod
+    def test_shared_intervals_and_codes(cls):
+        """Test if shared intervals or codes are yielded"""
+        ((interval, _, _),) = list(intervals_between(['C', 'G']))
+        assert interval is Interval.from_string('P5')
+
+        assert list(intervals_between(['C', 'G', 'C'], codes=True)) == [
+            (INTERVAL_CODES['P5'], 0, ASCENDING),
+            (INTERVAL_CODES['P5'], 0, DESCENDING)
+        ]
+
+    @classmethod
+    def test_streaming(cls):
+        """Test if notes are consumed lazily"""
+        def notes():
+            """Yields notes forever"""
+            while True:
+                yield 'C'
+                yield 'D'
+
+        intervals = intervals_between(notes())
+        assert next(intervals)[0].name == 'M2'
+        assert next(intervals)[2] == DESCENDING
+
+        assert list(intervals_between([])) == []
+        assert list(intervals_between(['C'])) == []
+
+    @classmethod
+    def test_invalid_interval(cls):
+        """Test if an exception is thrown for invalid intervals"""
+        assert_raises(LookupError, list, intervals_between(['C', 'Dbbb']))
+
+    @classmethod
+    def test_read_notes_and_count(cls):
+        """Test reading notes from a file and counting intervals"""
+        transcript = io.StringIO('C D E\nC, G3\n\nC\n')
+        counts = count_intervals(read_notes(transcript))
+        assert counts == {
+            ('M2', 0, ASCENDING): 2,
+            ('M3', 0, DESCENDING): 1,
+            ('P4', 0, DESCENDING): 1,
+            ('P4', 0, ASCENDING): 1
+        }
@@ -0,0 +1,231 @@
+"""
+Batch Module
+
+Vectorised versions of Note + Interval, Note - Interval and Note.minus_note
+working on NumPy arrays.
+
+Notes are encoded as int8 rows of (letter index, accidental value, octave),
+where the letter index is the position in NOTE_KEYS.
+Intervals are encoded as int8 rows of (quantity, semitones).
+Intervals between notes are calculated on the line of fifths, see
+src.fifths.
+
+For storage, encoded notes can be packed into a single uint16 per note:
+bits 0-2 hold the letter index, bits 3-6 the accidental value + 8 and bits
+7-15 the octave + 1.
+"""
+import numpy as np
+
+from .music import NOTES, NOTE_KEYS, NOTE_POSITIONS
+from .accidentals import accidentals_from_value
+from .note import Note
+from .interval import Interval
+from .fifths import LETTER_FIFTHS, MAX_FIFTHS
+
+LETTER = 0
+ACCIDENTALS = 1
+OCTAVE = 2
+
+QUANTITY = 0
+SEMITONES = 1
+
+ACCIDENTALS_OFFSET = 8
+OCTAVE_OFFSET = 1
+
+NATURAL_SEMITONES = np.array([NOTES[letter][1] for letter in NOTE_KEYS])
+
+LETTER_FIFTHS_BY_INDEX = np.array([LETTER_FIFTHS[letter]
+                                   for letter in NOTE_KEYS])
+
+
+def encode_notes(notes):
+    """Encode a list of notes into an array of shape (n, 3)"""
+    return np.array(
+        [(NOTE_POSITIONS[note.letter], note.accidentals.value, note.octave)
+         for note in notes],
+        dtype=np.int8
+    ).reshape(-1, 3)
+
+
+def decode_notes(encoded):
+    """Decode an array of shape (n, 3) into a list of notes"""
+    return [
+        Note.of(NOTE_KEYS[letter] + accidentals_from_value(accidentals), octave)
+        for (letter, accidentals, octave) in encoded.tolist()
+    ]
+
+
+def pack_notes(encoded):
+    """Pack encoded notes of shape (n, 3) into an uint16 array"""
+    encoded = np.asarray(encoded)
+    accidentals = encoded[..., ACCIDENTALS].astype(np.int32) \
+        + ACCIDENTALS_OFFSET
+    octaves = encoded[..., OCTAVE].astype(np.int32) + OCTAVE_OFFSET
+
+    if np.any((accidentals < 0) | (accidentals > 15)) \
+            or np.any((octaves < 0) | (octaves > 511)):
+        raise ValueError("Notes can't be packed. Accidentals must be in range "
+                         "[-8, 7] and octaves in range [-1, 510]")
+
+    return (encoded[..., LETTER].astype(np.uint16)
+            | (accidentals.astype(np.uint16) << 3)
+            | (octaves.astype(np.uint16) << 7))
+
+
+def unpack_notes(packed):
+    """Unpack an uint16 array into encoded notes of shape (n, 3)"""
+    packed = np.asarray(packed, dtype=np.uint16)
+    return np.stack([
+        packed & 0x7,
+        ((packed >> 3) & 0xF).astype(np.int16) - ACCIDENTALS_OFFSET,
+        (packed >> 7).astype(np.int16) - OCTAVE_OFFSET
+    ], axis=-1).astype(np.int8)
+
+
+def pack_note(note):
+    """Pack a single note into an integer"""
+    return NOTE_POSITIONS[note.letter] \
+        | ((note.accidentals.value + ACCIDENTALS_OFFSET) << 3) \
+        | ((note.octave + OCTAVE_OFFSET) << 7)
+
+
+def unpack_note(packed):
+    """Unpack a single integer into a note"""
+    note = _NOTES_BY_PACKED_VALUE.get(packed)
+    if note is None:
+        letter = NOTE_KEYS[packed & 0x7]
+        accidentals = ((packed >> 3) & 0xF) - ACCIDENTALS_OFFSET
+        octave = (packed >> 7) - OCTAVE_OFFSET
+        note = Note.of(letter + accidentals_from_value(accidentals), octave)
+        _NOTES_BY_PACKED_VALUE[packed] = note
+    return note
+
+
+# Notes by their packed value, filled by unpack_note
+_NOTES_BY_PACKED_VALUE = {}
+
+
+def encode_intervals(intervals):
+    """Encode a list of intervals into an array of shape (n, 2)"""
+    return np.array(
+        [(interval.quantity, interval.semitones) for interval in intervals],
+        dtype=np.int8
+    ).reshape(-1, 2)
+
+
+def decode_intervals(encoded):
+    """Decode an array of shape (n, 2) into a list of intervals"""
+    return [
+        Interval.from_quantity_and_semitones(quantity, semitones)
+        for (quantity, semitones) in encoded.tolist()
+    ]
+
+
+def midi_values(notes):
+    """Returns the midi values of encoded notes"""
+    notes = np.asarray(notes)
+    letters = notes[..., LETTER].astype(np.int16)
+    return NATURAL_SEMITONES[letters] \
+        + notes[..., ACCIDENTALS] \
+        + (notes[..., OCTAVE].astype(np.int16) + 1) * 12
+
+
+def fifths_values(notes):
+    """Returns the positions of encoded notes on the line of fifths"""
+    notes = np.asarray(notes)
+    return LETTER_FIFTHS_BY_INDEX[notes[..., LETTER].astype(np.int16)] \
+        + 7 * notes[..., ACCIDENTALS].astype(np.int16)
+
+
+def add_intervals(notes, intervals):
+    """Returns the encoded notes with the encoded intervals added"""
+    return _add_or_sub_intervals(notes, intervals, +1)
+
+
+def sub_intervals(notes, intervals):
+    """Returns the encoded notes with the encoded intervals subtracted"""
+    return _add_or_sub_intervals(notes, intervals, -1)
+
+
+def _add_or_sub_intervals(notes, intervals, direction):
+    """
+    Add (direction = +1) or subtract (direction = -1) intervals from notes.
+    A single interval is applied to all notes.
+    """
+    notes = np.asarray(notes)
+    intervals = np.asarray(intervals)
+
+    letters = notes[..., LETTER].astype(np.int16)
+    octaves = notes[..., OCTAVE].astype(np.int16)
+    steps = intervals[..., QUANTITY].astype(np.int16) - 1
+    semitones = intervals[..., SEMITONES].astype(np.int16)
+
+    new_letters = letters + direction * steps
+    new_octaves = octaves + new_letters // 7
+    new_letters %= 7
+
+    # the new note without accidentals, measured against the current note
+    distance = NATURAL_SEMITONES[new_letters] + new_octaves * 12 \
+        - NATURAL_SEMITONES[letters] - notes[..., ACCIDENTALS] - octaves * 12
+
+    accidentals = direction * semitones - distance
+
+    return np.stack(
+        np.broadcast_arrays(new_letters, accidentals, new_octaves),
+        axis=-1
+    ).astype(np.int8)
+
+
+def minus_notes(roots, targets, strict=True):
+    """
+    Returns the encoded intervals between roots and targets. Raises a
+    LookupError if any interval is invalid, unless strict is False, in which
+    case invalid intervals are returned as (0, 0).
+    """
+    roots = np.asarray(roots)
+    targets = np.asarray(targets)
+
+    root_octaves = roots[..., OCTAVE].astype(np.int16)
+    target_octaves = targets[..., OCTAVE].astype(np.int16)
+    root_midi = midi_values(roots)
+    target_midi = midi_values(targets)
+
+    same_octave = root_octaves == target_octaves
+    is_desc = np.where(same_octave,
+                       root_midi > target_midi,
+                       root_octaves > target_octaves)
+    direction = np.where(is_desc, -1, 1)
+
+    # fifths and steps between the notes, see Note.minus_note
+    fifths = direction * (fifths_values(targets) - fifths_values(roots))
+    steps = direction * (_steps(targets) - _steps(roots))
+    steps = np.where(steps != 0, (steps - 1) % 7 + 1, 0)
+
+    quantity = steps + 1
+    semitones = 7 * fifths + 12 * ((steps - 4 * fifths) // 7)
+
+    valid = _is_valid(quantity, semitones)
+    if strict and not np.all(valid):
+        raise LookupError("Combination of quantity and semitones is invalid.")
+
+    return np.stack(
+        np.broadcast_arrays(np.where(valid, quantity, 0),
+                            np.where(valid, semitones, 0)),
+        axis=-1
+    ).astype(np.int8)
+
+
+def _steps(notes):
+    """Returns the diatonic steps of encoded notes above C0"""
+    return notes[..., OCTAVE].astype(np.int16) * 7 \
+        + notes[..., LETTER].astype(np.int16)
+
+
+def _is_valid(quantity, semitones):
+    """Returns a mask of the (quantity, semitones) pairs that are intervals"""
+    quantity = np.asarray(quantity, dtype=np.int64)
+    semitones = np.asarray(semitones, dtype=np.int64)
+
+    fifths = 7 * semitones - 12 * (quantity - 1)
+    return (quantity >= 1) & (semitones >= 0) \
+        & (np.abs(fifths) <= MAX_FIFTHS)
@@ -0,0 +1,126 @@
+"""Batch Test"""
+import unittest
+from nose.tools import assert_raises
+import numpy as np
+
+from .music import INTERVALS, NOTE_KEYS
+from .note import Note
+from .interval import Interval
+from .batch import encode_notes, decode_notes, encode_intervals, \
+    decode_intervals, midi_values, fifths_values, add_intervals, \
+    sub_intervals, minus_notes, pack_notes, unpack_notes, pack_note, \
+    unpack_note
+
+SPELLINGS = ('', '#', '##', 'b', 'bb')
+
+NOTES = [Note.of(letter + accidentals, octave)
+         for letter in NOTE_KEYS
+         for accidentals in SPELLINGS
+         for octave in (3, 4, 5)]
+
+
+class BatchTest(unittest.TestCase):
+    """Batch Test"""
+
+    @classmethod
+    def test_encode_decode_notes(cls):
+        """Test if notes survive a round trip through the encoding"""
+        encoded = encode_notes([Note('C'), Note('F#2'), Note('Bbb5')])
+        assert encoded.dtype == np.int8
+        assert encoded.tolist() == [[0, 0, 4], [3, 1, 2], [6, -2, 5]]
+
+        decoded = decode_notes(encoded)
+        assert [note.name for note in decoded] == ['C', 'F#', 'Bbb']
+        assert [note.octave for note in decoded] == [4, 2, 5]
+
+    @classmethod
+    def test_pack_unpack_notes(cls):
+        """Test if notes survive a round trip through the packed encoding"""
+        encoded = encode_notes(NOTES + [Note('Cbbb', 0), Note('B###', 8)])
+        packed = pack_notes(encoded)
+        assert packed.dtype == np.uint16
+        assert unpack_notes(packed).tolist() == encoded.tolist()
+
+        for (note, value) in zip(NOTES, packed.tolist()):
+            assert pack_note(note) == value
+            assert unpack_note(value) is Note.of(note.name, note.octave)
+
+        assert_raises(ValueError, pack_notes,
+                      encode_notes([Note('Cbbbbbbbbb')]))
+        assert_raises(ValueError, pack_notes, encode_notes([Note('C', -2)]))
+
+    @classmethod
+    def test_encode_decode_intervals(cls):
+        """Test if intervals survive a round trip through the encoding"""
+        intervals = [Interval.from_string(name) for name in INTERVALS]
+        encoded = encode_intervals(intervals)
+        assert encoded.shape == (len(INTERVALS), 2)
+        assert [interval.name for interval in decode_intervals(encoded)] \
+            == list(INTERVALS)
+
+    @classmethod
+    def test_midi_values(cls):
+        """Test the midi values of encoded notes"""
+        assert midi_values(encode_notes(NOTES)).tolist() \
+            == [note.midi_value for note in NOTES]
+
+    @classmethod
+    def test_fifths_values(cls):
+        """Test the positions of encoded notes on the line of fifths"""
+        assert fifths_values(encode_notes(NOTES)).tolist() \
+            == [note.fifths for note in NOTES]
+
+    @classmethod
+    def test_add_and_sub_intervals(cls):
+        """Test if adding/subtracting intervals matches Note +/- Interval"""
+        intervals = [Interval.from_string(name) for name in INTERVALS]
+        pairs = [(note, interval) for note in NOTES for interval in intervals]
+
+        encoded_notes = encode_notes([note for (note, _) in pairs])
+        encoded_intervals = encode_intervals([i for (_, i) in pairs])
+
+        added = decode_notes(add_intervals(encoded_notes, encoded_intervals))
+        subbed = decode_notes(sub_intervals(encoded_notes, encoded_intervals))
+
+        for ((note, interval), add, sub) in zip(pairs, added, subbed):
+            assert add.is_same(note + interval)
+            assert add.octave == (note + interval).octave
+            assert sub.is_same(note - interval)
+            assert sub.octave == (note - interval).octave
+
+    @classmethod
+    def test_add_single_interval(cls):
+        """Test if a single interval is applied to all notes"""
+        encoded = encode_notes([Note('C'), Note('Eb'), Note('B')])
+        fifth = encode_intervals([Interval.from_string('P5')])[0]
+        names = [note.name for note in
+                 decode_notes(add_intervals(encoded, fifth))]
+        assert names == ['G', 'Bb', 'F#']
+
+    @classmethod
+    def test_minus_notes(cls):
+        """Test if intervals between notes match Note.minus_note"""
+        roots = [root for root in NOTES for _ in NOTES]
+        targets = [target for _ in NOTES for target in NOTES]
+
+        encoded = minus_notes(encode_notes(roots), encode_notes(targets),
+                              strict=False)
+
+        for (root, target, (quantity, semitones)) in \
+                zip(roots, targets, encoded.tolist()):
+            try:
+                interval = root.minus_note(target)
+            except LookupError:
+                assert (quantity, semitones) == (0, 0)
+            else:
+                assert (quantity, semitones) \
+                    == (interval.quantity, interval.semitones)
+
+    @classmethod
+    def test_minus_notes_strict(cls):
+        """Test if an exception is thrown for invalid intervals"""
+        roots = encode_notes([Note('C'), Note('C')])
+        targets = encode_notes([Note('E'), Note('Fbbb')])
+
+        assert_raises(LookupError, minus_notes, roots, targets)
+        assert minus_notes(roots[:1], targets[:1]).tolist() == [[3, 4]]
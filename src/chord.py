@@ -0,0 +1,160 @@
+"""Chord Module"""
+from .music import CHORDS, NOTE_POSITIONS
+from .interval import Interval, calc_quality
+from .note import Note
+
+
+class Chord:
+    """
+    Chord Class
+
+    A chord is a root, a quality from CHORDS and an inversion. The inversion
+    is the index of the chord tone in the bass (0 = root position).
+    Use `Chord.of` to get a shared instance.
+    """
+
+    def __init__(self, root, quality='major', inversion=0):
+        if quality not in CHORDS:
+            raise ValueError("Chord quality should be one of %s. Got %s" % (
+                list(CHORDS.keys()),
+                quality
+            ))
+
+        if inversion < 0 or inversion >= len(CHORDS[quality]):
+            raise ValueError(
+                "Inversion should be in range [0, %s]. Got %s" % (
+                    len(CHORDS[quality]) - 1,
+                    inversion
+                )
+            )
+
+        self.root = root if isinstance(root, Note) else Note.of(root)
+        self.quality = quality
+        self.inversion = inversion
+        self.name = '%s %s' % (self.root.letter
+                               + self.root.accidentals.accidentals, quality)
+
+        tones = [self.root + Interval.from_string(name)
+                 for name in CHORDS[quality]]
+        self.notes = [note.letter + note.accidentals.accidentals
+                      for note in tones]
+
+        # move all tones before the bass up until they're above it
+        self.bass = tones[inversion]
+        for (index, note) in enumerate(tones[:inversion]):
+            octave = note.octave
+            while note.midi_value + (octave - note.octave) * 12 \
+                    <= self.bass.midi_value:
+                octave += 1
+            tones[index] = Note.of(note.name, octave)
+
+        self.pitches = sorted(tones, key=lambda note: note.midi_value)
+        self.pitch_class_mask = pitch_class_mask(tones)
+
+    @staticmethod
+    def of(root, quality='major', inversion=0):
+        """Returns a shared chord for the given root, quality and inversion"""
+        root = root if isinstance(root, Note) else Note.of(root)
+
+        # notes hash enharmonically, so use their spelling instead
+        key = (root.spelling_key(), quality, inversion)
+        chord = _CHORDS.get(key)
+        if chord is None:
+            chord = _CHORDS.setdefault(key, Chord(root, quality, inversion))
+        return chord
+
+
+def pitch_class_mask(notes):
+    """Returns a 12 bit mask of the pitch classes of the notes (C = bit 0)"""
+    mask = 0
+    for note in notes:
+        mask |= 1 << (note.midi_value % 12)
+    return mask
+
+
+def candidates(mask):
+    """
+    Returns all (root pitch class, quality) pairs of chords with exactly the
+    pitch classes of the mask
+    """
+    return PITCH_CLASS_INDEX.get(mask, ())
+
+
+def identify(notes):
+    """
+    Identify the chord of a list of notes (or note names). Returns all
+    matching chords, best match first. Chords that are spelled exactly like
+    the notes rank before enharmonic matches, and root positions before
+    inversions. The lowest note is taken as the bass.
+    """
+    notes = [note if isinstance(note, Note) else Note.of(note)
+             for note in notes]
+    if not notes:
+        return []
+
+    bass_pitch_class = min(notes, key=lambda note: note.midi_value) \
+        .midi_value % 12
+
+    matches = []
+    for (root_pitch_class, quality) in candidates(pitch_class_mask(notes)):
+        root = next(note for note in notes
+                    if note.midi_value % 12 == root_pitch_class)
+
+        spelled = quality in SPELLING_INDEX.get(
+            frozenset(_simple_interval(root, note) for note in notes), ())
+        inversion = CHORD_PITCH_CLASSES[quality].index(
+            (bass_pitch_class - root_pitch_class) % 12)
+
+        matches.append((not spelled, inversion, Chord.of(root, quality,
+                                                         inversion)))
+
+    matches.sort(key=lambda match: match[:2])
+    return [chord for (_, _, chord) in matches]
+
+
+def _simple_interval(root, note):
+    """
+    Returns the name of the simple interval from the root up to the note,
+    ignoring octaves, or None if there is none
+    """
+    steps = (NOTE_POSITIONS[note.letter] - NOTE_POSITIONS[root.letter]) % 7
+    semitones = (note.midi_value - root.midi_value) % 12
+    quality = calc_quality(steps + 1, semitones)
+    return '%s%s' % (quality, steps + 1) if quality is not None else None
+
+
+def _build_indexes():
+    """
+    Build the pitch class index (mask: (root pitch class, quality) pairs)
+    and the spelling index (simple interval names: qualities)
+    """
+    pitch_class_index = {}
+    spelling_index = {}
+    chord_pitch_classes = {}
+
+    for (quality, pattern) in CHORDS.items():
+        intervals = [Interval.from_string(name).simple for name in pattern]
+        chord_pitch_classes[quality] = [interval.semitones % 12
+                                        for interval in intervals]
+
+        spelling = frozenset(interval.name for interval in intervals)
+        spelling_index.setdefault(spelling, []).append(quality)
+
+        for root in range(12):
+            mask = 0
+            for semitones in chord_pitch_classes[quality]:
+                mask |= 1 << ((root + semitones) % 12)
+            pitch_class_index.setdefault(mask, []).append((root, quality))
+
+    return (
+        {mask: tuple(chords) for (mask, chords) in pitch_class_index.items()},
+        {spelling: tuple(qualities)
+         for (spelling, qualities) in spelling_index.items()},
+        chord_pitch_classes
+    )
+
+
+(PITCH_CLASS_INDEX, SPELLING_INDEX, CHORD_PITCH_CLASSES) = _build_indexes()
+
+# Shared chords keyed by (root, quality, inversion)
+_CHORDS = {}
@@ -0,0 +1,104 @@
+"""Chord Test"""
+import unittest
+from nose.tools import assert_raises
+
+from .music import CHORDS
+from .note import Note
+from .chord import Chord, identify, candidates, pitch_class_mask
+
+
+class ChordTest(unittest.TestCase):
+    """Chord Test"""
+
+    @classmethod
+    def test_invalid_chord(cls):
+        """Test if exceptions are thrown for invalid chords"""
+        assert_raises(ValueError, Chord, 'C', 'hyper')
+        assert_raises(ValueError, Chord, 'C', 'major', 3)
+        assert_raises(ValueError, Chord, 'C', 'major', -1)
+        assert_raises(ValueError, Chord, 'W', 'major')
+
+    @classmethod
+    def test_triads(cls):
+        """Test building triads"""
+        assert Chord('C').notes == ['C', 'E', 'G']
+        assert Chord('D', 'minor').notes == ['D', 'F', 'A']
+        assert Chord('B', 'diminished').notes == ['B', 'D', 'F']
+        assert Chord('Eb', 'augmented').notes == ['Eb', 'G', 'B']
+        assert Chord('G', 'sus4').notes == ['G', 'C', 'D']
+        assert Chord('F#', 'minor').name == 'F# minor'
+
+    @classmethod
+    def test_sevenths_and_extensions(cls):
+        """Test building seventh chords and extensions"""
+        assert Chord('G', 'dominant 7th').notes == ['G', 'B', 'D', 'F']
+        assert Chord('C#', 'diminished 7th').notes \
+            == ['C#', 'E', 'G', 'Bb']
+        assert Chord('B', 'half-diminished 7th').notes \
+            == ['B', 'D', 'F', 'A']
+
+        chord = Chord('C', 'dominant 9th')
+        assert chord.notes == ['C', 'E', 'G', 'Bb', 'D']
+        assert chord.pitches[-1].octave == 5
+
+        assert Chord('F', 'major 13th').notes \
+            == ['F', 'A', 'C', 'E', 'G', 'D']
+
+    @classmethod
+    def test_inversions(cls):
+        """Test the voicing of inversions"""
+        chord = Chord('C', 'major', 1)
+        assert chord.bass.name == 'E'
+        assert [(note.name, note.octave) for note in chord.pitches] \
+            == [('E', 4), ('G', 4), ('C', 5)]
+
+        chord = Chord('C', 'dominant 7th', 3)
+        assert [note.name for note in chord.pitches] \
+            == ['Bb', 'C', 'E', 'G']
+
+        for quality in CHORDS:
+            for inversion in range(len(CHORDS[quality])):
+                chord = Chord('D', quality, inversion)
+                assert chord.pitches[0] is chord.bass
+
+    @classmethod
+    def test_pitch_class_mask(cls):
+        """Test the pitch class masks of chords"""
+        assert pitch_class_mask([Note('C'), Note('E'), Note('G')]) \
+            == 0b000010010001
+        assert Chord('C').pitch_class_mask == 0b000010010001
+        assert Chord('Dbb').pitch_class_mask == Chord('C').pitch_class_mask
+        assert (0, 'major') in candidates(0b000010010001)
+        assert candidates(0) == ()
+
+    @classmethod
+    def test_identify(cls):
+        """Test identifying chords from notes"""
+        assert identify(['C', 'E', 'G'])[0] is Chord.of(Note('C'), 'major')
+        assert identify(['E3', 'C', 'G'])[0].inversion == 1
+        assert identify(['Bb', 'D', 'F', 'Ab'])[0].name \
+            == 'Bb dominant 7th'
+        assert identify([])[0:] == []
+        assert identify(['C', 'C#', 'D']) == []
+
+        # enharmonic candidates are ranked after correctly spelled ones
+        names = [chord.name for chord in identify(['A3', 'C', 'E', 'G'])]
+        assert names == ['A minor 7th', 'C major 6th']
+
+        names = [chord.name for chord in identify(['C', 'Eb', 'Gb', 'A'])]
+        assert names[0] == 'A diminished 7th'
+        assert len(names) == 4
+
+    @classmethod
+    def test_identify_all_chords(cls):
+        """Test if every chord identifies itself"""
+        for quality in CHORDS:
+            for root in ('C', 'F#', 'Bb'):
+                chord = Chord.of(root, quality)
+                assert chord in identify(chord.pitches)
+
+    @classmethod
+    def test_shared_chords(cls):
+        """Test if Chord.of returns shared instances"""
+        assert Chord.of('A', 'minor') is Chord.of('A', 'minor')
+        assert Chord.of(Note('C#')) is not Chord.of(Note('Db'))
@@ -0,0 +1,287 @@
+"""
+Command Line Interface
+
+Analyse a file of note sequences, one sequence (for example a student
+answer) per line, or a corpus file (see src.corpus):
+    music-theory analyze answers.txt --workers 8
+
+The file is split into shards of whole lines (or whole sequences). Workers
+only receive the byte range (or sequence range) of their shard, read and
+encode it into packed uint16 notes themselves and send back small
+aggregates, which are merged at the end.
+"""
+import argparse
+import json
+import os
+import sys
+from collections import Counter
+from concurrent.futures import ProcessPoolExecutor
+
+import numpy as np
+
+from .interval import Interval
+from .note import Note
+from .keysignature import KEYS
+from .analysis import melodic_interval, ASCENDING, DESCENDING
+from .batch import LETTER, ACCIDENTALS, OCTAVE, ACCIDENTALS_OFFSET, \
+    pack_note, unpack_notes, midi_values
+from .corpus import Corpus, is_corpus
+from .keyfinding import KEY_SPELLINGS, KEY_PITCH_CLASSES, \
+    packed_histograms, spelling_columns, score
+
+DEFAULT_CHUNK_SIZE = 4 * 1024 * 1024
+
+
+def analyze(path, workers=None, chunk_size=DEFAULT_CHUNK_SIZE):
+    """
+    Analyse a file of note sequences. Returns a dict with the number of
+    melodies, notes and invalid note names, the detected keys, the interval
+    distribution and the spelling error rate.
+    With workers=1 everything runs in the current process.
+    """
+    if is_corpus(path):
+        analyze_shard = _analyze_corpus_shard
+        ranges = corpus_shard(path, chunk_size)
+    else:
+        analyze_shard = _analyze_shard
+        ranges = shard(path, chunk_size)
+
+    shards = [(path, start, end) for (start, end) in ranges]
+    workers = workers or os.cpu_count() or 1
+
+    if workers == 1 or len(shards) <= 1:
+        results = [analyze_shard(*args) for args in shards]
+    else:
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            results = list(executor.map(analyze_shard, *zip(*shards)))
+
+    return _report(_merge(results))
+
+
+def shard(path, chunk_size=DEFAULT_CHUNK_SIZE):
+    """
+    Returns (start, end) byte ranges of about chunk_size bytes that cover
+    the whole file and only contain whole lines
+    """
+    size = os.path.getsize(path)
+    ranges = []
+    start = 0
+
+    with open(path, 'rb') as source:
+        while start < size:
+            source.seek(min(start + chunk_size, size))
+            source.readline()
+            end = min(source.tell(), size)
+            ranges.append((start, end))
+            start = end
+
+    return ranges
+
+
+def corpus_shard(path, chunk_size=DEFAULT_CHUNK_SIZE):
+    """
+    Returns (first, last) sequence ranges of a corpus file with about
+    chunk_size bytes of notes each
+    """
+    with Corpus(path) as corpus:
+        notes_per_shard = max(1, chunk_size // corpus.notes.itemsize)
+        bounds = np.searchsorted(corpus.index, np.arange(
+            notes_per_shard, int(corpus.index[-1]), notes_per_shard,
+            dtype=corpus.index.dtype))
+        bounds = np.unique(np.concatenate([[0], bounds, [len(corpus)]]))
+
+    return [(int(first), int(last))
+            for (first, last) in zip(bounds[:-1], bounds[1:])]
+
+
+def _analyze_shard(path, start, end):
+    """Read, encode and aggregate the lines in a byte range of a file"""
+    with open(path, 'rb') as source:
+        source.seek(start)
+        lines = source.read(end - start).decode('utf-8').splitlines()
+
+    (packed, lengths, invalid) = _encode_lines(lines)
+    aggregates = _aggregate(packed, lengths)
+    aggregates['invalid'] = invalid
+    return aggregates
+
+
+def _analyze_corpus_shard(path, first, last):
+    """Aggregate the sequences first to last (exclusive) of a corpus"""
+    with Corpus(path) as corpus:
+        packed = corpus.notes[corpus.index[first]:corpus.index[last]]
+        lengths = np.diff(corpus.index[first:last + 1]).astype(np.int64)
+        aggregates = _aggregate(packed, lengths[lengths > 0])
+        del packed
+    aggregates['invalid'] = 0
+    return aggregates
+
+
+def _encode_lines(lines):
+    """
+    Encode lines of note names into one packed uint16 array and the number
+    of notes per line. Returns (packed, lengths, number of invalid names).
+    Empty lines are skipped.
+    """
+    codes = {}
+    packed = []
+    lengths = []
+    invalid = 0
+
+    for line in lines:
+        length = 0
+        for name in line.replace(',', ' ').split():
+            code = codes.get(name)
+            if code is None:
+                code = codes[name] = _encode_name(name)
+            if code < 0:
+                invalid += 1
+                continue
+            packed.append(code)
+            length += 1
+        if length:
+            lengths.append(length)
+
+    return (np.array(packed, dtype=np.uint16),
+            np.array(lengths, dtype=np.int64), invalid)
+
+
+def _encode_name(name):
+    """Returns the packed value of a note name or -1 if it's invalid"""
+    try:
+        note = Note.of(name)
+    except ValueError:
+        return -1
+
+    if not 0 <= note.accidentals.value + ACCIDENTALS_OFFSET <= 15:
+        return -1
+    return pack_note(note)
+
+
+def _aggregate(packed, lengths):
+    """
+    Count keys, intervals and spelling errors of the packed notes of many
+    melodies at once
+    """
+    notes = unpack_notes(packed).astype(np.int64)
+    melodies = np.repeat(np.arange(len(lengths)), lengths)
+    midi = midi_values(notes)
+
+    # the most likely key of every melody
+    keys = np.argmax(score(*packed_histograms(packed, lengths)), axis=1)
+
+    return {
+        'melodies': len(lengths),
+        'notes': len(packed),
+        'spelling_errors': _count_spelling_errors(
+            notes, midi, keys[melodies]),
+        'keys': _count_keys(keys),
+        'intervals': _count_intervals(notes, midi, melodies),
+    }
+
+
+def _count_intervals(notes, midi, melodies):
+    """
+    Count the (steps, semitones) between consecutive notes of the same
+    melody
+    """
+    positions = notes[:, OCTAVE] * 7 + notes[:, LETTER]
+    same_melody = melodies[1:] == melodies[:-1]
+    steps = np.diff(positions)[same_melody]
+    semitones = np.diff(midi)[same_melody]
+
+    (pairs, counts) = np.unique(np.stack([steps, semitones], axis=-1),
+                                axis=0, return_counts=True)
+    return Counter({(int(steps), int(semitones)): int(count)
+                    for ((steps, semitones), count)
+                    in zip(pairs.tolist(), counts.tolist())})
+
+
+def _count_keys(keys):
+    """Count the key names of the indexes of KEYS"""
+    return Counter({KEYS[key]: int(count) for (key, count)
+                    in enumerate(np.bincount(keys, minlength=len(KEYS)))
+                    if count})
+
+
+def _count_spelling_errors(notes, midi, note_keys):
+    """
+    Count the notes that sound in their key but are spelled differently.
+    note_keys are the indexes of the key of every note.
+    """
+    spellings = spelling_columns(notes[:, LETTER], notes[:, ACCIDENTALS])
+    errors = ~KEY_SPELLINGS[note_keys, spellings].astype(bool) \
+        & KEY_PITCH_CLASSES[note_keys, midi % 12]
+    return int(np.sum(errors))
+
+
+def _merge(results):
+    """Merge the aggregates of all shards"""
+    merged = {'melodies': 0, 'notes': 0, 'invalid': 0, 'spelling_errors': 0,
+              'keys': Counter(), 'intervals': Counter()}
+    for result in results:
+        for (name, value) in result.items():
+            merged[name] += value
+    return merged
+
+
+def _report(merged):
+    """Turn merged aggregates into a JSON serialisable report"""
+    intervals = Counter()
+    for ((steps, semitones), count) in merged['intervals'].items():
+        intervals[_interval_label(steps, semitones)] += count
+
+    return {
+        'melodies': merged['melodies'],
+        'notes': merged['notes'],
+        'invalid': merged['invalid'],
+        'keys': dict(merged['keys'].most_common()),
+        'intervals': dict(intervals.most_common()),
+        'spelling_error_rate': merged['spelling_errors'] / merged['notes']
+                               if merged['notes'] else 0.0,
+    }
+
+
+def _interval_label(steps, semitones):
+    """Returns a label like +M3, -P11 or P1 for a melodic interval"""
+    (name, octaves, direction) = melodic_interval(steps, semitones)
+    if name is None:
+        return 'invalid'
+
+    interval = Interval.from_string(name)
+    prefix = {ASCENDING: '+', DESCENDING: '-'}.get(direction, '')
+    return '%s%s%s' % (prefix, interval.quality,
+                       interval.quantity + octaves * 7)
+
+
+def main(argv=None):
+    """Command line entry point"""
+    parser = argparse.ArgumentParser(prog='music-theory')
+    commands = parser.add_subparsers(dest='command')
+    commands.required = True
+
+    analyze_parser = commands.add_parser(
+        'analyze', help='analyse a file of note sequences')
+    analyze_parser.add_argument(
+        'input', help='corpus file or file with one note sequence per line')
+    analyze_parser.add_argument('--workers', type=int, default=None,
+                                help='worker processes (default: all cores)')
+    analyze_parser.add_argument('--chunk-size', type=int,
+                                default=DEFAULT_CHUNK_SIZE,
+                                help='approximate bytes per shard')
+
+    args = parser.parse_args(argv)
+
+    try:
+        report = analyze(args.input, workers=args.workers,
+                         chunk_size=args.chunk_size)
+    except (OSError, UnicodeDecodeError) as error:
+        print('music-theory: %s' % error, file=sys.stderr)
+        return 1
+
+    print(json.dumps(report, indent=2, sort_keys=True))
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
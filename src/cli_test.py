@@ -0,0 +1,95 @@
+"""CLI Test"""
+import io
+import os
+import tempfile
+import unittest
+from contextlib import redirect_stdout, redirect_stderr
+
+from .corpus import write_corpus
+from .cli import analyze, shard, corpus_shard, main
+
+ANSWERS = '\n'.join([
+    'C D E F G',
+    'D E F# G A B C# D',
+    'Bb C D Eb F, G A Bb',
+    'C4 E5 G3 X9 C',
+    '',
+    'E Gb F# G A B E',
+]) + '\n'
+
+
+class CliTest(unittest.TestCase):
+    """CLI Test"""
+
+    @classmethod
+    def setUpClass(cls):
+        (handle, cls.path) = tempfile.mkstemp(suffix='.txt')
+        with os.fdopen(handle, 'w') as answers:
+            answers.write(ANSWERS)
+
+    @classmethod
+    def tearDownClass(cls):
+        os.remove(cls.path)
+
+    def test_shard(self):
+        """Test if shards cover the whole file and only hold whole lines"""
+        for chunk_size in (1, 7, 20, 1000):
+            ranges = shard(self.path, chunk_size)
+            assert ranges[0][0] == 0
+            assert ranges[-1][1] == len(ANSWERS)
+            for ((_, end), (start, _)) in zip(ranges, ranges[1:]):
+                assert end == start
+                assert ANSWERS[end - 1] == '\n'
+
+    def test_analyze(self):
+        """Test the aggregates of a small file"""
+        report = analyze(self.path, workers=1)
+        assert report['melodies'] == 5
+        assert report['notes'] == 32
+        assert report['invalid'] == 1
+        assert report['keys'] == {'C': 2, 'D': 1, 'Bb': 1, 'e': 1}
+        assert report['intervals']['+M2'] == 13
+        assert report['intervals']['+M10'] == 1
+        assert report['intervals']['-M13'] == 1
+        assert report['intervals']['-P5'] == 1
+
+        # notes without an octave are in octave 4, so B C# goes down a m7
+        assert report['intervals']['-m7'] == 2
+
+        # Gb in e minor is the only spelling error
+        assert report['spelling_error_rate'] == 1 / 32
+
+    def test_workers(self):
+        """Test if shards in worker processes give the same results"""
+        assert analyze(self.path, workers=2, chunk_size=10) \
+            == analyze(self.path, workers=1)
+
+    def test_corpus(self):
+        """Test if a corpus file gives the same results as a text file"""
+        (handle, path) = tempfile.mkstemp(suffix='.corpus')
+        os.close(handle)
+        try:
+            write_corpus(path, [
+                [name for name in line.replace(',', ' ').split()
+                 if name != 'X9']
+                for line in ANSWERS.splitlines()
+            ])
+            assert corpus_shard(path, 6)[0] == (0, 1)
+            assert corpus_shard(path)[-1][1] == 6
+
+            expected = analyze(self.path, workers=1)
+            expected['invalid'] = 0
+            assert analyze(path, workers=1) == expected
+            assert analyze(path, workers=2, chunk_size=6) == expected
+        finally:
+            os.remove(path)
+
+    def test_main(self):
+        """Test the command line entry point"""
+        output = io.StringIO()
+        with redirect_stdout(output):
+            assert main(['analyze', self.path, '--workers', '1']) == 0
+        assert '"melodies": 5' in output.getvalue()
+
+        with redirect_stderr(io.StringIO()):
+            assert main(['analyze', self.path + '.missing']) == 1
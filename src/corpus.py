@@ -0,0 +1,193 @@
+"""
+Corpus Module
+
+Binary storage for many sequences of spelled notes. Notes are stored with
+the packed uint16 encoding of src.batch, so reading a sequence is a view
+into the file instead of parsing note names.
+
+File layout (little endian):
+    header   32 bytes   magic, version, number of sequences and notes
+    notes    uint16     the packed notes of all sequences, back to back
+    padding             up to the next multiple of 8 bytes
+    index    uint64     number of sequences + 1 offsets (in notes) into the
+                        note data. Sequence n is notes[index[n]:index[n+1]]
+"""
+import mmap
+import struct
+from array import array
+
+import numpy as np
+
+from .note import Note
+from .batch import encode_notes, pack_notes
+from .sequence import NoteSequence
+
+MAGIC = b'MTCORPUS'
+VERSION = 1
+
+_HEADER = struct.Struct('<8sHHIQQ')
+_NOTE_TYPE = np.dtype('<u2')
+_INDEX_TYPE = np.dtype('<u8')
+
+
+class CorpusWriter:
+    """
+    Corpus Writer Class
+
+    Streams sequences to a corpus file. Only the offsets are kept in memory
+    until the index is written on `close`. Use it as a context manager.
+    """
+
+    def __init__(self, path):
+        self._file = open(path, 'wb')
+        self._file.write(b'\0' * _HEADER.size)
+        self._offsets = array('Q', [0])
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+    def __len__(self):
+        return len(self._offsets) - 1
+
+    def write(self, sequence):
+        """
+        Append a sequence. It can be a NoteSequence, a uint16 array of packed
+        notes, an array of encoded notes of shape (n, 3) or a list of notes
+        or note names.
+        """
+        if isinstance(sequence, NoteSequence):
+            packed = sequence.packed
+        elif isinstance(sequence, np.ndarray):
+            packed = _as_packed(sequence)
+        else:
+            packed = pack_notes(encode_notes(
+                [note if isinstance(note, Note) else Note.of(note)
+                 for note in sequence]))
+
+        self._file.write(np.asarray(packed, dtype=_NOTE_TYPE).tobytes())
+        self._offsets.append(self._offsets[-1] + len(packed))
+
+    def close(self):
+        """Write the index and the header and close the file"""
+        if self._file.closed:
+            return
+
+        notes = self._offsets[-1]
+        self._file.write(b'\0' * (-notes * _NOTE_TYPE.itemsize % 8))
+        self._file.write(
+            np.asarray(self._offsets, dtype=_INDEX_TYPE).tobytes())
+
+        self._file.seek(0)
+        self._file.write(_HEADER.pack(MAGIC, VERSION, 0, 0, len(self), notes))
+        self._file.close()
+
+
+class Corpus:
+    """
+    Corpus Class
+
+    Read only access to a corpus file. The file is memory mapped, so
+    opening it doesn't read any note data and every sequence is a view
+    into the mapped file.
+    """
+
+    def __init__(self, path):
+        with open(path, 'rb') as source:
+            self._mmap = mmap.mmap(source.fileno(), 0, access=mmap.ACCESS_READ)
+
+        if len(self._mmap) < _HEADER.size:
+            raise ValueError("%s is not a corpus file" % path)
+
+        (magic, version, _, _, count, notes) = \
+            _HEADER.unpack_from(self._mmap)
+        if magic != MAGIC:
+            raise ValueError("%s is not a corpus file" % path)
+        if version != VERSION:
+            raise ValueError("Corpus version %s is not supported" % version)
+
+        index_start = _index_start(notes)
+        if len(self._mmap) < index_start + (count + 1) * 8:
+            raise ValueError("Corpus file %s is truncated" % path)
+
+        self.notes = np.frombuffer(self._mmap, dtype=_NOTE_TYPE,
+                                   count=notes, offset=_HEADER.size)
+        self.index = np.frombuffer(self._mmap, dtype=_INDEX_TYPE,
+                                   count=count + 1, offset=index_start)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+    def __len__(self):
+        return len(self.index) - 1
+
+    def __getitem__(self, index):
+        """Returns sequence n as a NoteSequence sharing the mapped file"""
+        return NoteSequence.from_packed(self.packed(index))
+
+    def __iter__(self):
+        for index in range(len(self)):
+            yield self[index]
+
+    def packed(self, index):
+        """Returns the packed notes of sequence n as a read only view"""
+        if index < 0:
+            index += len(self)
+        if not 0 <= index < len(self):
+            raise IndexError("Corpus index out of range")
+
+        return self.notes[self.index[index]:self.index[index + 1]]
+
+    def lengths(self):
+        """Returns the number of notes of every sequence"""
+        return np.diff(self.index).astype(np.int64)
+
+    def close(self):
+        """
+        Close the mapped file. Views that are still in use keep it open
+        until they're gone.
+        """
+        self.notes = self.index = None
+        try:
+            self._mmap.close()
+        except BufferError:
+            pass
+
+
+def write_corpus(path, sequences):
+    """Write all sequences to a new corpus file"""
+    with CorpusWriter(path) as writer:
+        for sequence in sequences:
+            writer.write(sequence)
+
+
+def is_corpus(path):
+    """Returns true if the file starts like a corpus file"""
+    with open(path, 'rb') as source:
+        return source.read(len(MAGIC)) == MAGIC
+
+
+def _index_start(notes):
+    """Returns the byte offset of the index for the number of notes"""
+    end = _HEADER.size + notes * _NOTE_TYPE.itemsize
+    return end + (-end % 8)
+
+
+def _as_packed(notes):
+    """
+    Returns an array of packed (1D, uint16) or encoded (shape (n, 3)) notes
+    as packed notes. Raises a ValueError for any other array, which would
+    corrupt the offsets of the corpus.
+    """
+    if notes.ndim == 2 and notes.shape[1] == 3:
+        return pack_notes(notes)
+    if notes.ndim != 1 or notes.dtype != np.uint16:
+        raise ValueError("Expected packed notes (uint16, 1D) or encoded "
+                         "notes of shape (n, 3). Got %s of shape %s" % (
+                             notes.dtype, notes.shape))
+    return notes
@@ -0,0 +1,86 @@
+"""Corpus Test"""
+import os
+import tempfile
+import unittest
+from nose.tools import assert_raises
+
+import numpy as np
+
+from .note import Note
+from .batch import encode_notes, pack_notes
+from .sequence import NoteSequence
+from .corpus import Corpus, CorpusWriter, write_corpus, is_corpus
+
+
+class CorpusTest(unittest.TestCase):
+    """Corpus Test"""
+
+    def setUp(self):
+        (handle, self.path) = tempfile.mkstemp(suffix='.corpus')
+        os.close(handle)
+
+    def tearDown(self):
+        os.remove(self.path)
+
+    def test_roundtrip(self):
+        """Test writing and reading sequences of all kinds"""
+        sequences = [
+            ['C', 'E', 'G'],
+            [],
+            NoteSequence(['C#5', 'Db3', 'Fbb']),
+            [Note('B#', 2)],
+        ]
+        write_corpus(self.path, sequences)
+        assert is_corpus(self.path)
+
+        with Corpus(self.path) as corpus:
+            assert len(corpus) == 4
+            assert list(corpus.lengths()) == [3, 0, 3, 1]
+            assert corpus[0] == NoteSequence(['C', 'E', 'G'])
+            assert len(corpus[1]) == 0
+            assert corpus[2] == sequences[2]
+            assert next(iter(corpus[-1])).is_same(Note('B#', 2))
+            assert [len(sequence) for sequence in corpus] == [3, 0, 3, 1]
+            assert_raises(IndexError, corpus.packed, 4)
+
+    def test_zero_copy(self):
+        """Test if sequences are read only views of the mapped file"""
+        with CorpusWriter(self.path) as writer:
+            for _ in range(3):
+                writer.write(NoteSequence(['C', 'D', 'E']))
+            assert len(writer) == 3
+
+        with Corpus(self.path) as corpus:
+            packed = corpus.packed(1)
+            assert np.shares_memory(packed, corpus.notes)
+            assert not packed.flags.writeable
+
+    def test_write_arrays(self):
+        """Test writing packed and encoded arrays"""
+        notes = [Note('C#', 5), Note('Ebb', 3), Note('G')]
+        with CorpusWriter(self.path) as writer:
+            writer.write(pack_notes(encode_notes(notes)))
+            writer.write(encode_notes(notes))
+            assert_raises(ValueError, writer.write,
+                          pack_notes(encode_notes(notes)).astype(np.int32))
+            assert_raises(ValueError, writer.write,
+                          np.zeros((2, 2), dtype=np.uint16))
+
+        with Corpus(self.path) as corpus:
+            assert len(corpus) == 2
+            assert list(corpus.lengths()) == [3, 3]
+            for sequence in corpus:
+                assert [note.spelling_key() for note in sequence] \
+                    == [note.spelling_key() for note in notes]
+
+    def test_invalid_file(self):
+        """Test if exceptions are thrown for files that aren't corpora"""
+        with open(self.path, 'wb') as output:
+            output.write(b'C D E F G A B C D E F G A B C D E F G A B C D E F')
+        assert not is_corpus(self.path)
+        assert_raises(ValueError, Corpus, self.path)
+
+        write_corpus(self.path, [['C', 'D']])
+        with open(self.path, 'r+b') as output:
+            output.truncate(40)
+        assert_raises(ValueError, Corpus, self.path)
@@ -0,0 +1,137 @@
+"""
+Exercises Module
+
+Random questions for ear training and theory drills. Questions are drawn
+from precomputed spaces of valid answers, so no sample is ever thrown away.
+Spaces are built on first use and shared between all generators.
+"""
+import random
+
+from .music import NOTE_KEYS, SHARP, FLAT, INTERVALS, SCALES, CHORDS, \
+    CIRCLE_OF_FIFTHS
+from .interval import Interval
+from .note import Note
+from .keysignature import KeySignature, KEYS
+from .scale import Scale
+from .chord import Chord
+
+# Answers with more accidentals than this on any note are left out
+MAX_ACCIDENTALS = 2
+
+"""
+Roots of interval questions: all naturals with a single sharp or flat.
+Tonics of scale and chord questions: the tonics of all major keys.
+"""
+ROOTS = [letter + accidentals
+         for letter in NOTE_KEYS for accidentals in ('', SHARP, FLAT)]
+TONICS = list(CIRCLE_OF_FIFTHS)
+
+
+class ExerciseGenerator:
+    """
+    Exercise Generator Class
+
+    Use a seed to get the same questions on every run.
+    """
+
+    def __init__(self, seed=None):
+        self.random = random.Random(seed)
+
+    def intervals(self, count, intervals=None):
+        """
+        Returns a list of (root, interval, answer) questions, where answer is
+        root + interval. intervals limits the questions to a list of interval
+        names or Interval objects.
+        """
+        space = _get_space('intervals')
+        if intervals is not None:
+            names = {interval.name if isinstance(interval, Interval)
+                     else interval for interval in intervals}
+            space = [question for question in space
+                     if question[1].name in names]
+        return self._sample(space, count)
+
+    def key_signatures(self, count):
+        """Returns a list of shared key signatures"""
+        return self._sample(_get_space('key signatures'), count)
+
+    def scales(self, count, scale_types=None):
+        """
+        Returns a list of shared scales. scale_types limits the questions to
+        a list of scale types from SCALES.
+        """
+        space = _get_space('scales')
+        if scale_types is not None:
+            space = [scale for scale in space
+                     if scale.scale_type in scale_types]
+        return self._sample(space, count)
+
+    def chords(self, count, qualities=None):
+        """
+        Returns a list of shared chords in root position. qualities limits
+        the questions to a list of chord qualities from CHORDS.
+        """
+        space = _get_space('chords')
+        if qualities is not None:
+            space = [chord for chord in space if chord.quality in qualities]
+        return self._sample(space, count)
+
+    def _sample(self, space, count):
+        """Draw count questions from a space, with replacement"""
+        if not space:
+            raise ValueError("There are no questions to choose from")
+        return self.random.choices(space, k=count)
+
+
+def _is_playable(notes):
+    """Returns true if no note has more than MAX_ACCIDENTALS"""
+    return all(abs(note.accidentals.value) <= MAX_ACCIDENTALS
+               for note in notes)
+
+
+def _build_interval_space():
+    """All (root, interval, answer) combinations with playable answers"""
+    space = []
+    for name in ROOTS:
+        root = Note.of(name)
+        for interval in INTERVALS:
+            interval = Interval.from_string(interval)
+            answer = root + interval
+            if _is_playable([answer]):
+                space.append((root, interval, answer))
+    return space
+
+
+def _build_scale_space():
+    """All scales of all types on all tonics with playable notes"""
+    return [scale
+            for tonic in TONICS for scale_type in SCALES
+            for scale in [Scale.of(tonic, scale_type)]
+            if _is_playable(scale.pitches)]
+
+
+def _build_chord_space():
+    """All root position chords on all tonics with playable notes"""
+    return [chord
+            for tonic in TONICS for quality in CHORDS
+            for chord in [Chord.of(tonic, quality)]
+            if _is_playable(chord.pitches)]
+
+
+_SPACE_BUILDERS = {
+    'intervals': _build_interval_space,
+    'key signatures': lambda: [KeySignature.of(key) for key in KEYS],
+    'scales': _build_scale_space,
+    'chords': _build_chord_space,
+}
+
+# Question spaces keyed by name, built on first use
+_SPACES = {}
+
+
+def _get_space(name):
+    """Returns the shared question space for a name"""
+    space = _SPACES.get(name)
+    if space is None:
+        space = _SPACES.setdefault(name, _SPACE_BUILDERS[name]())
+    return space
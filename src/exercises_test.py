@@ -0,0 +1,55 @@
+"""Exercises Test"""
+import unittest
+from nose.tools import assert_raises
+
+from .keysignature import KeySignature
+from .exercises import ExerciseGenerator, MAX_ACCIDENTALS
+
+
+class ExercisesTest(unittest.TestCase):
+    """Exercises Test"""
+
+    @classmethod
+    def test_seeded(cls):
+        """Test if the same seed gives the same questions"""
+        first = ExerciseGenerator(seed=42)
+        second = ExerciseGenerator(seed=42)
+        assert first.intervals(100) == second.intervals(100)
+        assert first.chords(100) == second.chords(100)
+        assert ExerciseGenerator(seed=1).scales(100) \
+            != ExerciseGenerator(seed=2).scales(100)
+
+    @classmethod
+    def test_interval_questions(cls):
+        """Test if interval questions are valid and playable"""
+        questions = ExerciseGenerator(seed=0).intervals(1000)
+        assert len(questions) == 1000
+        for (root, interval, answer) in questions:
+            assert (root + interval).is_same(answer)
+            assert abs(answer.accidentals.value) <= MAX_ACCIDENTALS
+
+        questions = ExerciseGenerator(seed=0).intervals(100, ['M3', 'P5'])
+        assert {interval.name for (_, interval, _) in questions} \
+            == {'M3', 'P5'}
+
+    @classmethod
+    def test_other_questions(cls):
+        """Test key signature, scale and chord questions"""
+        generator = ExerciseGenerator(seed=0)
+        assert all(isinstance(key, KeySignature)
+                   for key in generator.key_signatures(50))
+
+        scales = generator.scales(200, ['dorian'])
+        assert {scale.scale_type for scale in scales} == {'dorian'}
+
+        for chord in generator.chords(200):
+            assert chord.inversion == 0
+            assert all(abs(note.accidentals.value) <= MAX_ACCIDENTALS
+                       for note in chord.pitches)
+
+    @classmethod
+    def test_empty_space(cls):
+        """Test if an exception is thrown if there's nothing to ask"""
+        generator = ExerciseGenerator()
+        assert_raises(ValueError, generator.intervals, 10, ['M4'])
+        assert_raises(ValueError, generator.chords, 10, ['superchord'])
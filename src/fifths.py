@@ -0,0 +1,102 @@
+"""
+Fifths Module
+
+Integer arithmetic for spelled notes and intervals on the line of fifths.
+
+Every spelling has a position on the line of fifths: C is 0, G is 1, F is
+-1 and so on (... Bb F C G D A E B F# ...). A sharp adds 7, a flat removes
+7, so the position alone holds the letter and the accidentals.
+
+Notes and intervals are pairs of (fifths, steps). For notes, steps are the
+diatonic steps above C0 (the letter and the octave), for intervals the
+diatonic steps they span (0 = unison). Adding an interval to a note adds
+both numbers, the semitones follow from the pair and the quality of an
+interval only depends on its fifths.
+"""
+from .music import MAJOR, MINOR, PERFECT, AUG, DIM, DOUBLY_AUG, DOUBLY_DIM
+
+# Letters ordered by fifths, starting at F (-1)
+LETTERS_BY_FIFTHS = 'FCGDAEB'
+LETTER_FIFTHS = {
+    letter: fifths - 1 for (fifths, letter) in enumerate(LETTERS_BY_FIFTHS)
+}
+
+"""
+Fifths of the intervals of each quality. Perfect intervals are within one
+fifth of the unison, major ones two to five fifths above it. Every
+augmentation adds 7 fifths (a sharp), every diminution removes 7.
+"""
+QUALITY_FIFTHS = (
+    (DOUBLY_DIM, -19, -13),
+    (DIM, -12, -6),
+    (MINOR, -5, -2),
+    (PERFECT, -1, 1),
+    (MAJOR, 2, 5),
+    (AUG, 6, 12),
+    (DOUBLY_AUG, 13, 19),
+)
+MAX_FIFTHS = 19
+
+"""
+Naturals run from F (-1) to B (5), single sharps from F# (6) to B# (12) and
+single flats from Fb (-8) to Bb (-2). The easiest spellings of all notes,
+without E#, B#, Fb and Cb, run from Gb to A#.
+"""
+NATURALS_START = -1
+EASIEST_FLAT = -6
+EASIEST_SHARP = 10
+
+
+def note_fifths(letter, accidental_val):
+    """Returns the fifths of a letter with accidentals. For example F#: 6"""
+    return LETTER_FIFTHS[letter] + 7 * accidental_val
+
+
+def letter_of(fifths):
+    """Returns the letter of a position on the line of fifths"""
+    return LETTERS_BY_FIFTHS[(fifths + 1) % 7]
+
+
+def accidentals_of(fifths):
+    """Returns the accidentals (+ for sharps, - for flats) of a position"""
+    return (fifths + 1) // 7
+
+
+def position_of(fifths):
+    """Returns the position of the letter in NOTE_KEYS (C = 0, B = 6)"""
+    return 4 * fifths % 7
+
+
+def semitones_of(fifths, steps):
+    """Returns the semitones of a pair of fifths and steps"""
+    # 7 steps and 12 semitones per octave, 4 steps and 7 semitones per fifth
+    return 7 * fifths + 12 * ((steps - 4 * fifths) // 7)
+
+
+def fifths_of(steps, semitones):
+    """Returns the fifths of a pair of steps and semitones"""
+    return 7 * semitones - 12 * steps
+
+
+def quality_of(fifths):
+    """Returns the quality for the fifths of an interval or None"""
+    for (name, lowest, highest) in QUALITY_FIFTHS:
+        if lowest <= fifths <= highest:
+            return name
+    return None
+
+
+def interval_fifths(quality, steps):
+    """
+    Returns the fifths of an interval with a quality that spans a number of
+    steps or None if the quality doesn't exist for the steps (like a major
+    5th)
+    """
+    # the perfect or major interval of the steps
+    natural = (2 * steps + 1) % 7 - 1
+
+    for (name, lowest, highest) in QUALITY_FIFTHS:
+        if name == quality:
+            fifths = natural + 7 * ((lowest - natural + 6) // 7)
+            return fifths if fifths <= highest else None
+    return None
@@ -0,0 +1,87 @@
+"""Fifths Test"""
+import unittest
+
+from .music import QUALITIES
+from .interval import Interval
+from .fifths import note_fifths, letter_of, accidentals_of, position_of, \
+    semitones_of, fifths_of, quality_of, interval_fifths
+
+
+class FifthsTest(unittest.TestCase):
+    """Fifths Test"""
+
+    @classmethod
+    def test_note_fifths(cls):
+        """Test the positions of notes on the line of fifths"""
+        assert note_fifths('C', 0) == 0
+        assert note_fifths('F', 0) == -1
+        assert note_fifths('B', 0) == 5
+        assert note_fifths('F', 1) == 6
+        assert note_fifths('B', -1) == -2
+        assert note_fifths('F', 2) == 13
+
+    @classmethod
+    def test_spelling(cls):
+        """Test if letters and accidentals follow from the fifths"""
+        for letter in 'CDEFGAB':
+            for value in range(-3, 4):
+                fifths = note_fifths(letter, value)
+                assert letter_of(fifths) == letter
+                assert accidentals_of(fifths) == value
+                assert position_of(fifths) == 'CDEFGAB'.index(letter)
+
+    @classmethod
+    def test_semitones(cls):
+        """Test semitones of notes and intervals"""
+        # C4 and B#3
+        assert semitones_of(0, 28) == 48
+        assert semitones_of(12, 27) == 48
+
+        # M3, m6, P8, d2
+        assert semitones_of(4, 2) == 4
+        assert semitones_of(-4, 5) == 8
+        assert semitones_of(0, 7) == 12
+        assert semitones_of(-12, 1) == 0
+
+        assert fifths_of(2, 4) == 4
+        assert fifths_of(1, 0) == -12
+
+    @classmethod
+    def test_qualities(cls):
+        """Test qualities of intervals"""
+        assert quality_of(0) == 'P'
+        assert quality_of(4) == 'M'
+        assert quality_of(-3) == 'm'
+        assert quality_of(6) == 'A'
+        assert quality_of(-12) == 'd'
+        assert quality_of(13) == 'AA'
+        assert quality_of(-19) == 'dd'
+        assert quality_of(20) is None
+
+        assert interval_fifths('M', 2) == 4
+        assert interval_fifths('m', 1) == -5
+        assert interval_fifths('A', 3) == 6
+        assert interval_fifths('d', 4) == -6
+        assert interval_fifths('dd', 6) == -16
+        assert interval_fifths('M', 4) is None
+        assert interval_fifths('P', 2) is None
+
+        for steps in range(7):
+            for quality in QUALITIES:
+                fifths = interval_fifths(quality, steps)
+                if fifths is not None:
+                    assert quality_of(fifths) == quality
+                    assert position_of(fifths) == steps
+
+    @classmethod
+    def test_interval_positions(cls):
+        """Test the position of intervals on the line of fifths"""
+        # pylint: disable=no-member
+        assert Interval('P', 1).fifths == 0
+        assert Interval('P', 5).fifths == 1
+        assert Interval('M', 3).fifths == 4
+        assert Interval('M', 10).fifths == 4
+        assert Interval('m', 2).fifths == -5
+        assert Interval('A', 4).fifths == 6
+        assert Interval('d', 5).fifths == -6
+        assert Interval('AA', 7).fifths == 19
@@ -1,9 +1,27 @@
 """Interval Module"""
-from .music import QUALITIES, INTERVALS, MAJOR, MINOR, AUG, DIM
+from functools import total_ordering
 
+from .music import QUALITIES
+from .fifths import interval_fifths, semitones_of, fifths_of, quality_of
 
-class Interval:
-    """Interval Class"""
+
+@total_ordering
+class Interval:  # pylint: disable=no-member
+    """
+    Interval Class
+
+    Intervals are immutable and hashable. Two intervals are equal if they
+    have the same quality and quantity. Intervals are ordered by semitones,
+    then by diatonic steps (A4 < d5), and can be added and subtracted:
+    M3 + m3 = P5.
+    Any quantity from 1 upwards is valid, intervals larger than an octave
+    (for example M9 or P11) are compound intervals. Semitones are calculated
+    from the position of the interval on the line of fifths (see src.fifths)
+    and its steps, so there is no limit on the size.
+    """
+
+    __slots__ = ('quality', 'quantity', 'name', 'semitones', 'steps',
+                 'fifths', 'simple_quantity', 'octaves')
 
     def __init__(self, quality, quantity):
         if quality not in QUALITIES:
@@ -11,60 +29,260 @@ class Interval:
                 "Quality should be one of [%s]. Got %s" % (QUALITIES, quality)
             )
 
-        if quantity < 1 or quantity > 8:
+        if quantity < 1:
             raise ValueError(
-                "Qualitiy should be in range [0, 8]. Got %s" % quantity
+                "Quantity should be 1 or greater. Got %s" % quantity
             )
 
-        self.quality = quality
-        self.quantity = quantity
-        self.name = "%s%s" % (quality, quantity)
+        fifths = interval_fifths(quality, quantity - 1)
+        if fifths is None or semitones_of(fifths, quantity - 1) < 0:
+            raise ValueError("Interval %s%s invalid. %s can't be %s" % (
+                quality, quantity, quantity, quality))
+
+        # compound intervals are reduced to a 2nd up to an octave
+        octaves = (quantity - 2) // 7 if quantity > 8 else 0
+
+        # intervals are immutable, so attributes are set on the object
+        # directly. pylint can't see them, hence no-member is disabled
+
+        object.__setattr__(self, 'quality', quality)
+        object.__setattr__(self, 'quantity', quantity)
+        object.__setattr__(self, 'name', "%s%s" % (quality, quantity))
+        object.__setattr__(self, 'semitones',
+                           semitones_of(fifths, quantity - 1))
+        object.__setattr__(self, 'steps', quantity - 1)
+        object.__setattr__(self, 'fifths', fifths)
+        object.__setattr__(self, 'simple_quantity', quantity - octaves * 7)
+        object.__setattr__(self, 'octaves', octaves)
+
+    def __setattr__(self, attr, value):
+        raise AttributeError("Interval is immutable. Can't set %s" % attr)
+
+    def __delattr__(self, attr):
+        raise AttributeError("Interval is immutable. Can't delete %s" % attr)
+
+    def __eq__(self, interval):
+        """Returns true if two intervals have the same quality and quantity"""
+        if not isinstance(interval, Interval):
+            return NotImplemented
+        return self.spelling_key() == interval.spelling_key()
+
+    def __lt__(self, interval):
+        if not isinstance(interval, Interval):
+            return NotImplemented
+        return (self.semitones, self.steps) \
+            < (interval.semitones, interval.steps)
+
+    def __hash__(self):
+        return hash(self.spelling_key())
 
-        if self.name not in INTERVALS:
-            raise ValueError(("Interval %s invalid. "
-                              "Must be one of %s") %
-                             (self.name, INTERVALS.keys()))
+    def __add__(self, interval):
+        """
+        Returns the interval spanning both intervals, for example M3 + m3 =
+        P5. Raises a LookupError if there is no such interval.
+        """
+        if not isinstance(interval, Interval):
+            return NotImplemented
 
-        (_, semitones) = INTERVALS[self.name]
-        self.semitones = semitones
+        result = _SUMS.get((self.name, interval.name))
+        if result is None:
+            result = Interval.from_steps_and_semitones(
+                self.steps + interval.steps,
+                self.semitones + interval.semitones)
+        return result
+
+    def __sub__(self, interval):
+        """
+        Returns the interval that's left after removing a smaller interval,
+        for example P5 - M3 = m3. Raises a LookupError if there is no such
+        interval.
+        """
+        if not isinstance(interval, Interval):
+            return NotImplemented
+
+        result = _DIFFERENCES.get((self.name, interval.name))
+        if result is None:
+            result = Interval.from_steps_and_semitones(
+                self.steps - interval.steps,
+                self.semitones - interval.semitones)
+        return result
+
+    def __repr__(self):
+        return 'Interval(%r, %r)' % (self.quality, self.quantity)
+
+    def spelling_key(self):
+        """Returns a key that is equal for exactly the same intervals"""
+        return self.quality, self.quantity
+
+    def enharmonic_key(self):
+        """
+        Returns a key that is equal for enharmonically equivalent intervals,
+        for example A4 and d5
+        """
+        return self.semitones
+
+    @property
+    def is_compound(self):
+        """Returns true if the interval is larger than an octave"""
+        return self.octaves > 0
+
+    @property
+    def simple(self):
+        """
+        Returns the simple interval of a compound interval, for example M3
+        for M10. Simple intervals return themselves.
+        """
+        if not self.octaves:
+            return self
+        return Interval.from_string(
+            "%s%s" % (self.quality, self.simple_quantity))
 
     @staticmethod
     def from_quantity_and_semitones(quantity, semitones):
-        """Creates a new interval based on quantity and number of semitones."""
-        for item, _ in INTERVALS.items():
-            if item[-1] == str(quantity) and INTERVALS[item][1] == semitones:
-                return Interval.from_string(item)
+        """
+        Returns the shared interval for the given quantity and number of
+        semitones.
+        """
+        interval = _INTERVALS_BY_QUANTITY_AND_SEMITONES.get(
+            (quantity, semitones))
+        if interval is not None:
+            return interval
+
+        quantity = int(quantity)
+        quality = calc_quality(quantity, int(semitones))
+        if quality is None:
+            raise LookupError(
+                "Combination of quantity and semitones is invalid.")
 
-        raise LookupError("Combination of quantity and semitones is invalid.")
+        name = "%s%s" % (quality, quantity)
+        interval = _INTERVALS_BY_NAME.get(name)
+        return interval if interval is not None \
+            else Interval(quality, quantity)
+
+    @staticmethod
+    def from_steps_and_semitones(steps, semitones):
+        """
+        Returns the shared interval spanning the given number of diatonic
+        steps (0 = unison) and semitones.
+        """
+        return Interval.from_quantity_and_semitones(steps + 1, semitones)
 
     @staticmethod
     def from_string(interval):
-        """Creates a new Interval object from a string instead tuples."""
-        if interval not in list(INTERVALS.keys()):
+        """Returns the shared Interval object for a string like 'M3'."""
+        shared = _INTERVALS_BY_NAME.get(interval)
+        if shared is not None:
+            return shared
+
+        quality = interval.rstrip('0123456789')
+        quantity = interval[len(quality):]
+        if not quantity.isdigit():
             raise ValueError(
-                "Interval should be one of %s. Got %s" % (
-                    INTERVALS.keys(),
-                    interval
-                )
+                "Interval should be [quality][quantity], for example M3 "
+                "or P11. Got %s" % interval
             )
 
-        quantity = int(interval[1:])
-        quality = interval[:1]
-
-        return Interval(quality, quantity)
+        return Interval(quality, int(quantity))
 
     def invert(self):
-        """Returns the complimentary interval for the current one."""
-        new_quality = self.quality
-
-        if self.quality == MAJOR:
-            new_quality = MINOR
-        elif self.quality == MINOR:
-            new_quality = MAJOR
-        elif self.quality == AUG:
-            new_quality = DIM
-        elif self.quality == DIM:
-            new_quality = AUG
-
-        new_quantity = 9 - self.quantity
-        return Interval(new_quality, new_quantity)
+        """
+        Returns the complimentary interval for the current one. Compound
+        intervals are inverted by their simple interval, M10 becomes m6.
+        The inversion is the mirror image on the line of fifths.
+        Intervals that span more than an octave (A8, AA7) would invert to a
+        negative interval, so their inversion is an octave higher: A8
+        becomes d8 instead of d1.
+        """
+        quality = quality_of(-self.fifths)
+        quantity = 9 - self.simple_quantity
+        if calc_semitones(quality, quantity) is None:
+            quantity += 7
+
+        return Interval.from_string("%s%s" % (quality, quantity))
+
+
+def calc_semitones(quality, quantity):
+    """
+    Returns the semitones of an interval or None if the quality doesn't
+    exist for the quantity (like a major 5th or a diminished unison)
+    """
+    fifths = interval_fifths(quality, quantity - 1)
+    if fifths is None:
+        return None
+
+    semitones = semitones_of(fifths, quantity - 1)
+    return semitones if semitones >= 0 else None
+
+
+def calc_quality(quantity, semitones):
+    """
+    Returns the quality of the interval with the given quantity and
+    semitones or None if there is none
+    """
+    if quantity < 1 or semitones < 0:
+        return None
+
+    return quality_of(fifths_of(quantity - 1, semitones))
+
+# Shared instances of all intervals up to three octaves
+_INTERVALS_BY_NAME = {
+    "%s%s" % (quality, quantity): Interval(quality, quantity)
+    for quantity in range(1, 23)
+    for quality in QUALITIES
+    if calc_semitones(quality, quantity) is not None
+}
+
+# Shared instances keyed by (quantity, semitones)
+_INTERVALS_BY_QUANTITY_AND_SEMITONES = {
+    (interval.quantity, interval.semitones): interval
+    for interval in _INTERVALS_BY_NAME.values()
+}
+
+"""
+Names of all simple intervals (up to an octave), ordered by quantity and
+semitones
+"""
+SIMPLE_INTERVALS = [
+    interval.name for interval in sorted(
+        _INTERVALS_BY_NAME.values(),
+        key=lambda interval: (interval.quantity, interval.semitones))
+    if interval.quantity <= 8
+]
+
+
+def _find_interval(steps, semitones):
+    """Returns the shared interval for steps and semitones or None"""
+    quality = calc_quality(steps + 1, semitones)
+    if quality is None:
+        return None
+    return Interval.from_string('%s%s' % (quality, steps + 1))
+
+
+def _build_cayley_tables():
+    """
+    Precompute the sums and differences of all pairs of simple intervals.
+    Pairs without a valid result are left out.
+    """
+    sums = {}
+    differences = {}
+    for first in SIMPLE_INTERVALS:
+        first = _INTERVALS_BY_NAME[first]
+        for second in SIMPLE_INTERVALS:
+            second = _INTERVALS_BY_NAME[second]
+            key = (first.name, second.name)
+
+            interval = _find_interval(first.steps + second.steps,
+                                      first.semitones + second.semitones)
+            if interval is not None:
+                sums[key] = interval
+
+            interval = _find_interval(first.steps - second.steps,
+                                      first.semitones - second.semitones)
+            if interval is not None:
+                differences[key] = interval
+
+    return sums, differences
+
+
+# Sums and differences of simple intervals keyed by both interval names
+(_SUMS, _DIFFERENCES) = _build_cayley_tables()
@@ -2,9 +2,14 @@
 import unittest
 from nose.tools import assert_raises
 
+from .music import QUALITIES
 from .note import Note
 from .interval import Interval
 
+# Interval sets its attributes with object.__setattr__, which pylint can't
+# see
+# pylint: disable=no-member
+
 
 class IntervalTest(unittest.TestCase):
     """Interval Test"""
@@ -19,7 +24,7 @@ class IntervalTest(unittest.TestCase):
     def test_invalid_quantity(cls):
         """Test if exceptions is thrown if invalid quantity."""
         assert_raises(ValueError, Interval, "M", 0)
-        assert_raises(ValueError, Interval, "M", 9)
+        assert_raises(ValueError, Interval, "M", -2)
 
     @classmethod
     def test_invalid_interval(cls):
@@ -27,6 +32,10 @@ class IntervalTest(unittest.TestCase):
         assert_raises(ValueError, Interval.from_string, "Q3")
         assert_raises(ValueError, Interval.from_string, "R5")
         assert_raises(ValueError, Interval.from_string, "N9")
+        assert_raises(ValueError, Interval.from_string, "M")
+        assert_raises(ValueError, Interval.from_string, "M12")
+        assert_raises(ValueError, Interval.from_string, "d1")
+        assert_raises(ValueError, Interval.from_string, "dd2")
 
     @classmethod
     def test_new_interval(cls):
@@ -55,6 +64,32 @@ class IntervalTest(unittest.TestCase):
         interval = Interval.from_string("M3")
         assert interval.name == "M3"
 
+    @classmethod
+    def test_interval_equality(cls):
+        """Test comparing and hashing intervals"""
+        assert Interval('M', 3) == Interval.from_string('M3')
+        assert Interval('M', 3) != Interval('m', 3)
+        assert Interval('A', 4) != Interval('d', 5)
+        assert Interval('M', 3) != 'M3'
+
+        assert len({Interval('P', 5), Interval.from_string('P5')}) == 1
+        assert {Interval('m', 6): 1}[Interval.from_string('m6')] == 1
+
+        assert Interval('A', 4).enharmonic_key() \
+            == Interval('d', 5).enharmonic_key()
+        assert Interval('A', 4).spelling_key() \
+            != Interval('d', 5).spelling_key()
+
+    @classmethod
+    def test_interval_immutable(cls):
+        """Test if intervals can't be changed and are shared"""
+        interval = Interval.from_string('M3')
+        assert_raises(AttributeError, setattr, interval, 'quality', 'm')
+        assert_raises(AttributeError, delattr, interval, 'name')
+        assert interval is Interval.from_string('M3')
+        assert interval is Interval.from_quantity_and_semitones(3, 4)
+        assert interval is Note('C').minus_note(Note('E'))
+
     @classmethod
     def test_from_quantity_semitones(cls):
         """Test initialising new interval from quantity and semitones."""
@@ -85,6 +120,111 @@ class IntervalTest(unittest.TestCase):
         interval = Interval.from_string("d6")
         assert interval.invert().name == 'A3'
 
+        interval = Interval.from_string("AA4")
+        assert interval.invert().name == 'dd5'
+
+        interval = Interval.from_string("M10")
+        assert interval.invert().name == 'm6'
+
+        # unisons and octaves
+        assert Interval.from_string('P8').invert().name == 'P1'
+        assert Interval.from_string('d8').invert().name == 'A1'
+        assert Interval.from_string('A1').invert().name == 'd8'
+
+        # there is no d1, A8 is an octave plus an augmented unison
+        assert Interval.from_string('A8').invert().name == 'd8'
+        assert Interval.from_string('A15').invert().name == 'd8'
+        assert Note('C', 5).minus_note(Note('Cb', 4)).invert().name == 'd8'
+
+        # compound and doubly augmented / diminished intervals
+        expected = {'M9': 'm7', 'P11': 'P5', 'A12': 'd4', 'd14': 'A2',
+                    'P15': 'P1', 'd15': 'A1', 'AA8': 'dd8', 'dd8': 'AA1',
+                    'AA1': 'dd8', 'AA11': 'dd5', 'dd13': 'AA3',
+                    'AA22': 'dd8', 'AA7': 'dd9', 'AA14': 'dd9'}
+        for (name, inverted) in expected.items():
+            assert Interval.from_string(name).invert().name == inverted
+
+        # every inversion mirrors the fifths and completes one or two
+        # octaves
+        for quantity in range(1, 23):
+            for quality in QUALITIES:
+                try:
+                    interval = Interval(quality, quantity)
+                except ValueError:
+                    continue
+                inverted = interval.invert()
+                assert inverted.fifths == -interval.fifths
+                assert (interval.semitones + inverted.semitones) % 12 == 0
+                assert interval.simple_quantity + inverted.quantity \
+                    in (9, 16)
+
+    @classmethod
+    def test_compound_intervals(cls):
+        """Test intervals larger than an octave"""
+        assert Interval.from_string("M9").semitones == 14
+        assert Interval.from_string("P11").semitones == 17
+        assert Interval.from_string("M13").semitones == 21
+        assert Interval.from_string("P15").semitones == 24
+        assert Interval.from_string("m17").semitones == 27
+
+        interval = Interval.from_string("M10")
+        assert interval.is_compound
+        assert interval.octaves == 1
+        assert interval.simple is Interval.from_string("M3")
+        assert Interval.from_string("P15").simple.name == 'P8'
+        assert not Interval.from_string("P8").is_compound
+
+        assert Interval.from_quantity_and_semitones(9, 14).name == "M9"
+        assert Interval.from_quantity_and_semitones(16, 26).name == "M16"
+        assert Interval.from_quantity_and_semitones(30, 50) \
+            == Interval("M", 30)
+
+    @classmethod
+    def test_interval_arithmetic(cls):
+        """Test adding and subtracting intervals"""
+        def interval(name):
+            return Interval.from_string(name)
+
+        assert interval('M3') + interval('m3') is interval('P5')
+        assert interval('P5') + interval('P4') is interval('P8')
+        assert interval('M3') + interval('M3') is interval('A5')
+        assert interval('P8') + interval('M3') is interval('M10')
+        assert interval('M9') + interval('m3') is interval('P11')
+        assert interval('P5') - interval('M3') is interval('m3')
+        assert interval('M13') - interval('P8') is interval('M6')
+        assert interval('A4') - interval('A1') is interval('P4')
+
+        assert_raises(LookupError, lambda: interval('M3') - interval('P5'))
+        assert_raises(LookupError, lambda: interval('AA4') + interval('AA4'))
+
+        # the interval between two stacked notes is the sum of both
+        for first in ('m2', 'M3', 'A4', 'P5', 'M7', 'M9'):
+            for second in ('P1', 'm3', 'd5', 'M6', 'P8'):
+                total = Note('C', 4) + interval(first) + interval(second)
+                assert (interval(first) + interval(second)).semitones \
+                    == total.midi_value - Note('C', 4).midi_value
+
+    @classmethod
+    def test_interval_ordering(cls):
+        """Test ordering intervals by semitones and steps"""
+        names = ['P5', 'M3', 'd5', 'A4', 'P1', 'M9', 'm3', 'A2']
+        ordered = sorted(Interval.from_string(name) for name in names)
+        assert [interval.name for interval in ordered] \
+            == ['P1', 'A2', 'm3', 'M3', 'A4', 'd5', 'P5', 'M9']
+        assert Interval.from_string('M3') <= Interval.from_string('M3')
+        assert Interval.from_string('P8') > Interval.from_string('M7')
+        assert_raises(TypeError, lambda: Interval.from_string('M3') < 4)
+
+    @classmethod
+    def test_doubly_augmented_diminished(cls):
+        """Test doubly augmented and doubly diminished intervals"""
+        assert Interval.from_string("AA4").semitones == 7
+        assert Interval.from_string("dd5").semitones == 5
+        assert Interval.from_string("dd7").semitones == 8
+        assert Interval.from_string("AA1").semitones == 2
+        assert Interval.from_quantity_and_semitones(6, 11).name == "AA6"
+        assert Interval.from_quantity_and_semitones(3, 1).name == "dd3"
+
     @classmethod
     def _note_add(cls, root, interval):
         """Add a note to another note"""
@@ -111,12 +251,20 @@ class IntervalTest(unittest.TestCase):
         assert cls._note_add('Eb', 'd3') == 'Gbb'
         assert cls._note_add('D#', 'M3') == 'F##'
         assert cls._note_add('D#', 'd4') == 'G'
+        assert cls._note_add('Cbbbb', 'M3') == 'Ebbbb'
+        assert cls._note_add('E####', 'A7') == 'D######'
 
         # test octave adjustment
         target = Note('B') + Interval.from_string('M2')
         assert target.name == 'C#'
         assert target.octave == 5
 
+        # test compound intervals
+        assert Note('C', 4) + Interval.from_string('M9') is Note.of('D', 5)
+        assert Note('B', 3) + Interval.from_string('A11') is Note.of('E#', 5)
+        assert Note('C', 4) + Interval.from_string('P22') is Note.of('C', 7)
+        assert Note('F', 2) + Interval.from_string('AA4') is Note.of('B#', 2)
+
     @classmethod
     def test_interval_subtraction(cls):
         """Test subtracting INTERVALS from a root note"""
@@ -129,12 +277,18 @@ class IntervalTest(unittest.TestCase):
         assert cls._note_sub('Gbb', 'd3') == 'Eb'
         assert cls._note_sub('F##', 'M3') == 'D#'
         assert cls._note_sub('G', 'd4') == 'D#'
+        assert cls._note_sub('Cbbbb', 'm2') == 'Bbbbb'
 
         # test octave adjustment
         target = Note('D') - Interval.from_string('P5')
         assert target.name == 'G'
         assert target.octave == 3
 
+        # test compound intervals
+        assert Note('D', 5) - Interval.from_string('M9') is Note.of('C', 4)
+        assert Note('A', 4) - Interval.from_string('m13') is Note.of('C#', 3)
+        assert Note('G', 4) - Interval.from_string('dd5') is Note.of('C##', 4)
+
     @classmethod
     def test_interval_roundtrip(cls):
         """Test a whole round trip on INTERVALS"""
@@ -180,6 +334,8 @@ class IntervalTest(unittest.TestCase):
         assert cls._note_minus_note("C", "A#") == "A6"
         assert cls._note_minus_note("C", "B#") == "A7"
         assert cls._note_minus_note("Eb", "G") == "M3"
+        assert cls._note_minus_note("D#", "Fx") == "M3"
+        assert cls._note_minus_note("D#", "F##") == "M3"
 
         # across two octaves
         assert cls._note_minus_note("Bb", "C5") == "M2"
@@ -224,3 +380,13 @@ class IntervalTest(unittest.TestCase):
         assert cls._note_minus_note("C", "Fb3") == "A5"
         assert cls._note_minus_note("C", "Eb3") == "M6"
         assert cls._note_minus_note("C", "Db3") == "M7"
+
+    @classmethod
+    def test_note_minus_note_same_letter(cls):
+        """Note - Note with the same letter or a whole octave apart"""
+        assert cls._note_minus_note("C#", "C") == "A1"
+        assert cls._note_minus_note("C", "C#") == "A1"
+        assert cls._note_minus_note("C#5", "C") == "A8"
+        assert cls._note_minus_note("C", "C2") == "P8"
+        assert cls._note_minus_note("C", "B#2") == "d2"
+        assert cls._note_minus_note("C", "Dbb3") == "A7"
@@ -0,0 +1,169 @@
+"""
+Key Finding Module
+
+Find the most likely key of melodies by comparing their pitch class
+histograms with the Krumhansl-Kessler key profiles. A spelling profile
+separates keys that sound the same, like C# and Db major: notes spelled in
+the key add to its score.
+
+Histograms of many melodies are scored at once, so ranking the keys of a
+whole corpus is a single matrix multiplication.
+"""
+import numpy as np
+
+from .music import NOTE_KEYS, NOTE_POSITIONS
+from .note import Note
+from .keysignature import KeySignature, KEYS
+from .batch import LETTER, ACCIDENTALS, unpack_notes, midi_values
+
+# Krumhansl-Kessler probe tone ratings for major and minor keys, starting at
+# the tonic
+MAJOR_PROFILE = (6.35, 2.23, 3.48, 2.33, 4.38, 4.09,
+                 2.52, 5.19, 2.39, 3.66, 2.29, 2.88)
+MINOR_PROFILE = (6.33, 2.68, 3.52, 5.38, 2.60, 3.53,
+                 2.54, 4.75, 3.98, 2.69, 3.34, 3.17)
+
+"""
+How much spelling a whole melody in a key adds to the correlation of its
+pitch classes (which is in range [-1, 1])
+"""
+SPELLING_WEIGHT = 0.25
+
+"""
+Spellings with up to two accidentals get their own histogram column,
+letter by letter. All other spellings share the last column.
+"""
+SPELLING_ACCIDENTALS = range(-2, 3)
+OTHER_SPELLING = len(NOTE_KEYS) * len(SPELLING_ACCIDENTALS)
+SPELLINGS = OTHER_SPELLING + 1
+
+
+def spelling_columns(letters, accidentals):
+    """
+    Returns the spelling histogram columns for arrays of letter indexes and
+    accidental values
+    """
+    letters = np.asarray(letters, dtype=np.int64)
+    accidentals = np.asarray(accidentals, dtype=np.int64)
+    lowest = SPELLING_ACCIDENTALS[0]
+
+    return np.where(
+        (accidentals >= lowest) & (accidentals <= SPELLING_ACCIDENTALS[-1]),
+        letters * len(SPELLING_ACCIDENTALS) + accidentals - lowest,
+        OTHER_SPELLING)
+
+
+def histograms(notes):
+    """
+    Returns the pitch class histogram of shape (12,) and the spelling
+    histogram of shape (SPELLINGS,) of a list of notes (or note names)
+    """
+    notes = [note if isinstance(note, Note) else Note.of(note)
+             for note in notes]
+
+    pitch_classes = np.bincount(
+        [note.midi_value % 12 for note in notes], minlength=12)
+    spellings = np.bincount(
+        spelling_columns([NOTE_POSITIONS[note.letter] for note in notes],
+                         [note.accidentals.value for note in notes]),
+        minlength=SPELLINGS)
+
+    return pitch_classes.astype(float), spellings.astype(float)
+
+
+def packed_histograms(packed, lengths):
+    """
+    Returns the pitch class histograms of shape (n, 12) and the spelling
+    histograms of shape (n, SPELLINGS) of n melodies. The notes of all
+    melodies are packed into one uint16 array, lengths holds the number of
+    notes of each melody.
+    """
+    lengths = np.asarray(lengths, dtype=np.int64)
+    notes = unpack_notes(packed)
+    melodies = np.repeat(np.arange(len(lengths)), lengths)
+
+    pitch_classes = np.bincount(
+        melodies * 12 + midi_values(notes).astype(np.int64) % 12,
+        minlength=len(lengths) * 12)
+    spellings = np.bincount(
+        melodies * SPELLINGS
+        + spelling_columns(notes[:, LETTER], notes[:, ACCIDENTALS]),
+        minlength=len(lengths) * SPELLINGS)
+
+    return (pitch_classes.reshape(len(lengths), 12).astype(float),
+            spellings.reshape(len(lengths), SPELLINGS).astype(float))
+
+
+def score(pitch_classes, spellings=None):
+    """
+    Score all keys for pitch class histograms of shape (n, 12) and optional
+    spelling histograms of shape (n, SPELLINGS). Returns an array of shape
+    (n, len(KEYS)), columns are in the order of KEYS.
+    A single histogram of shape (12,) returns a score for each key.
+    """
+    pitch_classes = np.asarray(pitch_classes, dtype=float)
+    single = pitch_classes.ndim == 1
+    pitch_classes = np.atleast_2d(pitch_classes)
+
+    # correlation with all profiles in one matrix multiplication
+    centered = pitch_classes - pitch_classes.mean(axis=1, keepdims=True)
+    norms = np.linalg.norm(centered, axis=1, keepdims=True)
+    scores = (centered / np.where(norms == 0, 1, norms)) @ _PROFILES.T
+
+    if spellings is not None:
+        spellings = np.atleast_2d(np.asarray(spellings, dtype=float))
+        totals = spellings.sum(axis=1, keepdims=True)
+        scores += SPELLING_WEIGHT * (spellings @ KEY_SPELLINGS.T) \
+            / np.where(totals == 0, 1, totals)
+
+    return scores[0] if single else scores
+
+
+def rank(pitch_classes, spellings=None):
+    """
+    Returns the indexes of KEYS ranked from the most to the least likely
+    key for each histogram
+    """
+    return np.argsort(-score(pitch_classes, spellings), axis=-1,
+                      kind='mergesort')
+
+
+def find_key(notes):
+    """
+    Returns all (key signature, score) pairs for a melody, the most likely
+    key first
+    """
+    (pitch_classes, spellings) = histograms(notes)
+    scores = score(pitch_classes, spellings)
+    return [(KeySignature.of(KEYS[index]), float(scores[index]))
+            for index in rank(pitch_classes, spellings)]
+
+
+def _build_profiles():
+    """
+    Build the normalised pitch class profiles, the spellings and the pitch
+    classes of all keys
+    """
+    profiles = np.zeros((len(KEYS), 12))
+    key_spellings = np.zeros((len(KEYS), SPELLINGS))
+    key_pitch_classes = np.zeros((len(KEYS), 12), dtype=bool)
+
+    for (index, key) in enumerate(KEYS):
+        keysig = KeySignature.of(key)
+        profile = MINOR_PROFILE if keysig.is_minor else MAJOR_PROFILE
+        profiles[index] = np.roll(profile, keysig.tonic.midi_value % 12)
+
+        for name in keysig.notes:
+            note = Note.of(name)
+            key_spellings[index, spelling_columns(
+                NOTE_POSITIONS[note.letter], note.accidentals.value)] = 1
+            key_pitch_classes[index, note.midi_value % 12] = True
+
+    profiles -= profiles.mean(axis=1, keepdims=True)
+    profiles /= np.linalg.norm(profiles, axis=1, keepdims=True)
+    return profiles, key_spellings, key_pitch_classes
+
+
+# Centred, unit length profiles of all keys and which spellings and pitch
+# classes belong to each key. Rows are in the order of KEYS.
+(_PROFILES, KEY_SPELLINGS, KEY_PITCH_CLASSES) = _build_profiles()
@@ -0,0 +1,69 @@
+"""Key Finding Test"""
+import unittest
+
+import numpy as np
+
+from .interval import Interval
+from .keysignature import KeySignature, KEYS
+from .batch import encode_notes, pack_notes
+from .note import parse_notes
+from .keyfinding import histograms, packed_histograms, score, rank, \
+    find_key, SPELLINGS
+
+MINOR_SECOND = Interval.from_string('m2')
+
+
+class KeyFindingTest(unittest.TestCase):
+    """Key Finding Test"""
+
+    @classmethod
+    def test_scales(cls):
+        """Test if every key is found for its own scale and tonic"""
+        for key in KEYS:
+            keysig = KeySignature.of(key)
+            tonic = keysig.tonic.letter + keysig.tonic.accidentals.accidentals
+            melody = [tonic] + keysig.notes + [tonic]
+            if keysig.is_minor:
+                # the raised leading tone of harmonic minor
+                melody += [(keysig.tonic - MINOR_SECOND).name, tonic]
+            assert find_key(melody)[0][0] is keysig, key
+
+    @classmethod
+    def test_enharmonic_keys(cls):
+        """Test if spelling separates keys that sound the same"""
+        sharps = ['C#', 'D#', 'E#', 'F#', 'G#', 'A#', 'B#', 'C#']
+        flats = ['Db', 'Eb', 'F', 'Gb', 'Ab', 'Bb', 'C', 'Db']
+        assert find_key(sharps)[0][0].key == 'C#'
+        assert find_key(flats)[0][0].key == 'Db'
+
+        (pitch_classes, _) = histograms(sharps)
+        scores = score(pitch_classes)
+        assert scores[KEYS.index('C#')] == scores[KEYS.index('Db')]
+
+    @classmethod
+    def test_batch(cls):
+        """Test scoring many melodies at once"""
+        melodies = ['C D E F G A B C', 'A B C D E F G# A', 'E F# G A B E']
+        notes = [parse_notes(melody) for melody in melodies]
+        packed = pack_notes(encode_notes(
+            [note for melody in notes for note in melody]))
+        (pitch_classes, spellings) = packed_histograms(
+            packed, [len(melody) for melody in notes])
+
+        assert pitch_classes.shape == (3, 12)
+        assert spellings.shape == (3, SPELLINGS)
+        for (index, melody) in enumerate(notes):
+            (single_pitch_classes, single_spellings) = histograms(melody)
+            assert np.array_equal(pitch_classes[index], single_pitch_classes)
+            assert np.array_equal(spellings[index], single_spellings)
+
+        ranked = rank(pitch_classes, spellings)
+        assert ranked.shape == (3, len(KEYS))
+        assert [KEYS[keys[0]] for keys in ranked] == ['C', 'a', 'e']
+
+    @classmethod
+    def test_empty(cls):
+        """Test if empty melodies don't break scoring"""
+        scores = score(np.zeros((2, 12)), np.zeros((2, SPELLINGS)))
+        assert scores.shape == (2, len(KEYS))
+        assert not np.any(np.isnan(scores))
@@ -1,61 +1,110 @@
 """Key Signature Module"""
-import re
-
-from .music import CIRCLE_OF_FIFTHS
-from .accidentals import Accidentals
-from .interval import Interval
+from .accidentals import Accidentals, accidentals_from_value
+from .parser import parse_key
 from .note import Note
+from .fifths import note_fifths, letter_of, accidentals_of
+
+# Fifths of every degree above the tonic in major and (natural) minor keys.
+# Both are seven neighbouring fifths: one below to five above the major
+# tonic, the minor tonic sits three fifths above it.
+MAJOR_DEGREES = (0, 2, 4, -1, 1, 3, 5)
+MINOR_DEGREES = (0, 2, -3, -1, 1, -4, -2)
+RELATIVE_MINOR = 3
+
+"""
+The most sharps or flats of a key in the circle of fifths
+"""
+MAX_SHARPS = 7
 
 
 class KeySignature:
-    """Key Signature Class"""
+    """
+    Key Signature Class
+
+    Use `KeySignature.of` to get a shared instance. Related keys are only
+    calculated when they're accessed.
+    Keys are positions on the line of fifths, so theoretical keys like G#
+    major (8 sharps) or Fb major (8 flats) work like any other key.
+    `sharps` is the number of sharps of the key signature, negative for
+    flats.
+    """
 
     def __init__(self, key):
         self.key = key
+        self._related_keys = {}
 
-        # Regex for key signature syntax
-        match = re.search('^([a-gA-G])([#b]?)$', key)
+        (letter, value, is_minor) = parse_key(key)
+        accidentals = accidentals_from_value(value)
 
-        if match:
-            self.letter = match.group(1)
-            self.accidentals = Accidentals(match.group(2) or '')
-            self.is_minor = self.letter.islower()
-            self.tonic = Note(key.upper())
-        else:
-            raise ValueError(
-                "Key Signature Invalid. Must be [a-gA-G]([#b]?). Got %s",
-                self.key
-            )
+        self.letter = letter
+        self.accidentals = Accidentals(accidentals, value)
+        self.is_minor = is_minor
+        self.tonic = Note.of(letter.upper() + accidentals)
+        self.fifths = note_fifths(letter.upper(), value)
+        self.sharps = self.fifths - RELATIVE_MINOR if is_minor \
+            else self.fifths
 
         notes = self._get_key_notes()
         self.notes = notes
         self.natural_notes = list(filter(lambda note: len(note) == 1, notes))
         self.altered_notes = list(filter(lambda note: len(note) > 1, notes))
 
-        # calculate relative minor, parallel, dominant and subdominant key
-        self.relative_key = self._calc_relative_key()
-        self.parallel_key = self._calc_parallel_key()
-        self.dominant_key = self._calc_dominant_key()
-        self.subdominant_key = self._calc_subdominant_key()
+    @staticmethod
+    def of(key):
+        """Returns a shared key signature for the given key"""
+        keysig = _KEY_SIGNATURES.get(key)
+        if keysig is None:
+            keysig = _KEY_SIGNATURES.setdefault(key, KeySignature(key))
+        return keysig
 
-    def _get_key_notes(self):
+    def __contains__(self, note):
         """
-        Get the correct notes for this key. If it's a minor key we need to get
-        the correct major key (minor 3rd up) and rotate the notes to start on
-        the correct note.
+        Returns true if a note (or note name) is spelled like one of the
+        notes of this key
         """
-        if self.is_minor:
-            major = self.tonic + Interval.from_string("m3")
-            notes = CIRCLE_OF_FIFTHS[major.name]
-            return notes[5:] + notes[:5]
+        note = note if isinstance(note, Note) else Note.of(note)
+        return self.sharps - 1 <= note.fifths <= self.sharps + 5
+
+    @property
+    def relative_key(self):
+        """Relative minor / major key"""
+        return self._get_related_key('relative', self._calc_relative_key)
 
-        return CIRCLE_OF_FIFTHS[self.key]
+    @property
+    def parallel_key(self):
+        """Parallel minor / major key"""
+        return self._get_related_key('parallel', self._calc_parallel_key)
+
+    @property
+    def dominant_key(self):
+        """Dominant key"""
+        return self._get_related_key('dominant', self._calc_dominant_key)
+
+    @property
+    def subdominant_key(self):
+        """Subdominant key"""
+        return self._get_related_key('subdominant',
+                                     self._calc_subdominant_key)
+
+    def _get_related_key(self, relation, calc):
+        """Returns a related key, calculating it on first access"""
+        if relation not in self._related_keys:
+            self._related_keys[relation] = calc()
+        return self._related_keys[relation]
+
+    def _get_key_notes(self):
+        """
+        Get the correct notes for this key, starting on the tonic. Every
+        degree is a fixed number of fifths away from the tonic.
+        """
+        degrees = MINOR_DEGREES if self.is_minor else MAJOR_DEGREES
+        return [_spell(self.fifths + degree) for degree in degrees]
 
     def _calc_relative_key(self):
         """Calculate the relative key which is a minor 3rd below / above"""
-        min3 = Interval.from_string("m3")
-        target = self.tonic + min3 if self.is_minor else self.tonic - min3
-        return target.name if self.is_minor else target.name.lower()
+        if self.is_minor:
+            return _key_name(self.fifths - RELATIVE_MINOR, False)
+        return _key_name(self.fifths + RELATIVE_MINOR, True)
 
     def _calc_parallel_key(self):
         """Calculate the parallel key."""
@@ -63,11 +112,56 @@ class KeySignature:
         return target + self.accidentals.accidentals
 
     def _calc_dominant_key(self):
-        """Calculate dominant key. Perfect 5th above tonic of this key"""
-        target = self.tonic + Interval.from_string("P5")
-        return target.name.lower() if self.is_minor else target.name
+        """Calculate dominant key. One fifth above the tonic of this key"""
+        return _key_name(self.fifths + 1, self.is_minor)
 
     def _calc_subdominant_key(self):
-        """Calculate subdominant key. Perfect 4th above tonic of this key"""
-        target = self.tonic + Interval.from_string("P4")
-        return target.name.lower() if self.is_minor else target.name
+        """Calculate subdominant key. One fifth below the tonic of this key"""
+        return _key_name(self.fifths - 1, self.is_minor)
+
+
+def _spell(fifths):
+    """Returns the note name at a position on the line of fifths"""
+    return letter_of(fifths) + accidentals_from_value(accidentals_of(fifths))
+
+
+def _key_name(fifths, is_minor):
+    """Returns the name of the key with its tonic at a number of fifths"""
+    name = _spell(fifths)
+    return name.lower() if is_minor else name
+
+
+def _build_key_graph():
+    """
+    Build a graph of all major and minor keys. Each key maps to its relative,
+    parallel, dominant and subdominant key.
+    """
+    graph = {}
+    # sharp keys first, then flat keys, like the circle of fifths
+    majors = [_key_name(sharps, False)
+              for sharps in list(range(MAX_SHARPS + 1))
+              + list(range(-MAX_SHARPS, 0))]
+    minors = [KeySignature.of(key).relative_key for key in majors]
+
+    for key in majors + minors:
+        keysig = KeySignature.of(key)
+        graph[key] = {
+            'relative': keysig.relative_key,
+            'parallel': keysig.parallel_key,
+            'dominant': keysig.dominant_key,
+            'subdominant': keysig.subdominant_key
+        }
+    return graph
+
+
+# KeySignature.of is used while the graph is built
+_KEY_SIGNATURES = {}
+
+"""
+All 15 major and 15 minor keys with their related keys. Related keys that
+aren't part of the circle of fifths (e.g. the dominant of C#, G#) are
+included, but aren't nodes themselves. They're theoretical keys, which
+KeySignature.of still accepts.
+"""
+KEY_GRAPH = _build_key_graph()
+KEYS = list(KEY_GRAPH.keys())
@@ -2,7 +2,8 @@
 import unittest
 from nose.tools import assert_raises
 
-from .keysignature import KeySignature
+from .note import Note
+from .keysignature import KeySignature, KEY_GRAPH, KEYS
 
 class KeySignatureTest(unittest.TestCase):
     """Key Signatures Test"""
@@ -49,3 +50,96 @@ class KeySignatureTest(unittest.TestCase):
         assert keysig.parallel_key == 'F'
         assert keysig.dominant_key == 'c'
         assert keysig.subdominant_key == 'bb'
+
+    @classmethod
+    def test_flat_keys(cls):
+        """Test keys with a flat tonic"""
+        keysig = KeySignature('Cb')
+        assert keysig.tonic.name == 'Cb'
+        assert keysig.relative_key == 'ab'
+
+        keysig = KeySignature('bb')
+        assert keysig.notes == ['Bb', 'C', 'Db', 'Eb', 'F', 'Gb', 'Ab']
+        assert keysig.relative_key == 'Db'
+
+    @classmethod
+    def test_shared_key_signatures(cls):
+        """Test if KeySignature.of returns shared instances"""
+        assert KeySignature.of('A') is KeySignature.of('A')
+        assert KeySignature.of('A') is not KeySignature.of('a')
+        assert KeySignature.of('f').notes == KeySignature('f').notes
+        assert_raises(ValueError, KeySignature.of, 'Gx')
+
+    @classmethod
+    def test_lazy_related_keys(cls):
+        """Test if related keys are only calculated when accessed"""
+        # pylint: disable=protected-access
+        keysig = KeySignature('D')
+        assert not keysig._related_keys
+        assert keysig.dominant_key == 'A'
+        assert list(keysig._related_keys) == ['dominant']
+
+    @classmethod
+    def test_key_graph(cls):
+        """Test the graph of all keys"""
+        assert len(KEYS) == 30
+        assert len([key for key in KEYS if key.islower()]) == 15
+
+        assert KEY_GRAPH['A'] == {
+            'relative': 'f#',
+            'parallel': 'a',
+            'dominant': 'E',
+            'subdominant': 'D'
+        }
+
+        # walk the circle of fifths
+        key = 'C'
+        for _ in range(7):
+            key = KEY_GRAPH[key]['dominant']
+        assert key == 'C#'
+
+        for key in KEYS:
+            relative = KEY_GRAPH[key]['relative']
+            assert KEY_GRAPH[relative]['relative'] == key
+
+    @classmethod
+    def test_theoretical_keys(cls):
+        """Test keys with more than 7 sharps or flats"""
+        keysig = KeySignature('G#')
+        assert keysig.sharps == 8
+        assert keysig.notes == ['G#', 'A#', 'B#', 'C#', 'D#', 'E#', 'F##']
+        assert keysig.relative_key == 'e#'
+        assert keysig.dominant_key == 'D#'
+
+        keysig = KeySignature('Fb')
+        assert keysig.sharps == -8
+        assert keysig.notes == ['Fb', 'Gb', 'Ab', 'Bbb', 'Cb', 'Db', 'Eb']
+        assert keysig.relative_key == 'db'
+        assert keysig.subdominant_key == 'Bbb'
+
+        assert KeySignature('db').notes \
+            == ['Db', 'Eb', 'Fb', 'Gb', 'Ab', 'Bbb', 'Cb']
+
+    @classmethod
+    def test_sharps(cls):
+        """Test the number of sharps or flats of keys"""
+        assert KeySignature('C').sharps == 0
+        assert KeySignature('a').sharps == 0
+        assert KeySignature('C#').sharps == 7
+        assert KeySignature('eb').sharps == -6
+
+        for key in KEYS:
+            keysig = KeySignature.of(key)
+            assert abs(keysig.sharps) == len(keysig.altered_notes)
+
+    @classmethod
+    def test_contains(cls):
+        """Test if notes are spelled like the notes of a key"""
+        keysig = KeySignature('E')
+        assert 'G#' in keysig
+        assert Note.of('D#', 2) in keysig
+        assert 'Ab' not in keysig
+        assert 'G' not in keysig
+
+        assert 'Bb' in KeySignature('d')
+        assert 'F##' in KeySignature('G#')
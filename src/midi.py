@@ -0,0 +1,412 @@
+"""
+MIDI Module
+
+Pure Python reader and writer for Standard MIDI Files.
+
+The reader streams: tracks are read in blocks and events are yielded one by
+one, so files of any size can be processed without loading all events.
+Note numbers are spelled as notes, using the key signature meta events of
+the file where they're known.
+"""
+from bisect import bisect_right
+import struct
+
+from .music import NOTES, NOTES_BY_SEMITONES, SHARP
+from .accidentals import accidentals_from_value
+from .note import Note
+from .keysignature import KeySignature, KEYS, MAX_SHARPS
+
+NOTE_OFF = 0x80
+NOTE_ON = 0x90
+META = 0xFF
+SYSEX = 0xF0
+SYSEX_ESCAPE = 0xF7
+
+KEY_SIGNATURE = 0x59
+END_OF_TRACK = 0x2F
+
+DEFAULT_TICKS_PER_BEAT = 480
+DEFAULT_VELOCITY = 64
+
+"""
+Keyword options of write_midi
+"""
+WRITE_OPTIONS = ('duration', 'velocity', 'ticks_per_beat')
+
+_HEADER = struct.Struct('>4sIHHH')
+_CHUNK = struct.Struct('>4sI')
+_BLOCK_SIZE = 64 * 1024
+
+# Number of data bytes of channel messages by their status (upper 4 bits)
+_DATA_BYTES = {0x8: 2, 0x9: 2, 0xA: 2, 0xB: 2, 0xC: 1, 0xD: 1, 0xE: 2}
+
+"""
+Spellings of all pitch classes without a key
+"""
+DEFAULT_SPELLINGS = ('C', 'C#', 'D', 'Eb', 'E', 'F',
+                     'F#', 'G', 'Ab', 'A', 'Bb', 'B')
+
+
+def read_midi(source, key=None):
+    """
+    Yields (tick, track, channel, note, velocity) for every note on and
+    note off event of a MIDI file (a path or a binary file object). Ticks
+    are absolute, note off events have velocity 0 and notes are spelled in
+    the key that's active at their tick. Notes before the first key
+    signature of the file are spelled in key (a key signature or key name,
+    which can be a theoretical key like G#) if one is given.
+    """
+    if isinstance(source, str):
+        with open(source, 'rb') as midi_file:
+            for event in read_midi(midi_file, key):
+                yield event
+        return
+
+    (tracks, _) = _read_header(source)
+
+    # key changes of all tracks read so far, sorted by tick
+    key_ticks = []
+    keys = []
+
+    for track in range(tracks):
+        for (tick, status, data) in _read_track(source):
+            kind = status & 0xF0
+
+            if kind in (NOTE_ON, NOTE_OFF):
+                position = bisect_right(key_ticks, tick)
+                velocity = data[1] if kind == NOTE_ON else 0
+                yield (tick, track, status & 0x0F,
+                       spell(data[0], keys[position - 1] if position else key),
+                       velocity)
+
+            elif status == KEY_SIGNATURE and len(data) >= 2:
+                position = bisect_right(key_ticks, tick)
+                key_ticks.insert(position, tick)
+                keys.insert(position, key_from_midi(
+                    struct.unpack('b', data[:1])[0], data[1]))
+
+
+def spell(number, key=None):
+    """
+    Returns the shared note for a MIDI note number, spelled in the key
+    signature (or key name) if one is given
+    """
+    spellings = _get_spellings(key)
+    (letter, accidental_val) = spellings[number % 12]
+    octave = (number - NOTES[letter][1] - accidental_val) // 12 - 1
+    return Note.of(letter + accidentals_from_value(accidental_val), octave)
+
+
+def key_from_midi(sharps, minor):
+    """
+    Returns the key signature of a key signature meta event: the number of
+    sharps (negative for flats) and 1 for minor keys
+    """
+    key = _KEYS_BY_SHARPS.get((sharps, bool(minor)))
+    if key is None:
+        raise ValueError("Invalid key signature: %s sharps, minor: %s" % (
+            sharps, minor))
+    return KeySignature.of(key)
+
+
+def key_to_midi(key):
+    """
+    Returns the (sharps, minor) of a key signature (or key name). Raises a
+    ValueError for theoretical keys, which MIDI files can't store.
+    """
+    keysig = key if isinstance(key, KeySignature) else KeySignature.of(key)
+    if abs(keysig.sharps) > MAX_SHARPS:
+        raise ValueError("Key %s has no MIDI key signature" % keysig.key)
+    return keysig.sharps, int(keysig.is_minor)
+
+
+class MidiWriter:
+    """
+    MIDI Writer Class
+
+    Streams events of a single track (format 0) to a file. Events must be
+    added in order of their ticks. Use it as a context manager.
+    """
+
+    def __init__(self, path, ticks_per_beat=DEFAULT_TICKS_PER_BEAT):
+        self._file = open(path, 'wb')
+        self._file.write(_HEADER.pack(b'MThd', 6, 0, 1, ticks_per_beat))
+        self._file.write(_CHUNK.pack(b'MTrk', 0))
+        self._track_start = self._file.tell()
+        self._tick = 0
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+    def key_signature(self, tick, key):
+        """Add a key signature (or key name) at a tick"""
+        (sharps, minor) = key_to_midi(key)
+        self._event(tick, bytes([META, KEY_SIGNATURE, 2, sharps & 0xFF,
+                                 minor]))
+
+    def note_on(self, tick, note, velocity=DEFAULT_VELOCITY, channel=0):
+        """Add a note on event for a note (or note name)"""
+        self._event(tick, bytes([NOTE_ON | channel, _number(note), velocity]))
+
+    def note_off(self, tick, note, channel=0):
+        """Add a note off event for a note (or note name)"""
+        self._event(tick, bytes([NOTE_OFF | channel, _number(note), 0]))
+
+    def close(self):
+        """Write the end of the track and close the file"""
+        if self._file.closed:
+            return
+
+        self._event(self._tick, bytes([META, END_OF_TRACK, 0]))
+        length = self._file.tell() - self._track_start
+        self._file.seek(self._track_start - _CHUNK.size)
+        self._file.write(_CHUNK.pack(b'MTrk', length))
+        self._file.close()
+
+    def _event(self, tick, message):
+        """Write an event with the delta time to the previous one"""
+        if tick < self._tick:
+            raise ValueError("Events must be in order. Got tick %s after %s"
+                             % (tick, self._tick))
+
+        self._file.write(_write_variable_length(tick - self._tick) + message)
+        self._tick = tick
+
+
+def write_midi(path, notes, key=None, **options):
+    """
+    Write a melody (a list of notes or note names) to a MIDI file. The key
+    signature is written if one is given. Options are duration (ticks per
+    note, one beat by default), velocity and ticks_per_beat.
+    """
+    unknown = set(options) - set(WRITE_OPTIONS)
+    if unknown:
+        raise TypeError("Unknown options %s. Options are %s" % (
+            sorted(unknown), WRITE_OPTIONS))
+
+    ticks_per_beat = options.get('ticks_per_beat', DEFAULT_TICKS_PER_BEAT)
+    duration = options.get('duration', ticks_per_beat)
+    velocity = options.get('velocity', DEFAULT_VELOCITY)
+
+    with MidiWriter(path, ticks_per_beat) as writer:
+        if key is not None:
+            writer.key_signature(0, key)
+
+        tick = 0
+        for note in notes:
+            writer.note_on(tick, note, velocity)
+            tick += duration
+            writer.note_off(tick, note)
+
+
+def _read_header(source):
+    """Returns the number of tracks and the ticks per beat of a file"""
+    header = source.read(_HEADER.size)
+    if len(header) < _HEADER.size:
+        raise ValueError("Not a MIDI file")
+
+    (chunk, length, _, tracks, ticks_per_beat) = _HEADER.unpack(header)
+    if chunk != b'MThd' or length < 6:
+        raise ValueError("Not a MIDI file")
+
+    # skip unknown header fields of future versions
+    source.read(length - 6)
+    return tracks, ticks_per_beat
+
+
+def _read_track(source):
+    """
+    Yields (tick, status, data) for all events of the next track. Meta
+    events have their type as status. Chunks that aren't tracks are skipped.
+    """
+    data = _read_bytes(source, _find_track(source))
+    tick = 0
+    running_status = None
+
+    for byte in data:
+        tick += _read_delta(byte, data)
+        status = _next(data)
+
+        if status == META:
+            # meta and sysex events cancel the running status
+            running_status = None
+            meta_type = _next(data)
+            yield tick, meta_type, _read_data(data)
+            if meta_type == END_OF_TRACK:
+                break
+
+        elif status in (SYSEX, SYSEX_ESCAPE):
+            running_status = None
+            _read_data(data)
+
+        else:
+            (running_status, message) = _read_message(
+                status, running_status, data)
+            yield tick, running_status, message
+
+    # skip whatever is left of the track after the end of track event
+    for _ in data:
+        pass
+
+
+def _find_track(source):
+    """Skip chunks up to the next track. Returns the length of the track"""
+    while True:
+        header = source.read(_CHUNK.size)
+        if len(header) < _CHUNK.size:
+            raise ValueError("MIDI file is truncated")
+
+        (chunk, length) = _CHUNK.unpack(header)
+        if chunk == b'MTrk':
+            return length
+        source.read(length)
+
+
+def _read_delta(byte, data):
+    """Returns the delta time of an event starting with a byte"""
+    delta = byte & 0x7F
+    while byte & 0x80:
+        byte = _next(data)
+        delta = (delta << 7) | (byte & 0x7F)
+    return delta
+
+
+def _read_message(status, running_status, data):
+    """
+    Returns the status and the data bytes of a channel message. A status
+    below 0x80 is the first data byte of a message with running status.
+    """
+    if status < 0x80:
+        if running_status is None:
+            raise ValueError("Invalid MIDI event without status")
+        first = status
+        status = running_status
+    else:
+        first = _next(data)
+
+    if _DATA_BYTES.get(status >> 4) == 2:
+        return status, (first, _next(data))
+    return status, (first,)
+
+
+def _read_bytes(source, length):
+    """Yields the next length bytes of a file, reading them in blocks"""
+    while length > 0:
+        block = source.read(min(length, _BLOCK_SIZE))
+        if not block:
+            raise ValueError("MIDI file is truncated")
+        length -= len(block)
+        for byte in block:
+            yield byte
+
+
+def _next(data):
+    """Returns the next byte of a track"""
+    byte = next(data, None)
+    if byte is None:
+        raise ValueError("MIDI track is truncated")
+    return byte
+
+
+def _read_data(data):
+    """Read variable length data of meta and sysex events"""
+    length = 0
+    byte = 0x80
+    while byte & 0x80:
+        byte = _next(data)
+        length = (length << 7) | (byte & 0x7F)
+    return bytes(_next(data) for _ in range(length))
+
+
+def _write_variable_length(value):
+    """Returns a value as a MIDI variable length quantity"""
+    result = [value & 0x7F]
+    value >>= 7
+    while value:
+        result.append((value & 0x7F) | 0x80)
+        value >>= 7
+    return bytes(reversed(result))
+
+
+def _number(note):
+    """Returns the MIDI note number of a note (or note name)"""
+    note = note if isinstance(note, Note) else Note.of(note)
+    if not 0 <= note.midi_value <= 127:
+        raise ValueError("Note %r is out of the MIDI range" % note)
+    return note.midi_value
+
+
+def _get_spellings(key):
+    """
+    Returns (letter, accidental value) for all 12 pitch classes in a key.
+    Notes of the key are spelled like in the key and minor keys raise their
+    6th and 7th degree. Other notes are natural if possible, else a single
+    sharp in sharp keys and a single flat in flat keys, also in theoretical
+    keys like G#.
+    """
+    if key is None:
+        return _DEFAULT_SPELLINGS
+
+    keysig = key if isinstance(key, KeySignature) else KeySignature.of(key)
+    spellings = _SPELLINGS.get(keysig.key)
+    if spellings is not None:
+        return spellings
+
+    in_key = {}
+    for name in keysig.notes:
+        note = Note.of(name)
+        in_key[note.midi_value % 12] = (note.letter, note.accidentals.value)
+
+    tonic = keysig.tonic.midi_value % 12
+    raised = {(tonic + 9) % 12, (tonic + 11) % 12} if keysig.is_minor \
+        else set()
+    sharps = keysig.sharps
+
+    spellings = []
+    for pitch_class in range(12):
+        if pitch_class in in_key:
+            spellings.append(in_key[pitch_class])
+        elif pitch_class in raised:
+            (letter, value) = in_key[(pitch_class - 1) % 12]
+            spellings.append((letter, value + 1))
+        elif pitch_class in NOTES_BY_SEMITONES:
+            spellings.append((NOTES_BY_SEMITONES[pitch_class], 0))
+        elif sharps > 0:
+            spellings.append(_SHARP_SPELLINGS[pitch_class])
+        elif sharps < 0:
+            spellings.append(_FLAT_SPELLINGS[pitch_class])
+        else:
+            spellings.append(_DEFAULT_SPELLINGS[pitch_class])
+
+    return _SPELLINGS.setdefault(keysig.key, tuple(spellings))
+
+
+_DEFAULT_SPELLINGS = tuple(
+    (name[0], len(name) - 1 if name[1:] == SHARP else 1 - len(name))
+    for name in DEFAULT_SPELLINGS
+)
+
+# Single sharp and single flat spellings of the pitch classes between the
+# naturals, like C# and Db
+_SHARP_SPELLINGS = {
+    pitch_class: (NOTES_BY_SEMITONES[pitch_class - 1], 1)
+    for pitch_class in range(1, 12)
+    if pitch_class not in NOTES_BY_SEMITONES
+}
+_FLAT_SPELLINGS = {
+    pitch_class: (NOTES_BY_SEMITONES[pitch_class + 1], -1)
+    for pitch_class in range(1, 12)
+    if pitch_class not in NOTES_BY_SEMITONES
+}
+
+# Spellings of all pitch classes keyed by key name, filled on first use
+_SPELLINGS = {}
+
+# Key names keyed by (sharps, minor)
+_KEYS_BY_SHARPS = {
+    (KeySignature.of(key).sharps, KeySignature.of(key).is_minor): key
+    for key in KEYS
+}
@@ -0,0 +1,138 @@
+"""MIDI Test"""
+import io
+import os
+import tempfile
+import unittest
+from nose.tools import assert_raises
+
+from .note import Note
+from .keysignature import KeySignature
+from .midi import read_midi, write_midi, spell, key_from_midi, \
+    key_to_midi, MidiWriter
+
+# format 1, two tracks: a conductor track with D major from tick 0 and
+# e flat minor from tick 200, and a track of notes using running status
+TWO_TRACKS = bytes.fromhex(
+    '4d546864' '00000006' '0001' '0002' '0060'
+    '4d54726b00000011'
+    '00ff59020200'
+    '8148ff5902fa01'
+    '00ff2f00'
+    '4d54726b00000019'
+    '00903e40'
+    '004240'
+    '8164903e00'
+    '00804200'
+    '8100904640'
+    '00ff2f00'
+)
+
+
+class MidiTest(unittest.TestCase):
+    """MIDI Test"""
+
+    def setUp(self):
+        (handle, self.path) = tempfile.mkstemp(suffix='.mid')
+        os.close(handle)
+
+    def tearDown(self):
+        os.remove(self.path)
+
+    def test_roundtrip(self):
+        """Test if written notes are read back with their spelling"""
+        melody = ['C#', 'E#', 'G#', Note('B#', 4)]
+        write_midi(self.path, melody, key='C#', duration=240)
+
+        events = list(read_midi(self.path))
+        assert len(events) == 8
+        assert [(tick, velocity) for (tick, _, _, _, velocity)
+                in events[:3]] == [(0, 64), (240, 0), (240, 64)]
+        assert [note for (_, _, _, note, velocity) in events if velocity] \
+            == [Note.of('C#'), Note.of('E#'), Note.of('G#'), Note.of('B#')]
+        assert [note.name for (_, _, _, note, _) in events][::2] \
+            == ['C#', 'E#', 'G#', 'B#']
+
+        write_midi(self.path, melody[:2], velocity=100, ticks_per_beat=96)
+        assert [(tick, velocity) for (tick, _, _, _, velocity)
+                in read_midi(self.path)] \
+            == [(0, 100), (96, 0), (96, 100), (192, 0)]
+        assert_raises(TypeError, write_midi, self.path, melody, speed=2)
+
+    def test_read_tracks(self):
+        """Test key changes of other tracks and running status"""
+        events = list(read_midi(io.BytesIO(TWO_TRACKS)))
+        assert [(tick, track, note.name, note.octave, velocity)
+                for (tick, track, _, note, velocity) in events] == [
+                    (0, 1, 'D', 4, 64),
+                    (0, 1, 'F#', 4, 64),
+                    (228, 1, 'D', 4, 0),
+                    (228, 1, 'Gb', 4, 0),
+                    (356, 1, 'Bb', 4, 64),
+                ]
+
+    def test_theoretical_keys(self):
+        """Test reading a file in keys that MIDI can't store"""
+        write_midi(self.path, ['C', 'C#', 'D', 'D#', 'E', 'F',
+                               'F#', 'G', 'G#', 'A', 'A#', 'B'])
+
+        names = [note.name for (_, _, _, note, velocity)
+                 in read_midi(self.path, 'G#') if velocity]
+        assert names == ['B#', 'C#', 'D', 'D#', 'E', 'E#',
+                         'F#', 'F##', 'G#', 'A', 'A#', 'B']
+
+        names = [note.name for (_, _, _, note, velocity)
+                 in read_midi(self.path, 'Fb') if velocity]
+        assert names == ['C', 'Db', 'D', 'Eb', 'Fb', 'F',
+                         'Gb', 'G', 'Ab', 'Bbb', 'Bb', 'Cb']
+
+    def test_streaming(self):
+        """Test if events are yielded before the whole file is read"""
+        with MidiWriter(self.path) as writer:
+            for tick in range(20000):
+                writer.note_on(tick, 'A')
+
+        with open(self.path, 'rb') as midi_file:
+            events = read_midi(midi_file)
+            assert next(events)[3] is Note.of('A')
+            assert midi_file.tell() < os.path.getsize(self.path)
+
+    def test_invalid(self):
+        """Test if exceptions are thrown for invalid files and events"""
+        assert_raises(ValueError, list, read_midi(io.BytesIO(b'RIFF')))
+        assert_raises(ValueError, list, read_midi(io.BytesIO(
+            TWO_TRACKS[:-10])))
+
+        # meta events cancel the running status of the note on before
+        assert_raises(ValueError, list, read_midi(io.BytesIO(bytes.fromhex(
+            '4d546864' '00000006' '0000' '0001' '0060'
+            '4d54726b00000011'
+            '00903c40'
+            '00ff59020000'
+            '003c00'
+            '00ff2f00'))))
+
+        with MidiWriter(self.path) as writer:
+            writer.note_on(10, 'C')
+            assert_raises(ValueError, writer.note_off, 5, 'C')
+            assert_raises(ValueError, writer.note_on, 20, Note('C', 10))
+
+    @classmethod
+    def test_spell(cls):
+        """Test spelling note numbers in keys"""
+        assert spell(61) is Note.of('C#', 4)
+        assert spell(61, 'Db') is Note.of('Db', 4)
+        assert spell(60, 'C#') is Note.of('B#', 3)
+        assert spell(71, 'Gb') is Note.of('Cb', 5)
+        assert spell(68, 'a') is Note.of('G#', 4)
+        assert spell(66, 'F') is Note.of('Gb', 4)
+        assert spell(62, 'Db') is Note.of('D', 4)
+
+    @classmethod
+    def test_key_signatures(cls):
+        """Test converting key signatures from and to MIDI"""
+        assert key_from_midi(2, 0) is KeySignature.of('D')
+        assert key_from_midi(-6, 1) is KeySignature.of('eb')
+        assert key_to_midi('Cb') == (-7, 0)
+        assert key_to_midi(KeySignature.of('g#')) == (5, 1)
+        assert_raises(ValueError, key_from_midi, 8, 0)
+        assert_raises(ValueError, key_to_midi, 'G#')
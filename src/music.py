@@ -9,10 +9,21 @@ MINOR = 'm'
 PERFECT = 'P'
 DIM = 'd'
 AUG = 'A'
+DOUBLY_DIM = 'dd'
+DOUBLY_AUG = 'AA'
 
 DEFAULT_OCTAVE = 4
 DEFAULT_MIDI_VALUE = 0
 
+"""
+Accidental spellings (up to triple) and octaves covered by the interned note
+table. Notes outside of this range are still valid, they just aren't shared.
+"""
+ACCIDENTAL_SPELLINGS = (
+    '', '#', '##', 'x', '###', '#x', 'x#', 'b', 'bb', 'bbb'
+)
+OCTAVES = range(0, 9)
+
 """ NoteName: (NoteIndex on Keyboard, Note Value in Semitones) """
 NOTES = {
     'C': (1, 0),
@@ -26,6 +37,14 @@ NOTES = {
 
 NOTE_KEYS = ['C', 'D', 'E', 'F', 'G', 'A', 'B']
 
+"""
+Reverse indexes for natural notes.
+NoteIndex on Keyboard: NoteName, Semitones: NoteName, NoteName: Position
+"""
+NOTES_BY_INDEX = {index: note for note, (index, _) in NOTES.items()}
+NOTES_BY_SEMITONES = {semis: note for note, (_, semis) in NOTES.items()}
+NOTE_POSITIONS = {note: position for position, note in enumerate(NOTE_KEYS)}
+
 """
 List of all possible intervals.
 """
@@ -58,10 +77,19 @@ INTERVALS = {
     'P8': ('Perfect Octave', 12)
 }
 
+"""
+Reverse indexes for intervals.
+(Quantity, Semitones): IntervalName, IntervalName: (Quality, Quantity)
+"""
+INTERVALS_BY_QUANTITY_AND_SEMITONES = {
+    (int(name[1:]), semitones): name
+    for name, (_, semitones) in INTERVALS.items()
+}
+
 """
 Set of qualities
 """
-QUALITIES = (MAJOR, MINOR, PERFECT, AUG, DIM)
+QUALITIES = (MAJOR, MINOR, PERFECT, AUG, DIM, DOUBLY_AUG, DOUBLY_DIM)
 
 """
 Major Key with all the notes within that key.
@@ -85,3 +113,56 @@ CIRCLE_OF_FIFTHS = {
     'Bb': ['Bb', 'C', 'D', 'Eb', 'F', 'G', 'A'],
     'F': ['F', 'G', 'A', 'Bb', 'C', 'D', 'E']
 }
+
+"""
+Scale types with the intervals of every degree above the tonic.
+"""
+SCALES = {
+    'major': ('P1', 'M2', 'M3', 'P4', 'P5', 'M6', 'M7'),
+    'natural minor': ('P1', 'M2', 'm3', 'P4', 'P5', 'm6', 'm7'),
+    'harmonic minor': ('P1', 'M2', 'm3', 'P4', 'P5', 'm6', 'M7'),
+    'melodic minor': ('P1', 'M2', 'm3', 'P4', 'P5', 'M6', 'M7'),
+    'ionian': ('P1', 'M2', 'M3', 'P4', 'P5', 'M6', 'M7'),
+    'dorian': ('P1', 'M2', 'm3', 'P4', 'P5', 'M6', 'm7'),
+    'phrygian': ('P1', 'm2', 'm3', 'P4', 'P5', 'm6', 'm7'),
+    'lydian': ('P1', 'M2', 'M3', 'A4', 'P5', 'M6', 'M7'),
+    'mixolydian': ('P1', 'M2', 'M3', 'P4', 'P5', 'M6', 'm7'),
+    'aeolian': ('P1', 'M2', 'm3', 'P4', 'P5', 'm6', 'm7'),
+    'locrian': ('P1', 'm2', 'm3', 'P4', 'd5', 'm6', 'm7'),
+    'major pentatonic': ('P1', 'M2', 'M3', 'P5', 'M6'),
+    'minor pentatonic': ('P1', 'm3', 'P4', 'P5', 'm7'),
+    'blues': ('P1', 'm3', 'P4', 'A4', 'P5', 'm7'),
+    'whole tone': ('P1', 'M2', 'M3', 'A4', 'A5', 'A6'),
+    'octatonic': ('P1', 'M2', 'm3', 'P4', 'd5', 'm6', 'M6', 'M7'),
+    'octatonic half-whole': ('P1', 'm2', 'm3', 'M3', 'A4', 'P5', 'M6', 'm7')
+}
+
+"""
+Chord qualities with the intervals of every chord tone above the root.
+Extensions are written as compound intervals (M9 is a M2 an octave higher).
+"""
+CHORDS = {
+    'major': ('P1', 'M3', 'P5'),
+    'minor': ('P1', 'm3', 'P5'),
+    'diminished': ('P1', 'm3', 'd5'),
+    'augmented': ('P1', 'M3', 'A5'),
+    'sus2': ('P1', 'M2', 'P5'),
+    'sus4': ('P1', 'P4', 'P5'),
+    'major 6th': ('P1', 'M3', 'P5', 'M6'),
+    'minor 6th': ('P1', 'm3', 'P5', 'M6'),
+    'dominant 7th': ('P1', 'M3', 'P5', 'm7'),
+    'major 7th': ('P1', 'M3', 'P5', 'M7'),
+    'minor 7th': ('P1', 'm3', 'P5', 'm7'),
+    'minor major 7th': ('P1', 'm3', 'P5', 'M7'),
+    'diminished 7th': ('P1', 'm3', 'd5', 'd7'),
+    'half-diminished 7th': ('P1', 'm3', 'd5', 'm7'),
+    'augmented 7th': ('P1', 'M3', 'A5', 'm7'),
+    'add9': ('P1', 'M3', 'P5', 'M9'),
+    'dominant 9th': ('P1', 'M3', 'P5', 'm7', 'M9'),
+    'major 9th': ('P1', 'M3', 'P5', 'M7', 'M9'),
+    'minor 9th': ('P1', 'm3', 'P5', 'm7', 'M9'),
+    'dominant 11th': ('P1', 'M3', 'P5', 'm7', 'M9', 'P11'),
+    'minor 11th': ('P1', 'm3', 'P5', 'm7', 'M9', 'P11'),
+    'dominant 13th': ('P1', 'M3', 'P5', 'm7', 'M9', 'M13'),
+    'major 13th': ('P1', 'M3', 'P5', 'M7', 'M9', 'M13')
+}
@@ -1,42 +1,93 @@
 """Note Module"""
 
-import re
-from .music import SHARP, FLAT, DEFAULT_OCTAVE, NOTES, NOTE_KEYS
+from .music import DEFAULT_OCTAVE, NOTES, NOTE_KEYS, ACCIDENTAL_SPELLINGS, \
+    OCTAVES, NOTES_BY_INDEX, NOTES_BY_SEMITONES, NOTE_POSITIONS
 
-from .accidentals import Accidentals
+from .accidentals import Accidentals, accidentals_from_value
+from .parser import parse_note_parts
 from .interval import Interval
-
-
-class Note:
-    """Note Class"""
+from .fifths import NATURALS_START, EASIEST_FLAT, EASIEST_SHARP, \
+    note_fifths, letter_of, accidentals_of, position_of, semitones_of
+
+
+class Note:  # pylint: disable=no-member
+    """
+    Note Class
+
+    Notes are immutable, which allows them to be shared. Use `Note.of` to get
+    an interned instance instead of building a new one.
+    Notes compare and hash enharmonically, so C# and Db are the same dict key.
+    Use `spelling_key` for keys that keep the spelling.
+    Internally a note is its position on the line of fifths and its diatonic
+    steps above C0 (see src.fifths), so transposing is integer addition.
+    """
+
+    __slots__ = (
+        'name',
+        'letter',
+        'accidentals',
+        'octave',
+        'fifths',
+        'steps',
+        'midi_value',
+        '_easy_notation'
+    )
 
     def __init__(
             self,
             name,
             octave=DEFAULT_OCTAVE
     ):
-        self.name = name
-
-        # Regex for note name syntax
-        match = re.search('^([A-G])([#xb]*)([1-8]?)$', name)
-
-        if match:
-            self.letter = match.group(1)
-            self.accidentals = Accidentals(match.group(2) or '')
-            self.octave = int(match.group(3)) if match.group(3) \
-                else octave
-            self.midi_value = self._calc_midi_val()
-            self.easy_notation = self._calc_easy_notation()
-        else:
-            raise ValueError(
-                "Note Format Invalid. Must be [A-G]([#xb]*)([1-8]?). Got %s",
-                self.name
-            )
+        (letter, accidentals, value, name_octave) = parse_note_parts(name)
+
+        self._set('name', name)
+        self._set('letter', letter)
+        self._set('accidentals', Accidentals(accidentals, value))
+        self._set('octave', name_octave if name_octave is not None
+                  else octave)
+        self._set('fifths', note_fifths(letter, value))
+        self._set('steps', self.octave * 7 + NOTE_POSITIONS[letter])
+        self._set('midi_value', semitones_of(self.fifths, self.steps) + 12)
+
+    def _set(self, attr, value):
+        """
+        Set an attribute while the note is being built. pylint can't see
+        attributes set this way, hence no-member is disabled for the class.
+        """
+        object.__setattr__(self, attr, value)
+
+    def __setattr__(self, attr, value):
+        raise AttributeError("Note is immutable. Can't set %s" % attr)
+
+    def __delattr__(self, attr):
+        raise AttributeError("Note is immutable. Can't delete %s" % attr)
 
     def __eq__(self, note):
         """Returns true if two NOTES are the same (enharmonically)"""
+        if not isinstance(note, Note):
+            return NotImplemented
         return self.midi_value == note.midi_value
 
+    def __hash__(self):
+        return hash(self.midi_value)
+
+    def __repr__(self):
+        return 'Note(%r, %r)' % (self.name, self.octave)
+
+    def spelling_key(self):
+        """
+        Returns a key that is equal for exactly the same notes, for example
+        C#4 and C#4 but not Db4
+        """
+        return self.letter, self.accidentals.value, self.octave
+
+    def enharmonic_key(self):
+        """
+        Returns a key that is equal for enharmonically equivalent notes, for
+        example C#4 and Db4
+        """
+        return self.midi_value
+
     def __add__(self, interval):
         """Returns a new note that has the given interval added"""
         return self._add_or_sub_interval(interval, +1)
@@ -46,76 +97,66 @@ class Note:
         return self._add_or_sub_interval(interval, -1)
 
     @staticmethod
-    def from_index(index):
-        """Find a note by their index. Returns the note name or None"""
-        for item, _ in NOTES.items():
-            if NOTES[item][0] == index:
-                return Note(item)
-        return None
-
-    @staticmethod
-    def from_semitones(semitones):
-        """Find a note by their index. Returns the note name or None"""
-        for item, _ in NOTES.items():
-            if NOTES[item][1] == semitones:
-                return Note(item)
-        return None
-
-    def _calc_easy_notation(self):
+    def of(name, octave=DEFAULT_OCTAVE):
         """
-        Get the easy notation for this note if applicable. For example:
-        Cb:B, Abb:G, E#:F
+        Returns a shared, immutable note for the given name and octave.
+        Common spellings are precomputed, so this is a dictionary lookup.
         """
-        match = re.search('^([C,F]b+|[B,E][#x]+|[A-G](#x+|x+|#{2,}|b{2,}))$', self.name)
-
-        if match:
-            letter = self.letter
-            (_, semitones) = NOTES[letter]
-            octave = self.octave
-            accidental_val = self.accidentals.value
-
-            # calculate the new position of the note by adding the accidental value of current note
-            new_note_pos = semitones + accidental_val
+        note = _NOTE_TABLE.get((name, octave))
+        if note is not None:
+            return note
 
-            # check if a note exists
-            new_note = Note.from_semitones(new_note_pos)
+        note = Note(name, octave)
 
-            if new_note is not None:
-                return new_note
+        # only remember notes within the precomputed range so the table
+        # can't grow without bounds
+        if (note.letter + note.accidentals.accidentals, note.octave) \
+                in _NOTE_TABLE:
+            _NOTE_TABLE[(name, octave)] = note
 
-            # is the current note a C or B ? if yes, they need special handling
-            add_accidentals = ''
-            adjust_note_pos_by = -1 if accidental_val > 0 else 1
+        return note
 
-            if letter in ['C', 'B']:
-                octave += -1 if letter == 'C' else 1
-                new_note_pos = 11 if letter == 'C' else 0
-
-                if abs(accidental_val) > 2:
-                    new_note_pos += accidental_val + (1 if accidental_val < 0 else - 1)
+    @staticmethod
+    def from_fifths(fifths, octave=DEFAULT_OCTAVE):
+        """
+        Returns the shared note at a position on the line of fifths in the
+        given octave. For example: (6, 4) is F#4, (-8, 4) is Fb4
+        """
+        note = _NOTES_BY_FIFTHS.get((fifths, octave))
+        if note is not None:
+            return note
 
-                accidental_val += adjust_note_pos_by
+        return Note.of(
+            letter_of(fifths) + accidentals_from_value(accidentals_of(fifths)),
+            octave)
 
-                if accidental_val % 2 != 0:
-                    add_accidentals = SHARP if accidental_val > 0 else FLAT
-            else:
-                new_note_pos += adjust_note_pos_by
-                if accidental_val != 0:
-                    add_accidentals = SHARP if accidental_val > 0 else FLAT
+    @staticmethod
+    def from_index(index):
+        """Find a note by their index. Returns the note name or None"""
+        name = NOTES_BY_INDEX.get(index)
+        return Note.of(name) if name is not None else None
 
-            # note doesn't exist, try adjusting semitones
-            new_note = Note.from_semitones(new_note_pos)
+    @staticmethod
+    def from_semitones(semitones):
+        """Find a note by their semitones. Returns the note name or None"""
+        name = NOTES_BY_SEMITONES.get(semitones)
+        return Note.of(name) if name is not None else None
 
-            return Note(new_note.name + add_accidentals, octave)
-        else:
-            return None
+    @property
+    def easy_notation(self):
+        """
+        Get the easy notation for this note if applicable. For example:
+        Cb:B, Abb:G, E#:F
+        The result is calculated on first access.
+        """
+        try:
+            return self._easy_notation
+        except AttributeError:
+            pass
 
-    def _calc_midi_val(self):
-        """Calculates the midi value of a note"""
-        (_, note_value) = NOTES[self.letter]
-        note_value += self.accidentals.value
-        note_value += (self.octave + 1) * 12
-        return note_value
+        easy_notation = _calc_easy_notation(self.fifths, self.midi_value)
+        self._set('_easy_notation', easy_notation)
+        return easy_notation
 
     def is_same(self, note):
         """Returns true if two NOTES are exactly the same"""
@@ -125,70 +166,33 @@ class Note:
         """
         Private method to add or subtract an interval from the current note.
         Parameters are the interval and a direction (+1 = add / -1 = sub)
+        Both the fifths and the steps of the interval are added, the letter
+        and accidentals follow from the fifths, the octave from the steps.
         """
-        is_add = direction == +1
-
-        (curr_note_idx, _) = NOTES[self.letter]
-        quantity = interval.quantity - 1
-        new_note_idx = curr_note_idx + quantity \
-            if is_add \
-            else curr_note_idx - quantity
-
-        octave_offset = 0
-
-        if is_add and new_note_idx > 7:
-            octave_offset += 1
-            new_note_idx -= 7
-
-        if not is_add and new_note_idx < 1:
-            octave_offset -= 1
-            new_note_idx += 7
-
-        new_note_name = NOTE_KEYS[new_note_idx - 1]
-        new_note_unadj = Note(new_note_name + str(self.octave + octave_offset))
-
-        if is_add:
-            accidental_adjustment = interval.semitones \
-                - (new_note_unadj.midi_value - self.midi_value)
-        else:
-            accidental_adjustment = (
-                self.midi_value - new_note_unadj.midi_value
-            ) - interval.semitones
-
-        accidentals = ''
-        if accidental_adjustment > 0:
-            accidentals = SHARP * accidental_adjustment
-        elif accidental_adjustment < 0:
-            accidentals = FLAT * abs(accidental_adjustment)
-
-        return Note(new_note_name + accidentals, self.octave + octave_offset)
+        fifths = self.fifths + direction * interval.fifths
+        steps = self.steps + direction * interval.steps
+        return Note.from_fifths(fifths, (steps - position_of(fifths)) // 7)
 
     def minus_note(self, target):
-        """Returns the interval between two NOTES."""
-        root_accidentals = self.accidentals
-        target_accidentals = target.accidentals
-
+        """
+        Returns the simple interval between two NOTES. Descending intervals
+        are measured down from this note. Compound intervals are reduced, so
+        the same letter in another octave is an octave.
+        """
         # check if interval is descending or ascending
         is_desc = self.midi_value > target.midi_value if \
             self.octave == target.octave else self.octave > target.octave
 
-        # calculate the distance between two NOTES to determine interval type
-        (quantity, semitones) = self.calc_distance_to(target)
-
-        if is_desc:
-            # if target note is exactly one octave (12 steps) below root
-            # note we have an octave and don't need to adjust values
-            if not self.midi_value == target.midi_value + 12:
-                quantity = 9 - quantity
-                semitones = 12 - semitones
+        direction = -1 if is_desc else +1
+        fifths = direction * (target.fifths - self.fifths)
+        steps = direction * (target.steps - self.steps)
 
-            semitones += self._adjust_accidentals(root_accidentals, SHARP)
-            semitones += self._adjust_accidentals(target_accidentals, FLAT)
-        else:
-            semitones += self._adjust_accidentals(root_accidentals, FLAT)
-            semitones += self._adjust_accidentals(target_accidentals, SHARP)
+        # compound intervals are reduced, the fifths stay the same
+        if steps:
+            steps = (steps - 1) % 7 + 1
 
-        return Interval.from_quantity_and_semitones(quantity, semitones)
+        return Interval.from_steps_and_semitones(
+            steps, semitones_of(fifths, steps))
 
     def calc_distance_to(self, target):
         """
@@ -196,9 +200,8 @@ class Note:
         This only calculates the semitones between base NOTES, no accidentals
         are considered.
         """
-        note_names = NOTE_KEYS
-        root_idx = note_names.index(self.letter)
-        target_idx = note_names.index(target.letter)
+        root_idx = NOTE_POSITIONS[self.letter]
+        target_idx = NOTE_POSITIONS[target.letter]
 
         (_, root_semitones) = NOTES[self.letter]
         (_, target_semitones) = NOTES[target.letter]
@@ -216,13 +219,50 @@ class Note:
             (12 - root_semitones) + target_semitones
         )
 
-    @classmethod
-    def _adjust_accidentals(cls, accidentals, compare_with):
-        if not accidentals.value == 0:
-            first_accident = accidentals.accidentals[:1]
-            increase = first_accident == compare_with
-            value = abs(accidentals.value)
 
-            return value if increase else value * -1
+def parse_notes(text, octave=DEFAULT_OCTAVE):
+    """
+    Parse a whitespace or comma separated string of note names into a list
+    of shared notes. Names without an octave get the given octave.
+    """
+    return [Note.of(name, octave) for name in text.replace(',', ' ').split()]
+
+
+def _calc_easy_notation(fifths, midi_value):
+    """
+    Resolve a note to its nearest natural note or to a single accidental in
+    the direction of the original accidentals. Returns None if the note is
+    already as easy as it gets.
+    Enharmonic notes are 12 fifths apart, so the note is moved along the
+    line of fifths into the naturals and single sharps (or flats).
+    """
+    if EASIEST_FLAT <= fifths <= EASIEST_SHARP:
+        return None
 
-        return 0
+    lowest = NATURALS_START if accidentals_of(fifths) > 0 \
+        else EASIEST_FLAT
+    return Note.from_fifths(lowest + (fifths - lowest) % 12,
+                            midi_value // 12 - 1)
+
+
+def _build_note_table():
+    """Precompute all common spellings in all octaves"""
+    table = {}
+    for letter in NOTE_KEYS:
+        for accidentals in ACCIDENTAL_SPELLINGS:
+            for octave in OCTAVES:
+                name = letter + accidentals
+                table[(name, octave)] = Note(name, octave)
+    return table
+
+
+# Note.of is used while the table is built, so it has to exist beforehand
+_NOTE_TABLE = {}
+_NOTE_TABLE.update(_build_note_table())
+
+# Shared notes keyed by (fifths, octave), spelled with sharps or flats only
+_NOTES_BY_FIFTHS = {
+    (note.fifths, note.octave): note for note in _NOTE_TABLE.values()
+    if note.accidentals.accidentals
+    == accidentals_from_value(note.accidentals.value)
+}
@@ -2,7 +2,11 @@
 import unittest
 from nose.tools import assert_raises
 
-from .note import Note
+from .note import Note, parse_notes
+from .interval import Interval
+
+# Note sets its attributes with object.__setattr__, which pylint can't see
+# pylint: disable=no-member
 
 
 class NoteTest(unittest.TestCase):
@@ -32,6 +36,15 @@ class NoteTest(unittest.TestCase):
         assert Note.from_index(5).name == 'G'
         assert Note.from_index(6).name == 'A'
         assert Note.from_index(7).name == 'B'
+        assert Note.from_index(8) is None
+
+    @classmethod
+    def test_note_from_semitones(cls):
+        """Test returning a natural Note instance from semitones"""
+        assert Note.from_semitones(0).name == 'C'
+        assert Note.from_semitones(5).name == 'F'
+        assert Note.from_semitones(11).name == 'B'
+        assert Note.from_semitones(1) is None
 
     @classmethod
     def test_extract_note_letter(cls):
@@ -125,6 +138,27 @@ class NoteTest(unittest.TestCase):
         assert Note('G###').easy_notation.name == Note('A#').name
         assert Note('G#x').easy_notation.name == Note('A#').name
 
+        # triple accidentals across the octave boundary
+        note = Note('Bbbb')
+        assert note.easy_notation.name == 'Ab'
+        assert note.easy_notation.octave == 4
+        assert Note('Dbbb').easy_notation.name == 'B'
+        assert Note('Dbbb').easy_notation.octave == 3
+        assert Note('A###').easy_notation.name == 'C'
+        assert Note('A###').easy_notation.octave == 5
+
+    @classmethod
+    def test_easy_notation_shared(cls):
+        """Test if the easy notation is shared between equal spellings"""
+        assert Note('Ex').easy_notation is Note('E##').easy_notation
+        assert Note('Cb').easy_notation is Note('Cb').easy_notation
+        assert Note('Ex', 3).easy_notation is not Note('Ex').easy_notation
+
+        # notes with an explicit octave
+        assert Note('Cb3').easy_notation.name == 'B'
+        assert Note('Cb3').easy_notation.octave == 2
+        assert Note('Fb5').easy_notation.octave == 5
+
     @classmethod
     def test_enharmonic_comparison(cls):
         """Test if two NOTES are enharmonically the same"""
@@ -160,3 +194,81 @@ class NoteTest(unittest.TestCase):
         assert Note('D').calc_distance_to(Note('C')) == (7, 10)
         assert Note('B').calc_distance_to(Note('D')) == (3, 3)
         assert Note('F').calc_distance_to(Note('D')) == (6, 9)
+
+    @classmethod
+    def test_interned_notes(cls):
+        """Test if Note.of returns shared instances"""
+        assert Note.of('C#') is Note.of('C#')
+        assert Note.of('Eb', 3) is Note.of('Eb', 3)
+        assert Note.of('Eb', 3) is not Note.of('Eb', 5)
+        assert Note.of('Abbb', 2).is_same(Note('Abbb', 2))
+
+        # names with an octave and notes outside the table still work
+        assert Note.of('F#2').octave == 2
+        assert Note.of('F#2') is Note.of('F#2')
+        assert Note.of('Cbbbb').midi_value == Note('Cbbbb').midi_value
+
+        assert_raises(ValueError, Note.of, 'W')
+
+    @classmethod
+    def test_immutable(cls):
+        """Test if notes can't be changed after they've been created"""
+        note = Note.of('C')
+        assert_raises(AttributeError, setattr, note, 'name', 'D')
+        assert_raises(AttributeError, setattr, note, 'foo', 1)
+        assert_raises(AttributeError, delattr, note, 'octave')
+        assert note.name == 'C'
+
+    @classmethod
+    def test_hashing(cls):
+        """Test using notes in sets and as dict keys"""
+        assert len({Note('C#'), Note('Db'), Note.of('C#')}) == 1
+        assert len({Note('C#'), Note('C#', 5)}) == 2
+        assert {Note('E#'): 1}[Note('F')] == 1
+        assert Note('C') != 'C'
+
+    @classmethod
+    def test_keys(cls):
+        """Test spelling and enharmonic keys"""
+        assert Note('C#').spelling_key() == ('C', 1, 4)
+        assert Note('Cx').spelling_key() == Note('C##').spelling_key()
+        assert Note('C#').spelling_key() != Note('Db').spelling_key()
+        assert Note('C#').enharmonic_key() == Note('Db').enharmonic_key()
+
+        spelled = {note.spelling_key() for note in
+                   [Note('C#'), Note('Db'), Note.of('C#')]}
+        assert len(spelled) == 2
+
+    @classmethod
+    def test_parse_notes(cls):
+        """Test parsing a string of notes"""
+        notes = parse_notes('C Eb,F#5, Abb\tB3\n')
+        assert [note.name for note in notes] == ['C', 'Eb', 'F#5', 'Abb', 'B3']
+        assert [note.octave for note in notes] == [4, 4, 5, 4, 3]
+        assert notes[0] is Note.of('C')
+
+        assert [note.octave for note in parse_notes('C D5', 2)] == [2, 5]
+        assert parse_notes('') == []
+        assert_raises(ValueError, parse_notes, 'C H')
+
+    @classmethod
+    def test_fifths(cls):
+        """Test notes on the line of fifths"""
+        assert Note('C').fifths == 0
+        assert Note('F#').fifths == 6
+        assert Note('Bbb').fifths == -9
+        assert Note('C').steps == 28
+        assert Note('B#3').steps == 27
+
+        assert Note.from_fifths(6) is Note.of('F#')
+        assert Note.from_fifths(-8, 3) is Note.of('Fb', 3)
+        assert Note.from_fifths(14, 2).name == 'C##'
+        assert Note.from_fifths(-28, 4).name == 'Cbbbb'
+
+    @classmethod
+    def test_transposition_arithmetic(cls):
+        """Test transposing beyond the precomputed spellings"""
+        assert (Note('C') + Interval('dd', 9)).name == 'Dbbb'
+        assert (Note('C', 2) - Interval('dd', 9)).is_same(Note('B##', 0))
+        assert (Note('Fbbb') + Interval('d', 5)).name == 'Cbbbb'
+        assert (Note('Fbbb') + Interval('d', 5)).octave == 5
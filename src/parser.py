@@ -0,0 +1,124 @@
+"""
+Parser Module
+
+Strict, single pass parsers for accidentals, note names and key names.
+Syntax:
+    accidentals: ([#x]*|b*)
+    note:        [A-G] accidentals [1-8]?
+    key:         [a-gA-G][#b]?      (lower case letters are minor keys)
+"""
+from .music import SHARP, DOUBLE_SHARP, FLAT, NOTE_KEYS, ACCIDENTAL_SPELLINGS
+
+_ACCIDENTAL_VALUES = {SHARP: 1, DOUBLE_SHARP: 2, FLAT: -1}
+_OCTAVES = {str(octave): octave for octave in range(1, 9)}
+_NOTE_LETTERS = frozenset(NOTE_KEYS)
+_KEY_LETTERS = frozenset('abcdefgABCDEFG')
+
+
+def parse_accidentals(accidentals):
+    """
+    Returns the + or - value of accidentals. Raises a ValueError if they're
+    invalid.
+    """
+    value = _ACCIDENTALS.get(accidentals)
+    if value is None:
+        value = _scan_accidentals(accidentals, 0, len(accidentals))
+        if value is None:
+            raise ValueError(("Accidentals invalid. Allowed characters are "
+                              "[#, x, b]. Got %s") % accidentals)
+    return value
+
+
+def parse_note(name):
+    """
+    Returns the letter, accidental value and octave (None if the name doesn't
+    contain one) of a note name. Raises a ValueError if the name is invalid.
+    """
+    (letter, _, value, octave) = parse_note_parts(name)
+    return letter, value, octave
+
+
+def parse_note_parts(name):
+    """
+    Same as parse_note, but also returns the accidentals as written:
+    (letter, accidentals, accidental value, octave)
+    """
+    parsed = _NOTES.get(name)
+    if parsed is not None:
+        return parsed
+
+    end = len(name)
+    octave = _OCTAVES.get(name[-1:]) if end > 1 else None
+    if octave is not None:
+        end -= 1
+
+    value = _scan_accidentals(name, 1, end) \
+        if name[:1] in _NOTE_LETTERS else None
+
+    if value is None:
+        raise ValueError(
+            "Note Format Invalid. Must be [A-G]([#xb]*)([1-8]?). Got %s"
+            % name
+        )
+
+    return name[0], name[1:end], value, octave
+
+
+def parse_key(key):
+    """
+    Returns the letter, accidental value and whether it's a minor key for a
+    key name. Raises a ValueError if the key is invalid.
+    """
+    length = len(key)
+    valid = 0 < length <= 2 and key[0] in _KEY_LETTERS \
+        and (length == 1 or key[1] in (SHARP, FLAT))
+
+    if not valid:
+        raise ValueError(
+            "Key Signature Invalid. Must be [a-gA-G]([#b]?). Got %s" % key
+        )
+
+    value = _ACCIDENTAL_VALUES[key[1]] if length == 2 else 0
+    return key[0], value, key[0].islower()
+
+
+def _scan_accidentals(text, start, end):
+    """
+    Returns the value of the accidentals in text[start:end] or None if they
+    are invalid. Sharps and double sharps can be mixed, flats can't be mixed
+    with either.
+    """
+    value = 0
+    has_flats = False
+
+    for index in range(start, end):
+        char = text[index]
+        if char == FLAT:
+            has_flats = True
+            value -= 1
+        elif char in (SHARP, DOUBLE_SHARP):
+            if has_flats:
+                return None
+            value += _ACCIDENTAL_VALUES[char]
+        else:
+            return None
+
+    if has_flats and value != start - end:
+        return None
+
+    return value
+
+
+# Precomputed results for common accidentals and note names
+_ACCIDENTALS = {
+    accidentals: _scan_accidentals(accidentals, 0, len(accidentals))
+    for accidentals in ACCIDENTAL_SPELLINGS
+}
+_NOTES = {
+    letter + accidentals + octave: (
+        letter, accidentals, value, _OCTAVES.get(octave)
+    )
+    for letter in NOTE_KEYS
+    for (accidentals, value) in _ACCIDENTALS.items()
+    for octave in [''] + list(_OCTAVES)
+}
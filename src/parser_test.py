@@ -0,0 +1,56 @@
+"""Parser Test"""
+import unittest
+from nose.tools import assert_raises
+
+from .parser import parse_accidentals, parse_note, parse_note_parts, \
+    parse_key
+
+
+class ParserTest(unittest.TestCase):
+    """Parser Test"""
+
+    @classmethod
+    def test_parse_accidentals(cls):
+        """Test parsing accidentals into their value"""
+        assert parse_accidentals('') == 0
+        assert parse_accidentals('#') == 1
+        assert parse_accidentals('x') == 2
+        assert parse_accidentals('#x') == 3
+        assert parse_accidentals('x#x') == 5
+        assert parse_accidentals('bbbb') == -4
+
+    @classmethod
+    def test_invalid_accidentals(cls):
+        """Test if exceptions are thrown for invalid accidentals"""
+        for accidentals in ('d', '##b', 'b#', 'xb', ',', '#,#', ' '):
+            assert_raises(ValueError, parse_accidentals, accidentals)
+
+    @classmethod
+    def test_parse_note(cls):
+        """Test parsing notes into letter, accidental value and octave"""
+        assert parse_note('C') == ('C', 0, None)
+        assert parse_note('Eb3') == ('E', -1, 3)
+        assert parse_note('F#x8') == ('F', 3, 8)
+        assert parse_note('Gbbbbb1') == ('G', -5, 1)
+        assert parse_note_parts('Ax5') == ('A', 'x', 2, 5)
+        assert parse_note_parts('B#x##') == ('B', '#x##', 5, None)
+
+    @classmethod
+    def test_invalid_note(cls):
+        """Test if exceptions are thrown for invalid notes"""
+        for name in ('', 'H', 'c', 'C0', 'C9', 'C12', 'F#12', 'E%', 'Cb#',
+                     'C,', '#', '4', 'C 4'):
+            assert_raises(ValueError, parse_note, name)
+
+    @classmethod
+    def test_parse_key(cls):
+        """Test parsing key names"""
+        assert parse_key('C') == ('C', 0, False)
+        assert parse_key('f#') == ('f', 1, True)
+        assert parse_key('Bb') == ('B', -1, False)
+
+    @classmethod
+    def test_invalid_key(cls):
+        """Test if exceptions are thrown for invalid keys"""
+        for key in ('', 'M', 'Gx', 'Gbb', 'g##', 'C4', 'b,'):
+            assert_raises(ValueError, parse_key, key)
@@ -0,0 +1,353 @@
+"""
+Pitch Class Set Module
+
+Set theory for collections of notes. A set of pitch classes (the
+`midi_value % 12` of notes) is a 12 bit mask, bit n is pitch class n.
+
+Normal forms, prime forms, Forte numbers and interval class vectors of all
+4096 masks are precomputed into arrays when the module is imported, so
+every query is an array index and many sets are answered at once by
+indexing with an array of masks.
+
+Normal and prime forms follow Rahn: of all rotations, the one with the
+smallest span wins, ties are broken by the span to the second last note,
+then the third last and so on. For sets transposed to start on 0 this is
+the same as comparing their masks as integers.
+"""
+import numpy as np
+
+from .note import Note
+from .batch import midi_values, unpack_notes
+
+PITCH_CLASSES = 12
+SETS = 1 << PITCH_CLASSES
+
+"""
+Prime forms of all trichords to hexachords, ordered by Forte number.
+T and E are pitch classes 10 and 11. Larger sets are named after their
+complements (7-20 is the complement of 5-20), dyads after their interval
+class.
+"""
+FORTE_PRIME_FORMS = {
+    3: ('012', '013', '014', '015', '016', '024', '025', '026', '027',
+        '036', '037', '048'),
+    4: ('0123', '0124', '0134', '0125', '0126', '0127', '0145', '0156',
+        '0167', '0235', '0135', '0236', '0136', '0237', '0146', '0157',
+        '0347', '0147', '0148', '0158', '0246', '0247', '0257', '0248',
+        '0268', '0358', '0258', '0369', '0137'),
+    5: ('01234', '01235', '01245', '01236', '01237', '01256', '01267',
+        '02346', '01246', '01346', '02347', '01356', '01248', '01257',
+        '01268', '01347', '01348', '01457', '01367', '01568', '01458',
+        '01478', '02357', '01357', '02358', '02458', '01358', '02368',
+        '01368', '01468', '01369', '01469', '02468', '02469', '02479',
+        '01247', '03458', '01258'),
+    6: ('012345', '012346', '012356', '012456', '012367', '012567',
+        '012678', '023457', '012357', '013457', '012457', '012467',
+        '013467', '013458', '012458', '014568', '012478', '012578',
+        '013478', '014589', '023468', '012468', '023568', '013468',
+        '013568', '013578', '013469', '013569', '023679', '013679',
+        '014579', '024579', '023579', '013579', '02468T', '012347',
+        '012348', '012378', '023458', '012358', '012368', '012369',
+        '012568', '012569', '023469', '012469', '012479', '012579',
+        '013479', '014679'),
+}
+
+
+class PitchClassSet:  # pylint: disable=no-member
+    """
+    Pitch Class Set Class
+
+    Sets are immutable. Use `PitchClassSet.of` to get a shared instance for
+    a collection of notes, note names or integers (MIDI numbers or pitch
+    classes).
+    """
+
+    # the mask is set with object.__setattr__, which pylint can't see
+    __slots__ = ('mask',)
+
+    def __init__(self, notes=()):
+        object.__setattr__(self, 'mask', pc_mask(notes))
+
+    def __setattr__(self, attr, value):
+        raise AttributeError(
+            "PitchClassSet is immutable. Can't set %s" % attr)
+
+    def __delattr__(self, attr):
+        raise AttributeError(
+            "PitchClassSet is immutable. Can't delete %s" % attr)
+
+    def __eq__(self, other):
+        """Returns true if both sets have the same pitch classes"""
+        if not isinstance(other, PitchClassSet):
+            return NotImplemented
+        return self.mask == other.mask
+
+    def __hash__(self):
+        return hash(self.mask)
+
+    def __len__(self):
+        return int(_CARDINALITIES[self.mask])
+
+    def __contains__(self, note):
+        return bool(self.mask & pc_mask([note]))
+
+    def __repr__(self):
+        return 'PitchClassSet(%r)' % (list(self.pitch_classes),)
+
+    @staticmethod
+    def of(notes=()):
+        """Returns the shared set for a collection of notes"""
+        return PitchClassSet.from_mask(pc_mask(notes))
+
+    @staticmethod
+    def from_mask(mask):
+        """Returns the shared set for a 12 bit mask"""
+        if not 0 <= mask < SETS:
+            raise ValueError(
+                "Mask should be in range [0, %s]. Got %s" % (SETS - 1, mask))
+
+        pcset = _SHARED_SETS[mask]
+        if pcset is None:
+            pcset = PitchClassSet.__new__(PitchClassSet)
+            object.__setattr__(pcset, 'mask', int(mask))
+            _SHARED_SETS[mask] = pcset
+        return pcset
+
+    @property
+    def pitch_classes(self):
+        """The pitch classes in ascending order"""
+        return _pitch_classes(self.mask)
+
+    @property
+    def normal_form(self):
+        """
+        The pitch classes in their most compact order. For example: E G C
+        is (0, 4, 7), G C E is (7, 0, 4)
+        """
+        first = int(_NORMAL_FIRST[self.mask])
+        return tuple(sorted(self.pitch_classes,
+                            key=lambda pitch_class: (pitch_class - first)
+                            % PITCH_CLASSES))
+
+    @property
+    def prime_form(self):
+        """
+        The normal form of the set or its inversion, transposed to start on
+        0, whichever is more compact. For example: (0, 3, 7) for all major
+        and minor triads
+        """
+        return _pitch_classes(int(_PRIME_FORMS[self.mask]))
+
+    @property
+    def forte_number(self):
+        """The Forte number of the set class, for example '4-Z15'"""
+        return FORTE_NUMBERS[_FORTE_INDEXES[self.mask]]
+
+    @property
+    def interval_vector(self):
+        """
+        The number of intervals of each interval class (1 to 6) between
+        all pairs of pitch classes
+        """
+        return tuple(_INTERVAL_VECTORS[self.mask].tolist())
+
+    @property
+    def complement(self):
+        """The set of all pitch classes that aren't in this set"""
+        return PitchClassSet.from_mask(self.mask ^ (SETS - 1))
+
+    def transpose(self, semitones):
+        """Returns the set transposed by a number of semitones"""
+        return PitchClassSet.from_mask(int(_transpose(self.mask, semitones)))
+
+    def invert(self):
+        """Returns the inversion of the set around pitch class 0"""
+        return PitchClassSet.from_mask(int(_INVERSIONS[self.mask]))
+
+    def is_transposition_of(self, other):
+        """Returns true if the set is a transposition of the other set"""
+        return bool(is_transposition(self.mask, other.mask))
+
+    def is_equivalent_to(self, other):
+        """
+        Returns true if the set is a transposition or an inverted
+        transposition of the other set, which means they're in the same set
+        class
+        """
+        return bool(is_equivalent(self.mask, other.mask))
+
+
+def pc_mask(notes):
+    """
+    Returns the 12 bit mask of a collection of notes, note names or
+    integers (MIDI numbers or pitch classes)
+    """
+    mask = 0
+    for note in notes:
+        if isinstance(note, str):
+            note = Note.of(note)
+        if isinstance(note, Note):
+            note = note.midi_value
+        mask |= 1 << (int(note) % PITCH_CLASSES)
+    return mask
+
+
+def pc_masks(collections):
+    """Returns the masks of many collections as an uint16 array"""
+    return np.array([pc_mask(notes) for notes in collections],
+                    dtype=np.uint16)
+
+
+def packed_masks(packed, lengths):
+    """
+    Returns the masks of n melodies as an uint16 array. The notes of all
+    melodies are packed into one uint16 array (see src.batch), lengths
+    holds the number of notes of each melody.
+    """
+    lengths = np.asarray(lengths, dtype=np.int64)
+    bits = np.left_shift(
+        1, midi_values(unpack_notes(packed)).astype(np.int64) % PITCH_CLASSES)
+
+    masks = np.zeros(len(lengths), dtype=np.int64)
+    starts = np.cumsum(lengths) - lengths
+    present = lengths > 0
+    if np.any(present):
+        masks[present] = np.bitwise_or.reduceat(bits, starts[present])
+    return masks.astype(np.uint16)
+
+
+def normal_form_firsts(masks):
+    """Returns the first pitch class of the normal form of each mask"""
+    return _NORMAL_FIRST[np.asarray(masks, dtype=np.int64)]
+
+
+def transposition_classes(masks):
+    """
+    Returns the normal form of each mask transposed to start on 0. Sets
+    have the same result if they're transpositions of each other.
+    """
+    return _TRANSPOSITION_CLASSES[np.asarray(masks, dtype=np.int64)]
+
+
+def prime_forms(masks):
+    """Returns the masks of the prime forms of masks"""
+    return _PRIME_FORMS[np.asarray(masks, dtype=np.int64)]
+
+
+def forte_indexes(masks):
+    """Returns the indexes into FORTE_NUMBERS of masks"""
+    return _FORTE_INDEXES[np.asarray(masks, dtype=np.int64)]
+
+
+def interval_vectors(masks):
+    """Returns the interval class vectors of masks, shape (n, 6)"""
+    return _INTERVAL_VECTORS[np.asarray(masks, dtype=np.int64)]
+
+
+def is_transposition(first, second):
+    """Returns true where two (arrays of) masks are transpositions"""
+    return transposition_classes(first) == transposition_classes(second)
+
+
+def is_equivalent(first, second):
+    """Returns true where two (arrays of) masks are in the same set class"""
+    return prime_forms(first) == prime_forms(second)
+
+
+def _pitch_classes(mask):
+    """Returns the pitch classes of a mask in ascending order"""
+    return tuple(pitch_class for pitch_class in range(PITCH_CLASSES)
+                 if mask >> pitch_class & 1)
+
+
+def _parse_prime_form(prime_form):
+    """Returns the mask of a prime form like '0147' or '02468T'"""
+    return pc_mask(int(pitch_class, 12) for pitch_class
+                   in prime_form.replace('T', 'a').replace('E', 'b'))
+
+
+def _transpose(masks, semitones):
+    """Transpose (arrays of) masks up by a number of semitones"""
+    semitones %= PITCH_CLASSES
+    return ((masks << semitones) | (masks >> (PITCH_CLASSES - semitones))) \
+        & (SETS - 1)
+
+
+def _build_tables():
+    """
+    Build the normal forms, prime forms, interval vectors and Forte numbers
+    of all masks
+    """
+    masks = np.arange(SETS, dtype=np.int64)
+    bits = (masks[:, np.newaxis] >> np.arange(PITCH_CLASSES)) & 1
+    cardinalities = bits.sum(axis=1)
+
+    inversions = (bits << (-np.arange(PITCH_CLASSES) % PITCH_CLASSES)) \
+        .sum(axis=1)
+
+    # transposing down by a pitch class of the set starts it on 0. The
+    # smallest of these masks is the normal form, ties go to the lowest
+    # pitch class
+    rotations = np.stack([_transpose(masks, -pitch_class)
+                          for pitch_class in range(PITCH_CLASSES)], axis=1)
+    rotations = np.where(bits == 1, rotations, SETS)
+    normal_first = np.argmin(rotations, axis=1)
+    classes = np.where(
+        cardinalities > 0, rotations[masks, normal_first], 0)
+    primes = np.minimum(classes,
+                        classes[inversions])
+
+    vectors = np.stack([
+        (bits & np.roll(bits, -interval, axis=1)).sum(axis=1)
+        for interval in range(1, 7)], axis=1)
+    vectors[:, 5] //= 2
+
+    (names, forte_primes) = _build_forte_numbers(primes, vectors)
+    indexes = np.full(SETS, -1, dtype=np.int16)
+    indexes[forte_primes] = np.arange(len(forte_primes))
+
+    return (normal_first.astype(np.int8),
+            classes.astype(np.uint16),
+            primes.astype(np.uint16), inversions.astype(np.uint16),
+            indexes[primes], vectors.astype(np.uint8),
+            cardinalities.astype(np.int8), names, forte_primes)
+
+
+def _build_forte_numbers(primes, vectors):
+    """
+    Returns the Forte numbers of all set classes and their prime form
+    masks, ordered by cardinality and number. Set classes that share their
+    interval vector with another one get a Z.
+    """
+    numbered = {0: [0], 1: [1], 12: [SETS - 1]}
+    numbered[2] = [1 | 1 << interval for interval in range(1, 7)]
+    for (cardinality, forms) in FORTE_PRIME_FORMS.items():
+        numbered[cardinality] = [_parse_prime_form(prime_form)
+                                 for prime_form in forms]
+
+    # larger sets are numbered like their complements
+    for cardinality in range(7, 12):
+        numbered[cardinality] = [
+            int(primes[prime ^ (SETS - 1)])
+            for prime in numbered[PITCH_CLASSES - cardinality]]
+
+    names = []
+    forte_primes = []
+    for cardinality in range(PITCH_CLASSES + 1):
+        class_vectors = [tuple(vectors[prime])
+                         for prime in numbered[cardinality]]
+        for (number, prime) in enumerate(numbered[cardinality]):
+            is_z = class_vectors.count(class_vectors[number]) > 1
+            names.append('%s-%s%s' % (cardinality, 'Z' if is_z else '',
+                                      number + 1))
+            forte_primes.append(prime)
+
+    return tuple(names), np.array(forte_primes, dtype=np.int64)
+
+
+(_NORMAL_FIRST, _TRANSPOSITION_CLASSES, _PRIME_FORMS, _INVERSIONS,
+ _FORTE_INDEXES, _INTERVAL_VECTORS, _CARDINALITIES, FORTE_NUMBERS,
+ FORTE_PRIMES) = _build_tables()
+
+# Shared sets by mask, filled by PitchClassSet.from_mask
+_SHARED_SETS = [None] * SETS
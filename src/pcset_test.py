@@ -0,0 +1,191 @@
+"""Pitch Class Set Test"""
+import unittest
+from itertools import combinations
+from collections import Counter
+from nose.tools import assert_raises
+
+import numpy as np
+
+from .note import Note
+from .batch import encode_notes, pack_notes
+from .pcset import PitchClassSet, FORTE_NUMBERS, SETS, pc_mask, pc_masks, \
+    packed_masks, normal_form_firsts, transposition_classes, prime_forms, \
+    forte_indexes, interval_vectors, is_transposition, is_equivalent
+
+
+def _by_name():
+    """Returns the prime form set of every Forte number"""
+    sets = {}
+    for mask in range(SETS):
+        pcset = PitchClassSet.from_mask(mask)
+        if pcset.pitch_classes == pcset.prime_form:
+            sets[pcset.forte_number] = pcset
+    return sets
+
+
+class PitchClassSetTest(unittest.TestCase):
+    """Pitch Class Set Test"""
+
+    @classmethod
+    def test_masks(cls):
+        """Test building sets from notes, names and numbers"""
+        assert pc_mask(['C', 'E', 'G']) == 0b10010001
+        assert pc_mask([Note('B#'), 'C5', 60, 0]) == 1
+        assert pc_mask([]) == 0
+
+        pcset = PitchClassSet.of(['D', 'F#', 'A'])
+        assert pcset.pitch_classes == (2, 6, 9)
+        assert len(pcset) == 3
+        assert 'Gb' in pcset
+        assert 'G' not in pcset
+        assert PitchClassSet.of([62, 66, 69]) is pcset
+        assert PitchClassSet(['D', 'F#', 'A']) == pcset
+        assert_raises(AttributeError, setattr, pcset, 'mask', 0)
+
+        assert len(PitchClassSet.from_mask(4095)) == 12
+        assert_raises(ValueError, PitchClassSet.from_mask, -1)
+        assert_raises(ValueError, PitchClassSet.from_mask, 4096)
+        assert len(PitchClassSet.from_mask(4095)) == 12
+
+    @classmethod
+    def test_normal_form(cls):
+        """Test normal forms"""
+        assert PitchClassSet.of(['E', 'G', 'C']).normal_form == (0, 4, 7)
+        assert PitchClassSet.of(['G', 'B', 'D']).normal_form == (7, 11, 2)
+        assert PitchClassSet.of([0, 1, 5, 6, 8]).normal_form \
+            == (0, 1, 5, 6, 8)
+        assert PitchClassSet.of([0, 4, 8]).normal_form == (0, 4, 8)
+        assert PitchClassSet.of([]).normal_form == ()
+
+    @classmethod
+    def test_prime_form(cls):
+        """Test prime forms and Forte numbers"""
+        major = PitchClassSet.of(['C', 'E', 'G'])
+        minor = PitchClassSet.of(['A', 'C', 'E'])
+        assert major.prime_form == minor.prime_form == (0, 3, 7)
+        assert major.forte_number == '3-11'
+
+        assert PitchClassSet.of([0, 1, 4, 6]).forte_number == '4-Z15'
+        assert PitchClassSet.of([0, 1, 3, 7]).forte_number == '4-Z29'
+        assert PitchClassSet.of([0, 1, 3, 7, 8]).prime_form \
+            == (0, 1, 5, 6, 8)
+        assert PitchClassSet.of([0, 1, 3, 6, 8, 9]).forte_number == '6-Z29'
+        assert PitchClassSet.of(range(0, 12, 2)).forte_number == '6-35'
+        assert PitchClassSet.of([0, 1, 3, 4, 6, 7, 9, 10]).forte_number \
+            == '8-28'
+        assert PitchClassSet.of([0, 6]).forte_number == '2-6'
+        assert PitchClassSet.of(range(12)).forte_number == '12-1'
+
+    @classmethod
+    def test_set_classes(cls):
+        """Test the number of set classes of each cardinality"""
+        counts = Counter(int(name.split('-')[0]) for name in FORTE_NUMBERS)
+        assert [counts[cardinality] for cardinality in range(13)] \
+            == [1, 1, 6, 12, 29, 38, 50, 38, 29, 12, 6, 1, 1]
+
+        prime_masks = {PitchClassSet.from_mask(mask).prime_form
+                       for mask in range(SETS)}
+        assert len(prime_masks) == len(FORTE_NUMBERS) == 224
+
+    @classmethod
+    def test_z_relations(cls):
+        """Test if Z related set classes share their interval vector"""
+        sets = _by_name()
+        z_pairs = [('4-Z15', '4-Z29'), ('5-Z12', '5-Z36'),
+                   ('5-Z17', '5-Z37'), ('5-Z18', '5-Z38'),
+                   ('6-Z3', '6-Z36'), ('6-Z29', '6-Z50'),
+                   ('7-Z12', '7-Z36'), ('8-Z15', '8-Z29')]
+        for (first, second) in z_pairs:
+            assert sets[first].interval_vector \
+                == sets[second].interval_vector
+            assert not sets[first].is_equivalent_to(sets[second])
+
+        # all other set classes have a unique interval vector
+        vectors = Counter((len(pcset), pcset.interval_vector)
+                          for pcset in sets.values())
+        for (name, pcset) in sets.items():
+            is_z = vectors[(len(pcset), pcset.interval_vector)] > 1
+            assert is_z == ('Z' in name)
+
+    @classmethod
+    def test_complements(cls):
+        """Test if complements have the matching Forte number"""
+        sets = _by_name()
+        for (name, pcset) in sets.items():
+            (cardinality, number) = name.split('-')
+            complement = pcset.complement.forte_number
+            if cardinality == '6':
+                # hexachords are their own complement or their Z partner
+                assert complement == name or 'Z' in name
+            else:
+                assert complement \
+                    == '%s-%s' % (12 - int(cardinality), number)
+
+        assert sets['6-Z3'].complement.forte_number == '6-Z36'
+        assert sets['6-1'].complement.forte_number == '6-1'
+
+    @classmethod
+    def test_interval_vector(cls):
+        """Test interval class vectors"""
+        assert PitchClassSet.of(['C', 'E', 'G']).interval_vector \
+            == (0, 0, 1, 1, 1, 0)
+        assert PitchClassSet.of([0, 1, 4, 6]).interval_vector \
+            == (1, 1, 1, 1, 1, 1)
+        assert PitchClassSet.of([0, 6]).interval_vector \
+            == (0, 0, 0, 0, 0, 1)
+        assert PitchClassSet.of(range(12)).interval_vector \
+            == (12, 12, 12, 12, 12, 6)
+
+        for size in (3, 5):
+            for pitch_classes in combinations(range(12), size):
+                pcset = PitchClassSet.of(pitch_classes)
+                assert sum(pcset.interval_vector) == size * (size - 1) // 2
+
+    @classmethod
+    def test_transposition_inversion(cls):
+        """Test transposition and inversion equivalence"""
+        major = PitchClassSet.of(['C', 'E', 'G'])
+        assert major.transpose(2) == PitchClassSet.of(['D', 'F#', 'A'])
+        assert major.transpose(-1).pitch_classes == (3, 6, 11)
+        assert major.invert().pitch_classes == (0, 5, 8)
+
+        minor = PitchClassSet.of(['A', 'C', 'E'])
+        assert major.is_transposition_of(major.transpose(5))
+        assert not major.is_transposition_of(minor)
+        assert major.is_equivalent_to(minor)
+        assert not major.is_equivalent_to(PitchClassSet.of(['C', 'E', 'G#']))
+
+    @classmethod
+    def test_batch(cls):
+        """Test if the batch functions match single sets"""
+        masks = np.arange(SETS)
+        firsts = normal_form_firsts(masks)
+        primes = prime_forms(masks)
+        indexes = forte_indexes(masks)
+        vectors = interval_vectors(masks)
+
+        for mask in range(1, SETS, 7):
+            pcset = PitchClassSet.from_mask(mask)
+            assert firsts[mask] == pcset.normal_form[0]
+            assert PitchClassSet.from_mask(int(primes[mask])).pitch_classes \
+                == pcset.prime_form
+            assert FORTE_NUMBERS[indexes[mask]] == pcset.forte_number
+            assert tuple(vectors[mask]) == pcset.interval_vector
+
+        assert pc_masks([['C', 'E', 'G'], [], [61]]).tolist() \
+            == [0b10010001, 0, 2]
+        assert is_transposition(pc_masks([['C', 'E'], ['C', 'E']]),
+                                pc_masks([['D', 'F#'], ['D', 'F']])).tolist() \
+            == [True, False]
+        assert is_equivalent(pc_mask(['C', 'E']), pc_mask(['D', 'F#']))
+        assert transposition_classes([pc_mask(['G', 'B'])]).tolist() == [17]
+
+    @classmethod
+    def test_packed_masks(cls):
+        """Test masks of packed melodies"""
+        melodies = [['C', 'E', 'G', 'C5'], [], ['Db', 'C#5']]
+        packed = pack_notes(encode_notes(
+            [Note.of(name) for melody in melodies for name in melody]))
+
+        masks = packed_masks(packed, [len(melody) for melody in melodies])
+        assert masks.tolist() == [0b10010001, 0, 2]
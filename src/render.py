@@ -0,0 +1,264 @@
+"""
+Render Module
+
+Synthesise notes, intervals and chords into 16 bit mono PCM buffers, for
+example to play exercises.
+
+A timbre is the relative amplitude of every harmonic of a note. All
+partials of all notes of a sound are generated at once as a matrix of
+sines (partials x samples) and mixed with one matrix product, then shaped by
+an ADSR envelope (attack, decay, sustain, release).
+
+Rendered buffers are kept in a least recently used cache that is bounded by
+their size in bytes, because exercises replay the same few sounds over and
+over. WAV files are written buffer by buffer with the wave module, so long
+files never have to be in memory at once.
+"""
+from collections import OrderedDict
+import wave
+
+import numpy as np
+
+from .note import Note
+from .interval import Interval
+from .tuning import EQUAL, DEFAULT_A4, frequencies
+
+SAMPLE_RATE = 44100
+SAMPLE_WIDTH = 2
+MAX_AMPLITUDE = 32767
+
+DEFAULT_DURATION = 1.0
+DEFAULT_VOLUME = 0.8
+DEFAULT_CACHE_BYTES = 32 * 1024 * 1024
+
+"""
+Amplitudes of the harmonics of each timbre, starting at the fundamental
+"""
+TIMBRES = {
+    'sine': (1.0,),
+    'organ': (1.0, 0.5, 0.0, 0.25, 0.0, 0.0, 0.0, 0.125),
+    'clarinet': (1.0, 0.0, 0.33, 0.0, 0.2, 0.0, 0.14, 0.0, 0.11),
+    'piano': (1.0, 0.5, 0.33, 0.25, 0.2, 0.17, 0.14, 0.12),
+}
+DEFAULT_TIMBRE = 'piano'
+
+"""
+Attack, decay and release in seconds and the sustain level (0 to 1). The
+release is part of the duration of a sound.
+"""
+DEFAULT_ENVELOPE = (0.01, 0.1, 0.7, 0.2)
+
+
+class Voice:
+    """
+    Voice Class
+
+    How every note sounds: a timbre, an ADSR envelope and a volume (0 to 1)
+    """
+
+    def __init__(self, timbre=DEFAULT_TIMBRE, envelope=DEFAULT_ENVELOPE,
+                 volume=DEFAULT_VOLUME):
+        if timbre not in TIMBRES:
+            raise ValueError("Timbre should be one of %s. Got %s" % (
+                list(TIMBRES.keys()), timbre))
+
+        (attack, decay, sustain, release) = envelope
+        if min(attack, decay, release) < 0 or not 0 <= sustain <= 1:
+            raise ValueError("Invalid envelope %s" % (envelope,))
+
+        if not 0 <= volume <= 1:
+            raise ValueError(
+                "Volume should be in range [0, 1]. Got %s" % volume)
+
+        self.timbre = timbre
+        self.envelope = tuple(envelope)
+        self.volume = volume
+
+        amplitudes = np.array(TIMBRES[timbre])
+        self.harmonics = np.arange(1, len(amplitudes) + 1)
+        # every note peaks at 1 / sum of its amplitudes
+        self.amplitudes = amplitudes / amplitudes.sum()
+
+    def shape(self, samples, sample_rate):
+        """
+        Returns the envelope for a number of samples. Attack, decay and
+        release shrink proportionally if the sound is too short for them.
+        """
+        (attack, decay, sustain, release) = self.envelope
+        duration = samples / sample_rate
+        shrink = min(1.0, duration / (attack + decay + release or 1.0))
+        (attack, decay, release) = (attack * shrink, decay * shrink,
+                                    release * shrink)
+
+        return np.interp(
+            np.arange(samples) / sample_rate,
+            (0, attack, attack + decay, duration - release, duration),
+            (0, 1, sustain, sustain, 0))
+
+
+class Renderer:
+    """
+    Renderer Class
+
+    Renders sounds with one voice (or timbre name) and tuning and caches
+    the buffers. Buffers are read only int16 arrays shared with the cache.
+    """
+
+    def __init__(self, voice=DEFAULT_TIMBRE, tuning=EQUAL, a4=DEFAULT_A4,
+                 sample_rate=SAMPLE_RATE, max_bytes=DEFAULT_CACHE_BYTES):
+        self.voice = voice if isinstance(voice, Voice) else Voice(voice)
+        self.tuning = tuning
+        self.a4 = a4
+        self.sample_rate = sample_rate
+        self.max_bytes = max_bytes
+
+        self.hits = 0
+        self.misses = 0
+        self.cache_bytes = 0
+        self._cache = OrderedDict()
+
+    @property
+    def hit_rate(self):
+        """The share of renders answered from the cache (0 to 1)"""
+        total = self.hits + self.misses
+        return self.hits / total if total else 0.0
+
+    @property
+    def cached_buffers(self):
+        """The number of buffers in the cache"""
+        return len(self._cache)
+
+    def clear_cache(self):
+        """Remove all buffers from the cache and reset the statistics"""
+        self._cache.clear()
+        self.cache_bytes = 0
+        self.hits = 0
+        self.misses = 0
+
+    def render_notes(self, notes, duration=DEFAULT_DURATION, tonic=None):
+        """
+        Returns the buffer of notes (or note names) sounding together. Just
+        and Pythagorean tuning are from the tonic, by default the first note.
+        """
+        notes = [note if isinstance(note, Note) else Note.of(note)
+                 for note in notes]
+        if not notes:
+            raise ValueError("Nothing to render")
+
+        tonic = self._get_tonic(notes, tonic)
+        key = (_spelling_keys(notes), duration,
+               tonic.spelling_key() if tonic is not None else None)
+        return self._get_buffer(
+            key, lambda: self._synthesise(notes, duration, tonic))
+
+    def render_note(self, note, duration=DEFAULT_DURATION):
+        """Returns the buffer of a note (or note name)"""
+        return self.render_notes([note], duration)
+
+    def render_interval(self, root, interval, duration=DEFAULT_DURATION,
+                        melodic=False):
+        """
+        Returns the buffer of an interval (or interval name) above a root.
+        Harmonic intervals sound together, melodic ones one after another,
+        each for the duration.
+        """
+        root = root if isinstance(root, Note) else Note.of(root)
+        if not isinstance(interval, Interval):
+            interval = Interval.from_string(interval)
+
+        notes = [root, root + interval]
+        if not melodic:
+            return self.render_notes(notes, duration)
+
+        # only the whole clip is cached, not the notes it's made of
+        tonic = self._get_tonic(notes, root)
+        key = ('melodic', _spelling_keys(notes), duration)
+        return self._get_buffer(key, lambda: np.concatenate([
+            self._synthesise([note], duration, tonic) for note in notes]))
+
+    def render_chord(self, chord, duration=DEFAULT_DURATION):
+        """Returns the buffer of a chord, tuned from its root"""
+        return self.render_notes(chord.pitches, duration, chord.root)
+
+    def _get_tonic(self, notes, tonic):
+        """
+        Returns the tonic that tunes notes: None for equal temperament, else
+        the tonic (or tonic name) or the first note
+        """
+        if self.tuning == EQUAL:
+            return None
+        if tonic is None:
+            return notes[0]
+        return tonic if isinstance(tonic, Note) else Note.of(tonic)
+
+    def _get_buffer(self, key, build):
+        """
+        Returns a buffer from the cache or builds and caches it. Least
+        recently used buffers are dropped while the cache is too large.
+        """
+        buffer = self._cache.get(key)
+        if buffer is not None:
+            self._cache.move_to_end(key)
+            self.hits += 1
+            return buffer
+
+        self.misses += 1
+        buffer = build()
+        buffer.flags.writeable = False
+
+        if buffer.nbytes <= self.max_bytes:
+            self._cache[key] = buffer
+            self.cache_bytes += buffer.nbytes
+            while self.cache_bytes > self.max_bytes:
+                (_, dropped) = self._cache.popitem(last=False)
+                self.cache_bytes -= dropped.nbytes
+        return buffer
+
+    def _synthesise(self, notes, duration, tonic):
+        """Returns a new buffer of notes sounding together"""
+        voice = self.voice
+        samples = int(round(duration * self.sample_rate))
+        seconds = np.arange(samples) / self.sample_rate
+
+        # frequencies and amplitudes of all partials of all notes
+        partials = np.outer(frequencies(notes, self.tuning, tonic, self.a4),
+                            voice.harmonics).ravel()
+        amplitudes = np.tile(voice.amplitudes, len(notes))
+        amplitudes[partials >= self.sample_rate / 2] = 0
+
+        signal = amplitudes @ np.sin(np.outer(2 * np.pi * partials, seconds))
+        signal *= voice.shape(samples, self.sample_rate) \
+            * (voice.volume * MAX_AMPLITUDE / len(notes))
+        return np.round(signal).astype(np.int16)
+
+
+def silence(duration, sample_rate=SAMPLE_RATE):
+    """Returns a buffer of silence, for example between sounds"""
+    return np.zeros(int(round(duration * sample_rate)), dtype=np.int16)
+
+
+def write_wav(path, buffers, sample_rate=SAMPLE_RATE):
+    """
+    Write buffers (one buffer or an iterable of them) one after another to
+    a mono 16 bit WAV file. Buffers are written as they're produced, so a
+    generator streams. Returns the number of samples written.
+    """
+    if isinstance(buffers, np.ndarray):
+        buffers = [buffers]
+
+    samples = 0
+    with wave.Wave_write(path) as wav_file:
+        wav_file.setnchannels(1)
+        wav_file.setsampwidth(SAMPLE_WIDTH)
+        wav_file.setframerate(sample_rate)
+
+        for buffer in buffers:
+            wav_file.writeframes(
+                np.asarray(buffer, dtype='<i2').tobytes())
+            samples += len(buffer)
+    return samples
+
+
+def _spelling_keys(notes):
+    """Returns the spelling keys of notes as a tuple"""
+    return tuple(note.spelling_key() for note in notes)
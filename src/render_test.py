@@ -0,0 +1,156 @@
+"""Render Test"""
+import os
+import tempfile
+import unittest
+import wave
+from nose.tools import assert_raises
+import numpy as np
+
+from .note import Note
+from .interval import Interval
+from .chord import Chord
+from .tuning import JUST
+from .render import Voice, Renderer, MAX_AMPLITUDE, silence, write_wav
+
+
+class RenderTest(unittest.TestCase):
+    """Render Test"""
+
+    @classmethod
+    def test_render_note(cls):
+        """Test the length, type and level of a rendered note"""
+        renderer = Renderer(Voice('sine', envelope=(0, 0, 1, 0), volume=1.0),
+                            sample_rate=8000)
+        buffer = renderer.render_note('A4', 0.5)
+        assert buffer.dtype == np.int16
+        assert len(buffer) == 4000
+        assert not buffer.flags.writeable
+        assert abs(int(buffer.max()) - MAX_AMPLITUDE) <= 1
+
+        # the strongest frequency, in steps of 2 Hz for half a second
+        assert np.argmax(np.abs(np.fft.rfft(buffer))) * 2 == 440
+
+    @classmethod
+    def test_envelope(cls):
+        """Test if sounds fade in and out"""
+        renderer = Renderer(sample_rate=8000)
+        buffer = renderer.render_note('C4', 0.5).astype(float)
+        assert buffer[0] == 0
+        assert abs(buffer[-1]) < 100
+        assert np.abs(buffer[:40]).max() < np.abs(buffer[80:400]).max()
+
+        # sounds shorter than the envelope
+        assert len(renderer.render_note('C4', 0.01)) == 80
+        assert len(renderer.render_note('C4', 0)) == 0
+
+    @classmethod
+    def test_render_interval_and_chord(cls):
+        """Test if intervals and chords mix their notes"""
+        renderer = Renderer(sample_rate=8000)
+        harmonic = renderer.render_interval('C4', 'M3', 0.25)
+        assert len(harmonic) == 2000
+        assert np.array_equal(
+            harmonic, renderer.render_notes(['C4', 'E4'], 0.25))
+
+        melodic = renderer.render_interval(
+            Note.of('C4'), Interval.from_string('M3'), 0.25, melodic=True)
+        assert len(melodic) == 4000
+        assert np.array_equal(melodic[2000:],
+                              renderer.render_note('E4', 0.25))
+
+        chord = Chord('A', 'minor')
+        assert np.array_equal(renderer.render_chord(chord, 0.25),
+                              renderer.render_notes(chord.pitches, 0.25))
+        assert_raises(ValueError, renderer.render_notes, [])
+
+    @classmethod
+    def test_tuning(cls):
+        """Test if tuned thirds differ from equal tempered ones"""
+        equal = Renderer(sample_rate=8000)
+        just = Renderer(sample_rate=8000, tuning=JUST)
+        assert np.array_equal(equal.render_note('A4'),
+                              just.render_note('A4'))
+        assert not np.array_equal(equal.render_interval('A4', 'M3'),
+                                  just.render_interval('A4', 'M3'))
+
+    @classmethod
+    def test_cache(cls):
+        """Test hits, misses and the byte limit of the cache"""
+        renderer = Renderer(sample_rate=8000, max_bytes=3 * 8000 * 2)
+        first = renderer.render_note('C4')
+        assert renderer.render_note('C4') is first
+        assert renderer.render_note(Note.of('C4')) is first
+        assert (renderer.hits, renderer.misses) == (2, 1)
+        assert renderer.hit_rate == 2 / 3
+        assert renderer.cache_bytes == first.nbytes
+
+        # spellings are cached separately
+        renderer.render_note('B#3')
+        renderer.render_note('D4')
+        renderer.render_note('C4')
+        assert renderer.cached_buffers == 3
+        assert renderer.cache_bytes == 3 * first.nbytes
+
+        # B#3 is the least recently used
+        renderer.render_note('E4')
+        assert renderer.cached_buffers == 3
+        assert renderer.render_note('C4') is first
+        misses = renderer.misses
+        renderer.render_note('B#3')
+        assert renderer.misses == misses + 1
+
+        # buffers larger than the cache aren't cached
+        renderer.render_note('C4', 4)
+        assert renderer.cache_bytes <= renderer.max_bytes
+
+        renderer.clear_cache()
+        assert renderer.cached_buffers == 0
+        assert renderer.cache_bytes == 0
+        assert renderer.hit_rate == 0
+
+    @classmethod
+    def test_melodic_cache(cls):
+        """Test if a melodic interval is cached as one buffer"""
+        renderer = Renderer(sample_rate=8000)
+        clip = renderer.render_interval('C4', 'M3', 0.25, melodic=True)
+        assert renderer.render_interval('C4', 'M3', 0.25, melodic=True) \
+            is clip
+        assert (renderer.hits, renderer.misses) == (1, 1)
+        assert renderer.hit_rate == 0.5
+        assert renderer.cached_buffers == 1
+        assert renderer.cache_bytes == clip.nbytes
+
+        # the notes match single renders, but aren't cached on their own
+        assert np.array_equal(clip[:2000], renderer.render_note('C4', 0.25))
+        assert renderer.misses == 2
+
+    @classmethod
+    def test_invalid_settings(cls):
+        """Test if invalid settings raise a ValueError"""
+        assert_raises(ValueError, Renderer, 'kazoo')
+        assert_raises(ValueError, Voice, envelope=(0.1, 0.1, 2, 0.1))
+        assert_raises(ValueError, Voice, envelope=(-1, 0.1, 0.5, 0.1))
+        assert_raises(ValueError, Voice, volume=1.5)
+
+    @classmethod
+    def test_write_wav(cls):
+        """Test writing buffers from a generator to a WAV file"""
+        renderer = Renderer(sample_rate=8000)
+        buffers = [renderer.render_note('C4', 0.25), silence(0.5, 8000),
+                   renderer.render_note('G4', 0.25)]
+
+        (handle, path) = tempfile.mkstemp(suffix='.wav')
+        os.close(handle)
+        try:
+            assert write_wav(path, (buffer for buffer in buffers),
+                             8000) == 8000
+            with wave.open(path, 'rb') as wav_file:
+                assert wav_file.getnchannels() == 1
+                assert wav_file.getsampwidth() == 2
+                assert wav_file.getframerate() == 8000
+                data = np.frombuffer(wav_file.readframes(8000), '<i2')
+            assert np.array_equal(data, np.concatenate(buffers))
+
+            assert write_wav(path, buffers[0], 8000) == 2000
+        finally:
+            os.remove(path)
@@ -0,0 +1,100 @@
+"""Scale Module"""
+from .music import SCALES, DEFAULT_OCTAVE
+from .interval import Interval
+from .note import Note
+
+
+class Scale:
+    """
+    Scale Class
+
+    A scale is a tonic and a pattern of intervals above it. The pattern is
+    either the name of a scale in SCALES or a list of intervals.
+    Use `Scale.of` to get a shared instance.
+    """
+
+    def __init__(self, tonic, scale_type='major'):
+        self.tonic = tonic if isinstance(tonic, Note) else Note.of(tonic)
+        self.scale_type = scale_type if isinstance(scale_type, str) \
+            else 'custom'
+
+        pattern = self._get_pattern(scale_type)
+        self.intervals = [Interval.from_string(name) for name in pattern]
+
+        degrees = _get_degrees(self.tonic, pattern)
+        self.notes = [name for (name, _) in degrees]
+        self.pitches = [Note.of(name, self.tonic.octave + octave_offset)
+                        for (name, octave_offset) in degrees]
+
+        self._spellings = {note.spelling_key()[:2] for note in self.pitches}
+
+    def __contains__(self, note):
+        """Returns true if a note is spelled exactly like one in this scale"""
+        note = note if isinstance(note, Note) else Note.of(note)
+        return note.spelling_key()[:2] in self._spellings
+
+    def __len__(self):
+        return len(self.notes)
+
+    @staticmethod
+    def of(tonic, scale_type='major'):
+        """Returns a shared scale for the given tonic and scale type"""
+        if not isinstance(scale_type, str):
+            scale_type = Scale._get_pattern(scale_type)
+
+        tonic = tonic if isinstance(tonic, Note) else Note.of(tonic)
+
+        # notes hash enharmonically, so use their spelling instead
+        key = (tonic.spelling_key(), scale_type)
+        scale = _SCALES.get(key)
+        if scale is None:
+            scale = _SCALES.setdefault(key, Scale(tonic, scale_type))
+        return scale
+
+    @staticmethod
+    def _get_pattern(scale_type):
+        """Returns the interval names of a scale type or interval list"""
+        if isinstance(scale_type, str):
+            if scale_type not in SCALES:
+                raise ValueError("Scale type should be one of %s. Got %s" % (
+                    list(SCALES.keys()),
+                    scale_type
+                ))
+            return SCALES[scale_type]
+
+        pattern = tuple(interval.name if isinstance(interval, Interval)
+                        else interval for interval in scale_type)
+        if not pattern:
+            raise ValueError("A scale needs at least one interval")
+
+        for name in pattern:
+            Interval.from_string(name)
+
+        return pattern
+
+
+def _get_degrees(tonic, pattern):
+    """
+    Returns the note names and octave offsets of all degrees for the
+    tonic's spelling and a pattern. Results are shared between scales.
+    """
+    spelling = tonic.letter + tonic.accidentals.accidentals
+    key = (spelling, pattern)
+
+    degrees = _DEGREES.get(key)
+    if degrees is None:
+        root = Note.of(spelling, DEFAULT_OCTAVE)
+        degrees = []
+        for name in pattern:
+            note = root + Interval.from_string(name)
+            degrees.append((note.name, note.octave - DEFAULT_OCTAVE))
+        degrees = _DEGREES.setdefault(key, tuple(degrees))
+
+    return degrees
+
+
+# Scale degrees keyed by (tonic spelling, interval names)
+_DEGREES = {}
+
+# Shared scales keyed by (tonic, scale type or interval names)
+_SCALES = {}
@@ -0,0 +1,104 @@
+"""Scale Test"""
+import unittest
+from nose.tools import assert_raises
+
+from .music import CIRCLE_OF_FIFTHS, SCALES
+from .note import Note
+from .interval import Interval
+from .keysignature import KeySignature, KEYS
+from .scale import Scale
+
+
+class ScaleTest(unittest.TestCase):
+    """Scale Test"""
+
+    @classmethod
+    def test_invalid_scale(cls):
+        """Test if exceptions are thrown for invalid scales"""
+        assert_raises(ValueError, Scale, 'C', 'superlocrian')
+        assert_raises(ValueError, Scale, 'C', ['P1', 'X3'])
+        assert_raises(ValueError, Scale, 'C', [])
+        assert_raises(ValueError, Scale, 'H', 'major')
+
+    @classmethod
+    def test_major_scales(cls):
+        """Test if major scales match the circle of fifths"""
+        for (key, notes) in CIRCLE_OF_FIFTHS.items():
+            assert Scale(key).notes == notes
+
+    @classmethod
+    def test_natural_minor_scales(cls):
+        """Test if natural minor scales match the minor key signatures"""
+        for key in KEYS:
+            if key.islower():
+                tonic = key[0].upper() + key[1:]
+                assert Scale(tonic, 'natural minor').notes \
+                    == KeySignature.of(key).notes
+
+    @classmethod
+    def test_scale_types(cls):
+        """Test a few scales of every type"""
+        assert Scale('A', 'harmonic minor').notes \
+            == ['A', 'B', 'C', 'D', 'E', 'F', 'G#']
+        assert Scale('A', 'melodic minor').notes \
+            == ['A', 'B', 'C', 'D', 'E', 'F#', 'G#']
+        assert Scale('D', 'dorian').notes \
+            == ['D', 'E', 'F', 'G', 'A', 'B', 'C']
+        assert Scale('E', 'phrygian').notes \
+            == ['E', 'F', 'G', 'A', 'B', 'C', 'D']
+        assert Scale('F', 'lydian').notes \
+            == ['F', 'G', 'A', 'B', 'C', 'D', 'E']
+        assert Scale('G', 'mixolydian').notes \
+            == ['G', 'A', 'B', 'C', 'D', 'E', 'F']
+        assert Scale('B', 'locrian').notes \
+            == ['B', 'C', 'D', 'E', 'F', 'G', 'A']
+        assert Scale('G', 'major pentatonic').notes \
+            == ['G', 'A', 'B', 'D', 'E']
+        assert Scale('E', 'minor pentatonic').notes \
+            == ['E', 'G', 'A', 'B', 'D']
+        assert Scale('A', 'blues').notes \
+            == ['A', 'C', 'D', 'D#', 'E', 'G']
+        assert Scale('C', 'whole tone').notes \
+            == ['C', 'D', 'E', 'F#', 'G#', 'A#']
+        assert Scale('C', 'octatonic').notes \
+            == ['C', 'D', 'Eb', 'F', 'Gb', 'Ab', 'A', 'B']
+        assert Scale('C', 'octatonic half-whole').notes \
+            == ['C', 'Db', 'Eb', 'E', 'F#', 'G', 'A', 'Bb']
+
+        for scale_type in SCALES:
+            scale = Scale('Eb', scale_type)
+            assert len(scale) == len(SCALES[scale_type])
+            assert scale.notes[0] == 'Eb'
+
+    @classmethod
+    def test_custom_scale(cls):
+        """Test scales from a user defined list of intervals"""
+        scale = Scale('D', ['P1', Interval.from_string('M3'), 'A5'])
+        assert scale.scale_type == 'custom'
+        assert scale.notes == ['D', 'F#', 'A#']
+
+    @classmethod
+    def test_pitches(cls):
+        """Test the notes of a scale with their octaves"""
+        scale = Scale(Note('A', 3), 'natural minor')
+        assert [note.octave for note in scale.pitches] \
+            == [3, 3, 4, 4, 4, 4, 4]
+        assert scale.pitches[2] is Note.of('C', 4)
+
+    @classmethod
+    def test_contains(cls):
+        """Test if notes are part of a scale"""
+        scale = Scale('D')
+        assert 'F#' in scale
+        assert Note('C#', 2) in scale
+        assert 'Gb' not in scale
+        assert 'F' not in scale
+
+    @classmethod
+    def test_shared_scales(cls):
+        """Test if Scale.of returns shared instances"""
+        assert Scale.of('D', 'dorian') is Scale.of('D', 'dorian')
+        assert Scale.of('D', 'dorian') is Scale.of(Note('D'), 'dorian')
+        assert Scale.of('D', ['P1', 'M2']) is Scale.of('D', ('P1', 'M2'))
+        assert Scale.of(Note('C#')) is not Scale.of(Note('Db'))
+        assert Scale.of(Note('C#')).notes[0] == 'C#'
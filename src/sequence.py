@@ -0,0 +1,84 @@
+"""Note Sequence Module"""
+import numpy as np
+
+from .note import Note
+from .batch import encode_notes, pack_notes, unpack_notes, unpack_note, \
+    encode_intervals, add_intervals, sub_intervals, midi_values
+
+
+class NoteSequence:
+    """
+    Note Sequence Class
+
+    Stores notes packed into one uint16 per note (see src.batch) instead of
+    a list of Note objects. Letters, accidentals and octaves are preserved,
+    so C# and Db stay different notes.
+    """
+
+    __slots__ = ('packed',)
+
+    def __init__(self, notes=()):
+        notes = [note if isinstance(note, Note) else Note.of(note)
+                 for note in notes]
+        self.packed = pack_notes(encode_notes(notes))
+
+    @staticmethod
+    def from_packed(packed):
+        """Creates a new sequence from packed notes without copying them"""
+        sequence = NoteSequence.__new__(NoteSequence)
+        sequence.packed = np.asarray(packed, dtype=np.uint16)
+        return sequence
+
+    @staticmethod
+    def from_encoded(encoded):
+        """Creates a new sequence from encoded notes of shape (n, 3)"""
+        return NoteSequence.from_packed(pack_notes(encoded))
+
+    def __len__(self):
+        return len(self.packed)
+
+    def __getitem__(self, index):
+        """Returns a note, or a sequence sharing this buffer for slices"""
+        if isinstance(index, slice):
+            return NoteSequence.from_packed(self.packed[index])
+        return unpack_note(int(self.packed[index]))
+
+    def __iter__(self):
+        """Yields shared Note instances"""
+        for packed in self.packed.tolist():
+            yield unpack_note(packed)
+
+    def __eq__(self, other):
+        """Returns true if both sequences are spelled exactly the same"""
+        if not isinstance(other, NoteSequence):
+            return NotImplemented
+        return np.array_equal(self.packed, other.packed)
+
+    def __repr__(self):
+        return 'NoteSequence([%s])' % ', '.join(
+            '%s%s' % (note.name, note.octave) for note in self)
+
+    @property
+    def nbytes(self):
+        """Returns the size of the note buffer in bytes"""
+        return self.packed.nbytes
+
+    def encoded(self):
+        """Returns the notes encoded as an int8 array of shape (n, 3)"""
+        return unpack_notes(self.packed)
+
+    def midi_values(self):
+        """Returns the midi values of all notes as an array"""
+        return midi_values(self.encoded())
+
+    def transpose(self, interval, direction=+1):
+        """
+        Returns a new sequence with the interval added (direction = +1) or
+        subtracted (direction = -1) from all notes.
+        """
+        encoded_interval = encode_intervals([interval])[0]
+        if direction == +1:
+            encoded = add_intervals(self.encoded(), encoded_interval)
+        else:
+            encoded = sub_intervals(self.encoded(), encoded_interval)
+        return NoteSequence.from_encoded(encoded)
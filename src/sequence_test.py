@@ -0,0 +1,70 @@
+"""Note Sequence Test"""
+import unittest
+from nose.tools import assert_raises
+
+from .note import Note
+from .interval import Interval
+from .sequence import NoteSequence
+
+
+class NoteSequenceTest(unittest.TestCase):
+    """Note Sequence Test"""
+
+    @classmethod
+    def test_new_sequence(cls):
+        """Test creating a sequence from notes and note names"""
+        sequence = NoteSequence([Note('C'), 'Db', 'C#5', Note('Fbb', 2)])
+        assert len(sequence) == 4
+        assert sequence.nbytes == 8
+
+        names = [(note.name, note.octave) for note in sequence]
+        assert names == [('C', 4), ('Db', 4), ('C#', 5), ('Fbb', 2)]
+
+        assert len(NoteSequence()) == 0
+        assert list(NoteSequence()) == []
+
+    @classmethod
+    def test_shared_notes(cls):
+        """Test if iterating yields interned notes"""
+        sequence = NoteSequence(['Eb', 'Eb'])
+        (first, second) = list(sequence)
+        assert first is second
+        assert first is Note.of('Eb')
+
+    @classmethod
+    def test_invalid_notes(cls):
+        """Test if exceptions are thrown for notes that can't be stored"""
+        assert_raises(ValueError, NoteSequence, ['W'])
+        assert_raises(ValueError, NoteSequence, [Note('C#########')])
+
+    @classmethod
+    def test_indexing_and_slicing(cls):
+        """Test accessing notes and slices of a sequence"""
+        # pylint can't tell notes from slices, which are sequences
+        # pylint: disable=no-member
+        sequence = NoteSequence(['C', 'D', 'E', 'F', 'G'])
+        assert sequence[0].name == 'C'
+        assert sequence[-1].name == 'G'
+
+        part = sequence[1:4]
+        assert isinstance(part, NoteSequence)
+        assert [note.name for note in part] == ['D', 'E', 'F']
+        assert part == NoteSequence(['D', 'E', 'F'])
+        assert part != NoteSequence(['D', 'E', 'E#'])
+
+    @classmethod
+    def test_midi_values(cls):
+        """Test bulk calculation of midi values"""
+        sequence = NoteSequence(['C', 'Eb', 'Bb5', 'A#3'])
+        assert sequence.midi_values().tolist() == [60, 63, 82, 58]
+
+    @classmethod
+    def test_transpose(cls):
+        """Test transposing a whole sequence"""
+        sequence = NoteSequence(['C', 'Eb', 'B', 'F#'])
+
+        up = sequence.transpose(Interval.from_string('M2'))
+        assert up == NoteSequence(['D', 'F', 'C#5', 'G#'])
+
+        down = sequence.transpose(Interval.from_string('P5'), -1)
+        assert down == NoteSequence(['F3', 'Ab3', 'E', 'B3'])
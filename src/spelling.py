@@ -0,0 +1,187 @@
+"""
+Spelling Module
+
+Spell streams of MIDI note numbers, for example from a keyboard. Every
+pitch can be spelled in a few ways (C#, Db, B##). The speller picks the
+spellings of a whole melody with the lowest cost, using dynamic programming
+(Viterbi) over the candidate spellings of each note:
+
+- a spelling costs the number of fifths it lies outside the key (or outside
+  the naturals without a key), so C# beats Db in D major. Minor keys
+  include their raised 6th and 7th degree
+- an interval costs the number of fifths it lies beyond the major and minor
+  intervals, so augmented and diminished steps are avoided. Intervals
+  between two notes of the key are free, like the augmented 2nd of
+  harmonic minor
+
+Spellings are decided with a fixed lookahead: a note is final once the next
+`lookahead` notes are known. Memory and the work per note don't depend on
+the length of the stream, so live input and long files both work.
+"""
+from collections import deque
+from operator import itemgetter
+
+from .note import Note
+from .keysignature import KeySignature
+from .fifths import position_of
+
+# Candidate spellings have up to this many sharps or flats
+MAX_ACCIDENTALS = 2
+
+"""
+Cost of every fifth a spelling lies outside the key and of every fifth an
+interval lies beyond the major and minor intervals
+"""
+KEY_COST = 1
+INTERVAL_COST = 1
+LARGEST_PLAIN_INTERVAL = 5
+
+"""
+Minor keys also accept their raised 6th and 7th degree, which go up to this
+many fifths above the highest note of the key signature
+"""
+MINOR_RAISED_FIFTHS = 3
+
+DEFAULT_LOOKAHEAD = 4
+
+
+class PitchSpeller:
+    """
+    Pitch Speller Class
+
+    Push MIDI note numbers one by one, each push returns the notes whose
+    spelling became final. `flush` returns the rest at the end of a stream.
+    """
+
+    def __init__(self, key=None, lookahead=DEFAULT_LOOKAHEAD):
+        if lookahead < 0:
+            raise ValueError(
+                "Lookahead should be 0 or greater. Got %s" % lookahead)
+
+        if key is not None and not isinstance(key, KeySignature):
+            key = KeySignature.of(key)
+
+        self.key = key
+        self.lookahead = lookahead
+
+        sharps = key.sharps if key is not None else 0
+        self._lowest = sharps - 1
+        self._highest = sharps + 5
+        if key is not None and key.is_minor:
+            self._highest += MINOR_RAISED_FIFTHS
+        self._candidates = _get_candidates(sharps)
+
+        # numbers of the notes that aren't final yet
+        self._numbers = deque()
+        # the cheapest path to each candidate of the latest note, keyed by
+        # its fifths: (cost, fifths of all pending notes)
+        self._paths = {}
+
+    def push(self, number):
+        """
+        Add the next MIDI note number. Returns a list of notes that are
+        final now, which is empty until the lookahead is filled.
+        """
+        paths = {}
+        for fifths in self._candidates[number % 12]:
+            cost = self._key_cost(fifths)
+
+            if self._paths:
+                (previous_cost, path) = min(
+                    ((total + self._interval_cost(previous, fifths), rest)
+                     for (previous, (total, rest)) in self._paths.items()),
+                    key=itemgetter(0))
+                cost += previous_cost
+            else:
+                path = ()
+
+            paths[fifths] = (cost, path + (fifths,))
+
+        self._paths = paths
+        self._numbers.append(number)
+
+        if len(self._numbers) > self.lookahead:
+            return [self._commit()]
+        return []
+
+    def flush(self):
+        """
+        Returns the notes that aren't final yet and starts a new stream
+        """
+        notes = [self._commit() for _ in range(len(self._numbers))]
+        self._paths = {}
+        return notes
+
+    def _commit(self):
+        """
+        Make the spelling of the oldest pending note final. It's taken from
+        the cheapest path, paths that spell it differently are dropped.
+        """
+        (_, path) = min(self._paths.values(), key=itemgetter(0))
+        fifths = path[0]
+
+        self._paths = {
+            latest: (cost, rest[1:])
+            for (latest, (cost, rest)) in self._paths.items()
+            if rest[0] == fifths
+        }
+        return _get_note(fifths, self._numbers.popleft())
+
+    def _key_cost(self, fifths):
+        """Returns the cost of a spelling outside the key"""
+        return KEY_COST * max(0, self._lowest - fifths,
+                              fifths - self._highest)
+
+    def _interval_cost(self, previous, fifths):
+        """
+        Returns the cost of the interval between two spellings, which is
+        free if both are in the key
+        """
+        if self._lowest <= min(previous, fifths) \
+                and max(previous, fifths) <= self._highest:
+            return 0
+        return INTERVAL_COST * max(
+            0, abs(fifths - previous) - LARGEST_PLAIN_INTERVAL)
+
+
+def spell_numbers(numbers, key=None, lookahead=DEFAULT_LOOKAHEAD):
+    """
+    Yields the spelled notes of an iterable of MIDI note numbers. The
+    numbers are consumed lazily, so it works on endless streams.
+    """
+    speller = PitchSpeller(key, lookahead)
+    for number in numbers:
+        for note in speller.push(number):
+            yield note
+    for note in speller.flush():
+        yield note
+
+
+def _get_note(fifths, number):
+    """Returns the shared note with a spelling for a MIDI note number"""
+    # the semitones are 7 per fifth and 12 per octave of the line of fifths
+    steps = 4 * fifths + 7 * ((number - 12 - 7 * fifths) // 12)
+    return Note.from_fifths(fifths, (steps - position_of(fifths)) // 7)
+
+
+def _get_candidates(sharps):
+    """
+    Returns the candidate spellings (as fifths) of all 12 pitch classes.
+    Candidates closest to the middle of the key come first, so they win
+    ties.
+    """
+    lowest = -1 - 7 * MAX_ACCIDENTALS
+    highest = 5 + 7 * MAX_ACCIDENTALS
+    candidates = _CANDIDATES.get(sharps)
+    if candidates is None:
+        candidates = _CANDIDATES.setdefault(sharps, tuple(
+            tuple(sorted(
+                (fifths for fifths in range(lowest, highest + 1)
+                 if 7 * fifths % 12 == pitch_class),
+                key=lambda fifths: abs(2 * (fifths - sharps) - 3)))
+            for pitch_class in range(12)))
+    return candidates
+
+
+# Candidate spellings of all pitch classes keyed by the sharps of the key
+_CANDIDATES = {}
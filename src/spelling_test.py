@@ -0,0 +1,90 @@
+"""Spelling Test"""
+import unittest
+from nose.tools import assert_raises
+
+from .note import Note
+from .keysignature import KeySignature
+from .spelling import PitchSpeller, spell_numbers
+
+
+def _spell(numbers, key=None, lookahead=4):
+    """Returns the names of spelled MIDI note numbers"""
+    return [note.name for note in spell_numbers(numbers, key, lookahead)]
+
+
+class SpellingTest(unittest.TestCase):
+    """Spelling Test"""
+
+    @classmethod
+    def test_key_spellings(cls):
+        """Test if notes are spelled like the key"""
+        assert _spell([62, 64, 66, 67, 69, 71, 73, 74], 'D') \
+            == ['D', 'E', 'F#', 'G', 'A', 'B', 'C#', 'D']
+        assert _spell([68, 70, 72, 73, 75, 77, 79, 80], 'Ab') \
+            == ['Ab', 'Bb', 'C', 'Db', 'Eb', 'F', 'G', 'Ab']
+        assert _spell([61, 63, 65, 66, 68, 70, 72, 73],
+                      KeySignature.of('C#')) \
+            == ['C#', 'D#', 'E#', 'F#', 'G#', 'A#', 'B#', 'C#']
+
+    @classmethod
+    def test_minor_keys(cls):
+        """Test the raised 6th and 7th degree of minor keys"""
+        assert _spell([69, 71, 72, 74, 76, 77, 80, 81], 'a') \
+            == ['A', 'B', 'C', 'D', 'E', 'F', 'G#', 'A']
+        assert _spell([69, 71, 72, 74, 76, 78, 80, 81], 'a') \
+            == ['A', 'B', 'C', 'D', 'E', 'F#', 'G#', 'A']
+
+    @classmethod
+    def test_melodic_context(cls):
+        """Test if augmented and diminished steps are avoided"""
+        # without a key, a run in E major still gets its sharps
+        assert _spell([64, 66, 68, 69, 71, 73, 75, 76]) \
+            == ['E', 'F#', 'G#', 'A', 'B', 'C#', 'D#', 'E']
+
+        # D# after F# is a major 6th, Eb would be a diminished 7th
+        assert _spell([66, 75]) == ['F#', 'D#']
+        assert _spell([75]) == ['Eb']
+
+    @classmethod
+    def test_octaves(cls):
+        """Test if octaves follow the spelling"""
+        notes = list(spell_numbers([61, 63, 65, 66, 68, 70, 72], 'C#'))
+        assert notes[-1].is_same(Note('B#', 4))
+        assert notes[-1].midi_value == 72
+
+        notes = list(spell_numbers([59], 'Gb'))
+        assert notes[0].is_same(Note('Cb', 4))
+        assert notes[0] is Note.of('Cb', 4)
+
+    @classmethod
+    def test_streaming(cls):
+        """Test if notes are final after the lookahead"""
+        speller = PitchSpeller('G', lookahead=2)
+        assert speller.push(67) == []
+        assert speller.push(69) == []
+        assert [note.name for note in speller.push(71)] == ['G']
+        assert [note.name for note in speller.push(72)] == ['A']
+        assert [note.name for note in speller.flush()] == ['B', 'C']
+        assert speller.flush() == []
+
+        # a new stream starts after flushing
+        assert speller.push(66) == []
+
+        speller = PitchSpeller(lookahead=0)
+        assert [note.name for note in speller.push(66)] == ['F#']
+
+    @classmethod
+    def test_lazy(cls):
+        """Test if spell_numbers consumes its input lazily"""
+        def numbers():
+            while True:
+                yield 60
+
+        notes = spell_numbers(numbers(), 'C', lookahead=3)
+        assert [next(notes).name for _ in range(100)] == ['C'] * 100
+
+    @classmethod
+    def test_invalid(cls):
+        """Test invalid lookaheads and keys"""
+        assert_raises(ValueError, PitchSpeller, None, -1)
+        assert_raises(ValueError, PitchSpeller, 'H')
@@ -0,0 +1,209 @@
+"""
+Tuning Module
+
+Frequencies of notes in equal temperament, just intonation and Pythagorean
+tuning.
+
+Equal temperament uses a table of all 128 MIDI notes for each reference
+pitch. Just and Pythagorean tuning are derived from the line of fifths (see
+src.fifths): an interval is a number of fifths plus octaves, so its
+Pythagorean ratio is (3/2)^fifths * 2^octaves. Just intonation lowers it by
+a syntonic comma (81/80) for every four fifths away from the tonic, which
+turns 81/64 into 5/4 for a major 3rd and 32/27 into 6/5 for a minor 3rd.
+The deviation from equal temperament only depends on the fifths between
+the tonic and the note, so it's a second table.
+
+Batch conversion takes lists of notes, chords, NoteSequences or encoded
+notes and converts all of them with array lookups.
+"""
+from fractions import Fraction
+
+import numpy as np
+
+from .note import Note
+from .interval import Interval
+from .sequence import NoteSequence
+from .batch import encode_notes, unpack_notes, midi_values, fifths_values
+
+EQUAL = 'equal'
+JUST = 'just'
+PYTHAGOREAN = 'pythagorean'
+TUNINGS = (EQUAL, JUST, PYTHAGOREAN)
+
+DEFAULT_A4 = 440.0
+DEFAULT_TONIC = 'C'
+
+A4_MIDI_VALUE = 69
+MIDI_NOTES = 128
+
+FIFTH = Fraction(3, 2)
+SYNTONIC_COMMA = Fraction(81, 80)
+
+"""
+Deviations from equal temperament are precomputed for notes up to this many
+fifths from the tonic
+"""
+MAX_TABLE_FIFTHS = 70
+
+
+def equal_table(a4=DEFAULT_A4):
+    """
+    Returns the read only table of equal tempered frequencies of all MIDI
+    notes for a reference pitch. Tables are built once per reference pitch.
+    """
+    table = _EQUAL_TABLES.get(a4)
+    if table is None:
+        table = _equal_frequencies(np.arange(MIDI_NOTES), a4)
+        table.flags.writeable = False
+        table = _EQUAL_TABLES.setdefault(a4, table)
+    return table
+
+
+def interval_ratio(interval, tuning=JUST):
+    """
+    Returns the frequency ratio of an interval (or interval name). Just and
+    Pythagorean ratios are exact fractions, equal tempered ones are floats.
+    """
+    if not isinstance(interval, Interval):
+        interval = Interval.from_string(interval)
+
+    if tuning == EQUAL:
+        return 2 ** (interval.semitones / 12)
+
+    _check_tuning(tuning)
+    octaves = (interval.steps - 4 * interval.fifths) // 7
+    ratio = FIFTH ** interval.fifths * Fraction(2) ** octaves
+    if tuning == JUST:
+        ratio *= SYNTONIC_COMMA ** _commas(interval.fifths)
+    return ratio
+
+
+def frequency(note, tuning=EQUAL, tonic=DEFAULT_TONIC, a4=DEFAULT_A4):
+    """
+    Returns the frequency of a note (or note name) in Hz. Just and
+    Pythagorean notes are tuned from the tonic, which is equal tempered.
+    """
+    note = note if isinstance(note, Note) else Note.of(note)
+    midi_value = note.midi_value
+
+    if 0 <= midi_value < MIDI_NOTES:
+        result = float(equal_table(a4)[midi_value])
+    else:
+        result = float(_equal_frequencies(midi_value, a4))
+
+    if tuning != EQUAL:
+        result *= float(_deviations(
+            note.fifths - _tonic_fifths(tonic), tuning))
+    return result
+
+
+def frequencies(notes, tuning=EQUAL, tonic=DEFAULT_TONIC, a4=DEFAULT_A4):
+    """
+    Returns the frequencies of many notes in Hz as a float array. notes can
+    be a list of notes (or note names), a chord, a NoteSequence or encoded
+    notes of shape (n, 3).
+    """
+    encoded = _encode(notes)
+    midi = midi_values(encoded).astype(np.int64)
+
+    inside = (midi >= 0) & (midi < MIDI_NOTES)
+    result = equal_table(a4)[np.where(inside, midi, 0)]
+    if not np.all(inside):
+        result = np.where(inside, result, _equal_frequencies(midi, a4))
+
+    if tuning != EQUAL:
+        result = result * _deviations(
+            fifths_values(encoded).astype(np.int64) - _tonic_fifths(tonic),
+            tuning)
+    return result
+
+
+def midi_frequencies(numbers, a4=DEFAULT_A4):
+    """Returns the equal tempered frequencies of MIDI note numbers"""
+    numbers = np.asarray(numbers, dtype=np.int64)
+    inside = (numbers >= 0) & (numbers < MIDI_NOTES)
+    if np.all(inside):
+        return equal_table(a4)[numbers]
+    return _equal_frequencies(numbers, a4)
+
+
+def _encode(notes):
+    """Returns notes of any supported kind as encoded notes"""
+    if isinstance(notes, NoteSequence):
+        return unpack_notes(notes.packed)
+    if isinstance(notes, np.ndarray):
+        return notes
+
+    # chords and scales keep their notes in pitches
+    notes = getattr(notes, 'pitches', notes)
+    return encode_notes([note if isinstance(note, Note) else Note.of(note)
+                         for note in notes])
+
+
+def _equal_frequencies(midi_values_, a4):
+    """Calculate equal tempered frequencies of MIDI note numbers"""
+    return a4 * 2.0 ** ((np.asarray(midi_values_, dtype=float)
+                         - A4_MIDI_VALUE) / 12)
+
+
+def _tonic_fifths(tonic):
+    """Returns the fifths of a tonic (or tonic name)"""
+    return (tonic if isinstance(tonic, Note) else Note.of(tonic)).fifths
+
+
+def _check_tuning(tuning):
+    """Raise a ValueError for unknown tunings"""
+    if tuning not in TUNINGS:
+        raise ValueError("Tuning should be one of %s. Got %s" % (
+            TUNINGS, tuning))
+
+
+def _commas(fifths):
+    """
+    Returns the syntonic commas just intonation adds (positive) or removes
+    (negative) for (arrays of) fifths from the tonic
+    """
+    return -np.sign(fifths) * ((np.abs(fifths) + 1) // 4)
+
+
+def _deviations(fifths, tuning):
+    """
+    Returns the ratios between tuned and equal tempered frequencies for
+    (arrays of) fifths from the tonic
+    """
+    _check_tuning(tuning)
+    fifths = np.asarray(fifths, dtype=np.int64)
+    table = _DEVIATIONS[tuning]
+
+    inside = np.abs(fifths) <= MAX_TABLE_FIFTHS
+    if np.all(inside):
+        return table[fifths + MAX_TABLE_FIFTHS]
+    return np.where(inside,
+                    table[np.clip(fifths, -MAX_TABLE_FIFTHS, MAX_TABLE_FIFTHS)
+                          + MAX_TABLE_FIFTHS],
+                    _calc_deviations(fifths, tuning))
+
+
+def _calc_deviations(fifths, tuning):
+    """
+    Calculate the ratios between tuned and equal tempered frequencies.
+    Octaves are pure in all tunings, so only the fifths matter.
+    """
+    fifths = np.asarray(fifths, dtype=float)
+    cents = fifths * (1200 * np.log2(1.5) - 700)
+    if tuning == JUST:
+        cents += _commas(fifths) * 1200 * np.log2(81 / 80)
+    return 2.0 ** (cents / 1200)
+
+
+# Equal tempered frequencies of all MIDI notes keyed by reference pitch
+_EQUAL_TABLES = {}
+
+# Deviations from equal temperament for -MAX_TABLE_FIFTHS to
+# MAX_TABLE_FIFTHS fifths from the tonic, keyed by tuning
+_DEVIATIONS = {
+    tuning: _calc_deviations(
+        np.arange(-MAX_TABLE_FIFTHS, MAX_TABLE_FIFTHS + 1), tuning)
+    for tuning in (JUST, PYTHAGOREAN)
+}
+_DEVIATIONS[EQUAL] = np.ones(2 * MAX_TABLE_FIFTHS + 1)
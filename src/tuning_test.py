@@ -0,0 +1,109 @@
+"""Tuning Test"""
+import unittest
+from fractions import Fraction
+from nose.tools import assert_raises
+import numpy as np
+
+from .music import INTERVALS
+from .note import Note
+from .interval import Interval
+from .chord import Chord
+from .sequence import NoteSequence
+from .batch import encode_notes
+from .tuning import EQUAL, JUST, PYTHAGOREAN, equal_table, interval_ratio, \
+    frequency, frequencies, midi_frequencies
+
+
+class TuningTest(unittest.TestCase):
+    """Tuning Test"""
+
+    @classmethod
+    def test_equal_table(cls):
+        """Test the equal tempered frequencies of MIDI notes"""
+        table = equal_table()
+        assert len(table) == 128
+        assert table[69] == 440.0
+        assert table[81] == 880.0
+        assert round(table[60], 3) == 261.626
+        assert equal_table(432.0)[69] == 432.0
+        assert equal_table() is table
+        assert not table.flags.writeable
+
+    @classmethod
+    def test_interval_ratio(cls):
+        """Test the ratios of intervals"""
+        just = {'P1': (1, 1), 'm2': (16, 15), 'M2': (9, 8), 'm3': (6, 5),
+                'M3': (5, 4), 'P4': (4, 3), 'A4': (45, 32), 'd5': (64, 45),
+                'P5': (3, 2), 'm6': (8, 5), 'M6': (5, 3), 'm7': (16, 9),
+                'M7': (15, 8), 'P8': (2, 1)}
+        for (name, ratio) in just.items():
+            assert interval_ratio(name) == Fraction(*ratio)
+
+        assert interval_ratio('M3', PYTHAGOREAN) == Fraction(81, 64)
+        assert interval_ratio('m3', PYTHAGOREAN) == Fraction(32, 27)
+        assert interval_ratio('M7', PYTHAGOREAN) == Fraction(243, 128)
+        assert interval_ratio(Interval('P', 5), PYTHAGOREAN) == Fraction(3, 2)
+        assert interval_ratio('P8', EQUAL) == 2
+        assert round(interval_ratio('P5', EQUAL), 6) == 1.498307
+
+        assert_raises(ValueError, interval_ratio, 'P5', 'meantone')
+
+    @classmethod
+    def test_frequency(cls):
+        """Test the frequencies of single notes"""
+        assert frequency('A4') == 440.0
+        assert frequency(Note('A', 5)) == 880.0
+        assert frequency('A4', a4=415.0) == 415.0
+        assert round(frequency('C4'), 3) == 261.626
+        assert frequency('C#4') == frequency('Db4')
+        assert frequency('C#4', JUST) != frequency('Db4', JUST)
+
+        # outside the MIDI range
+        assert frequency(Note('A', 9)) == 440.0 * 2 ** 5
+        assert frequency(Note('C', -1)) == equal_table()[0]
+
+        # the tonic stays equal tempered
+        assert frequency('A4', JUST, tonic='A') == 440.0
+        assert round(frequency('E5', JUST, tonic='A'), 9) == 660.0
+        assert round(frequency('C#5', PYTHAGOREAN, tonic='A'), 9) \
+            == round(440.0 * 81 / 64, 9)
+
+    @classmethod
+    def test_frequencies_match_ratios(cls):
+        """Test if tuned intervals above a tonic have their ratios"""
+        for tuning in (JUST, PYTHAGOREAN):
+            for tonic in ('C', 'F#', 'Bb'):
+                root = Note.of(tonic, 3)
+                for name in INTERVALS:
+                    interval = Interval.from_string(name)
+                    ratio = frequency(root + interval, tuning, tonic) \
+                        / frequency(root, tuning, tonic)
+                    assert abs(ratio - float(interval_ratio(
+                        interval, tuning))) < 1e-9
+
+    @classmethod
+    def test_frequencies(cls):
+        """Test batch conversion of lists, chords and sequences"""
+        notes = [Note.of(name) for name in ('C4', 'E4', 'G4', 'Bb4', 'F#5',
+                                            'Ebb4')]
+        notes += [Note('Cbb', -1), Note('B#', 9)]
+
+        for tuning in (EQUAL, JUST, PYTHAGOREAN):
+            expected = [frequency(note, tuning, 'D', 432.0) for note in notes]
+            for kind in (list, NoteSequence, encode_notes):
+                result = frequencies(kind(notes), tuning, 'D', 432.0)
+                assert np.allclose(result, expected)
+
+        chord = Chord('A', 'minor')
+        assert np.allclose(frequencies(chord, JUST, 'A'),
+                           [440.0, 528.0, 660.0])
+        assert frequencies(['A4', 'A5']).tolist() == [440.0, 880.0]
+        assert len(frequencies([])) == 0
+
+    @classmethod
+    def test_midi_frequencies(cls):
+        """Test the frequencies of MIDI note numbers"""
+        assert midi_frequencies([69, 81]).tolist() == [440.0, 880.0]
+        assert midi_frequencies([129])[0] == 440.0 * 2 ** 5
+        assert np.allclose(midi_frequencies(np.arange(128), 415.0),
+                           equal_table(415.0))